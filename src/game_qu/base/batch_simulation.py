@@ -0,0 +1,105 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from game_qu.base.frame_profiler import TimingsRingBuffer
+from game_qu.base.library_changer import LibraryChanger
+
+
+def run_simulations(screen_factory, seeds, number_of_cycles, delta_time=1 / 60, parameters_list=None,
+                    is_game_over_function=None, get_metrics_function=None, max_workers=None):
+    """ Runs one game for every seed across a pool of processes (the processes are reused for many games). Every game runs
+        in its own World with the 'null' game library. 'screen_factory' and the other functions are sent to the processes,
+        so they must be defined at the top level of a module
+
+        Args:
+            screen_factory (function): screen_factory(seed, parameters) -> Screen; creates the screen of a game
+            seeds (list[int]): the random seed of each game (one game is run per seed)
+            number_of_cycles (int): the maximum number of cycles each game runs for
+            delta_time (float): how long each cycle lasts
+            parameters_list (list[object]): the parameters passed into 'screen_factory' for each seed (like Player tuning
+                values); None means the parameters are None for every game
+            is_game_over_function (function): is_game_over_function(screen) -> bool; the game stops early once it is True
+            get_metrics_function (function): get_metrics_function(screen) -> dict; additional metrics of a finished game
+            max_workers (int): the number of processes (None means one per core)
+
+        Returns:
+            generator[dict]: the results of each game as soon as the game finishes (see run_simulation())
+    """
+
+    if parameters_list is None:
+        parameters_list = [None] * len(seeds)
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_initialize_process) as executor:
+        futures = [executor.submit(run_simulation, screen_factory, seeds[x], parameters_list[x], number_of_cycles,
+                                   delta_time, is_game_over_function, get_metrics_function)
+                   for x in range(len(seeds))]
+
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_simulation(screen_factory, seed, parameters, number_of_cycles, delta_time=1 / 60, is_game_over_function=None,
+                   get_metrics_function=None):
+    """ Runs one game in its own World (see run_simulations() for what the parameters are)
+
+        Returns:
+            dict: {'seed', 'parameters', 'score', 'cycles_survived', 'cycle_time_statistics', 'total_time', 'metrics'};
+            'score' is the screen's high score or player score (None if it has neither) and 'cycle_time_statistics' are
+            the min, avg, p95, p99, and max time it took to run one cycle
+    """
+
+    _initialize_process()
+
+    # Importing here, so the processes have the 'null' game library set before the game engine is imported
+    from game_qu.base.world import World
+
+    world = World(seed)
+
+    with world:
+        screen = screen_factory(seed, parameters)
+
+    world.add_screen(screen)
+    cycle_times = TimingsRingBuffer(max(number_of_cycles, 1))
+    cycles_survived = 0
+    start_time = time.perf_counter()
+
+    for x in range(number_of_cycles):
+        cycle_start_time = time.perf_counter()
+        world.run_cycle(delta_time)
+        cycle_times.add(time.perf_counter() - cycle_start_time)
+        cycles_survived += 1
+
+        if is_game_over_function is not None and is_game_over_function(screen):
+            break
+
+    return {
+        "seed": seed,
+        "parameters": parameters,
+        "score": get_score(screen),
+        "cycles_survived": cycles_survived,
+        "cycle_time_statistics": cycle_times.get_statistics(),
+        "total_time": time.perf_counter() - start_time,
+        "metrics": get_metrics_function(screen) if get_metrics_function is not None else {}
+    }
+
+
+def get_score(screen):
+    """
+         Returns:
+            float: the high score of the screen if it has one, otherwise the player score (None if it has neither)"""
+
+    player_score = getattr(screen, "player_score", None)
+    high_score = getattr(screen, "high_score", None)
+
+    if high_score is not None and player_score is not None:
+        return max(high_score, player_score)
+
+    return high_score if high_score is not None else player_score
+
+
+def _initialize_process():
+    """ Sets the game library to 'null', so the process never opens a window (even if it was forked from a process that
+        uses another game library)"""
+
+    if LibraryChanger.current_library_name != "null":
+        LibraryChanger.set_game_library("null")
@@ -0,0 +1,88 @@
+class CollisionLayers:
+    """ A registry of collision layers: every object is on a layer (a small integer) and each layer has a mask of the
+        layers it can collide with. The pair matrix is precomputed from the masks, so impossible pairs (like a platform and
+        another platform) are rejected before any of their dimensions are looked at. By default an object's layer comes from
+        its 'object_type' and objects on different layers can collide while objects on the same layer can not"""
+
+    MAX_NUMBER_OF_LAYERS = 64
+
+    layer_names_to_layers = {}
+    masks = []  # masks[layer] has bit 'other_layer' set if 'layer' can collide with 'other_layer'
+    pair_matrix = []  # pair_matrix[layer1][layer2] is whether 'layer1' and 'layer2' can collide (always the same list)
+
+    @staticmethod
+    def get_layer(layer_name):
+        """
+             Returns:
+                int: the layer with the name 'layer_name' (it is added if it does not exist; it can collide with every other
+                layer, but not itself)"""
+
+        layer = CollisionLayers.layer_names_to_layers.get(layer_name)
+
+        if layer is not None:
+            return layer
+
+        layer = len(CollisionLayers.masks)
+
+        if layer >= CollisionLayers.MAX_NUMBER_OF_LAYERS:
+            raise ValueError(f"There can not be more than {CollisionLayers.MAX_NUMBER_OF_LAYERS} collision layers")
+
+        CollisionLayers.layer_names_to_layers[layer_name] = layer
+
+        for other_layer in range(layer):
+            CollisionLayers.masks[other_layer] |= 1 << layer
+
+        CollisionLayers.masks.append((1 << layer) - 1)
+        CollisionLayers._update_pair_matrix()
+        return layer
+
+    @staticmethod
+    def set_can_collide(layer_name1, layer_name2, can_collide):
+        """Sets whether objects on the layers 'layer_name1' and 'layer_name2' can collide (both masks are updated)"""
+
+        layer1, layer2 = CollisionLayers.get_layer(layer_name1), CollisionLayers.get_layer(layer_name2)
+
+        if can_collide:
+            CollisionLayers.masks[layer1] |= 1 << layer2
+            CollisionLayers.masks[layer2] |= 1 << layer1
+
+        else:
+            CollisionLayers.masks[layer1] &= ~(1 << layer2)
+            CollisionLayers.masks[layer2] &= ~(1 << layer1)
+
+        CollisionLayers._update_pair_matrix()
+
+    @staticmethod
+    def get_mask(layer_name):
+        """
+             Returns:
+                int: the mask of the layer 'layer_name' (bit 'layer' is set if it can collide with 'layer')"""
+
+        return CollisionLayers.masks[CollisionLayers.get_layer(layer_name)]
+
+    @staticmethod
+    def can_collide(layer1, layer2):
+        """
+             Returns:
+                bool: whether objects on 'layer1' and 'layer2' can collide"""
+
+        return CollisionLayers.pair_matrix[layer1][layer2]
+
+    @staticmethod
+    def get_object_layer(game_object):
+        """
+             Returns:
+                int: the layer of 'game_object'; its 'collision_layer' if it has one, otherwise the layer named after its
+                'object_type'"""
+
+        layer = getattr(game_object, "collision_layer", None)
+        return layer if layer is not None else CollisionLayers.get_layer(game_object.object_type)
+
+    @staticmethod
+    def _update_pair_matrix():
+        """Updates the pair matrix, so it matches the masks (the list is modified, so references to it stay up to date)"""
+
+        masks = CollisionLayers.masks
+
+        CollisionLayers.pair_matrix[:] = [[bool(masks[layer1] & (1 << layer2)) and bool(masks[layer2] & (1 << layer1))
+                                           for layer2 in range(len(masks))] for layer1 in range(len(masks))]
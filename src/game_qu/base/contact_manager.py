@@ -0,0 +1,112 @@
+from game_qu.base.engines import CollisionsEngine
+
+
+class ContactManager:
+    """ Keeps the pairs of objects that are touching across cycles and calls their collision callbacks: on_collision_enter()
+        the cycle they start touching, on_collision_stay() every cycle after that, and on_collision_exit() the cycle they
+        stop touching (an object does not have to have the callbacks). Whether a contact started, stayed, or ended is found
+        by comparing the pairs that are touching with last cycle's. A contact keeps its CollisionData across cycles, so a
+        resting contact (like a player standing on a platform) reuses it as long as its geometry does not change"""
+
+    contacts = {}  # (object1_id, object2_id) -> [object1, object2, geometry, collision_data]
+    previous_contacts = {}
+
+    def __init__(self):
+        """Initializes the object"""
+
+        self.contacts = {}
+        self.previous_contacts = {}
+
+    @staticmethod
+    def get_pair_id(object1, object2):
+        """
+             Returns:
+                tuple[int]: the id of the pair of objects (the same no matter which object is first)"""
+
+        object1_id, object2_id = id(object1), id(object2)
+        return (object1_id, object2_id) if object1_id < object2_id else (object2_id, object1_id)
+
+    @staticmethod
+    def get_geometry(object1, object2):
+        """
+             Returns:
+                tuple[object]: everything CollisionsEngine.get_collision_data() uses for the pair: the edges of both objects
+                this cycle and last cycle (None if either object is not in the HistoryKeeper). The edges from last cycle
+                come from the cache of CollisionsEngine.get_previous_edges(), so this is cheaper than the CollisionData"""
+
+        prev_edges1 = CollisionsEngine.get_previous_edges(object1)
+        prev_edges2 = CollisionsEngine.get_previous_edges(object2)
+
+        if prev_edges1 is None or prev_edges2 is None:
+            return None
+
+        return (object1.left_edge, object1.top_edge, object1.length, object1.height,
+                object2.left_edge, object2.top_edge, object2.length, object2.height, prev_edges1, prev_edges2)
+
+    def update(self, colliding_pairs):
+        """ Updates the contacts to be 'colliding_pairs' (list of [object1, object2]) and calls the collision callbacks of
+            the objects that started touching, kept touching, and stopped touching"""
+
+        self.previous_contacts, self.contacts = self.contacts, {}
+
+        for object1, object2 in colliding_pairs:
+            pair_id = ContactManager.get_pair_id(object1, object2)
+
+            if pair_id in self.contacts:
+                continue
+
+            # The pairs that are touching this cycle and were touching last cycle stayed touching (they keep their contact,
+            # so its CollisionData can be reused)
+            previous_contact = self.previous_contacts.get(pair_id)
+            self.contacts[pair_id] = previous_contact if previous_contact is not None else [object1, object2, None, None]
+
+            callback_name = "on_collision_stay" if previous_contact is not None else "on_collision_enter"
+            ContactManager.call_callback(object1, callback_name, object2)
+            ContactManager.call_callback(object2, callback_name, object1)
+
+        for pair_id, (object1, object2, geometry, collision_data) in self.previous_contacts.items():
+            if pair_id not in self.contacts:
+                ContactManager.call_callback(object1, "on_collision_exit", object2)
+                ContactManager.call_callback(object2, "on_collision_exit", object1)
+
+    def get_collision_data(self, object1, object2):
+        """
+             Returns:
+                CollisionData: how object1 collided with object2 (by the perspective of object1); the contact's CollisionData
+                is reused if the geometry of the pair did not change since it was figured out (see get_geometry()). It is
+                figured out if the objects are not a contact or the contact is from the other object's perspective"""
+
+        contact = self.contacts.get(ContactManager.get_pair_id(object1, object2))
+
+        if contact is None or contact[0] is not object1:
+            return CollisionsEngine.get_collision_data(object1, object2, True)
+
+        geometry = ContactManager.get_geometry(object1, object2)
+
+        # The objects are touching, so it is a collision (this matches what the game objects pass into CollisionsEngine)
+        if contact[3] is None or geometry is None or geometry != contact[2]:
+            contact[2], contact[3] = geometry, CollisionsEngine.get_collision_data(object1, object2, True)
+
+        return contact[3]
+
+    def is_touching(self, object1, object2):
+        """
+             Returns:
+                bool: whether object1 and object2 are a contact (they touched when update() was last called)"""
+
+        return ContactManager.get_pair_id(object1, object2) in self.contacts
+
+    def clear(self):
+        """Removes all the contacts (on_collision_exit() is not called)"""
+
+        self.contacts = {}
+        self.previous_contacts = {}
+
+    @staticmethod
+    def call_callback(game_object, callback_name, other_object):
+        """Calls game_object's callback (like on_collision_enter()) with 'other_object' if game_object has that callback"""
+
+        callback = getattr(game_object, callback_name, None)
+
+        if callback is not None:
+            callback(other_object)
@@ -1,9 +1,68 @@
 from game_qu.base.history_keeper import HistoryKeeper
+from game_qu.base.library_independant_utility_functions import import_numpy
+from game_qu.base.velocity_calculator import VelocityCalculator
+
+
+class CollisionData:
+    """ Everything about how two objects have collided (by the perspective of object1). The normal is the direction
+        object1 would have to move to stop overlapping object2 and the penetration depth is how far it would have to move"""
+
+    is_collision = False
+    is_left_collision = False
+    is_right_collision = False
+    is_top_collision = False
+    is_bottom_collision = False
+    penetration_depth = 0
+    normal = [0, 0]
+
+    def __init__(self, is_collision, is_left_collision, is_right_collision, is_top_collision, is_bottom_collision,
+                 penetration_depth, normal):
+        """Initializes the object"""
+
+        self.is_collision = is_collision
+        self.is_left_collision, self.is_right_collision = is_left_collision, is_right_collision
+        self.is_top_collision, self.is_bottom_collision = is_top_collision, is_bottom_collision
+        self.penetration_depth, self.normal = penetration_depth, normal
 
 
 class CollisionsEngine:
     """Provides methods for figuring out if objects have collided"""
 
+    broad_phase_names = ["spatial_hash", "sweep_and_prune"]
+
+    # The previous cycle's dimensions and edges of objects, so the HistoryKeeper is only read once per object per cycle
+    previous_dimensions = {}
+    previous_edges = {}
+    previous_dimensions_last_objects = None
+    previous_dimensions_cycle_number = None
+
+    @staticmethod
+    def create_broad_phase(broad_phase_name, **arguments):
+        """ Creates a broad phase: an object that finds the pairs of objects that could have collided, so not every pair
+            has to be checked. Every broad phase has update_all(game_objects), get_candidate_pairs(), remove(game_object),
+            and clear()
+
+            Args:
+                broad_phase_name (str): 'spatial_hash' (a uniform grid; good for objects spread out in both directions) or
+                    'sweep_and_prune' (sorted edges on the x axis; good for side scrollers and it reports when pairs start,
+                    keep, and stop overlapping)
+                arguments (dict): the arguments passed into the broad phase's constructor (like cell_size for 'spatial_hash')
+
+            Returns:
+                object: the broad phase (SpatialHash or SweepAndPrune)
+        """
+
+        # Importing here because SweepAndPrune uses the CollisionsEngine
+        from game_qu.base.spatial_hash import SpatialHash
+        from game_qu.base.sweep_and_prune import SweepAndPrune
+
+        broad_phase_names_to_classes = {"spatial_hash": SpatialHash, "sweep_and_prune": SweepAndPrune}
+
+        if broad_phase_name not in broad_phase_names_to_classes:
+            raise ValueError(f"The broad phase must be one of {CollisionsEngine.broad_phase_names}, not '{broad_phase_name}'")
+
+        return broad_phase_names_to_classes[broad_phase_name](**arguments)
+
     @staticmethod
     def is_horizontal_collision(object1, object2):
         """
@@ -28,6 +87,279 @@ class CollisionsEngine:
 
         return CollisionsEngine.is_horizontal_collision(object1, object2) and CollisionsEngine.is_vertical_collision(object1, object2)
 
+    # Batch collisions: these need NumPy (an optional dependency that is only imported once they are used). The
+    # 'dimensions' are array-likes with one row of [left_edge, top_edge, length, height] per object (see
+    # get_dimensions_array()); if 'dimensions2' is None then 'dimensions1' is checked against itself
+    @staticmethod
+    def get_dimensions_array(game_objects):
+        """
+             Returns:
+                numpy.ndarray: a (number of objects, 4) array with a row of [left_edge, top_edge, length, height] for
+                each object in 'game_objects'"""
+
+        numpy = CollisionsEngine._import_numpy()
+        dimensions = [[game_object.left_edge, game_object.top_edge, game_object.length, game_object.height]
+                      for game_object in game_objects]
+
+        return numpy.array(dimensions, dtype=float).reshape(-1, 4)
+
+    @staticmethod
+    def get_batch_horizontal_collisions(dimensions1, dimensions2=None):
+        """
+             Returns:
+                numpy.ndarray: a boolean matrix where [i, j] is whether object i of 'dimensions1' and object j of
+                'dimensions2' have collided horizontally (the same as is_horizontal_collision())"""
+
+        left_edges1, top_edges1, right_edges1, bottom_edges1 = CollisionsEngine._get_edges(dimensions1)
+        left_edges2, top_edges2, right_edges2, bottom_edges2 = CollisionsEngine._get_edges(dimensions2 if dimensions2 is not None else dimensions1)
+
+        return (left_edges1[:, None] <= right_edges2[None, :]) & (right_edges1[:, None] >= left_edges2[None, :])
+
+    @staticmethod
+    def get_batch_vertical_collisions(dimensions1, dimensions2=None):
+        """
+             Returns:
+                numpy.ndarray: a boolean matrix where [i, j] is whether object i of 'dimensions1' and object j of
+                'dimensions2' have collided vertically (the same as is_vertical_collision())"""
+
+        left_edges1, top_edges1, right_edges1, bottom_edges1 = CollisionsEngine._get_edges(dimensions1)
+        left_edges2, top_edges2, right_edges2, bottom_edges2 = CollisionsEngine._get_edges(dimensions2 if dimensions2 is not None else dimensions1)
+
+        return (top_edges1[:, None] <= bottom_edges2[None, :]) & (bottom_edges1[:, None] >= top_edges2[None, :])
+
+    @staticmethod
+    def get_batch_collisions(dimensions1, dimensions2=None):
+        """
+             Returns:
+                numpy.ndarray: a boolean matrix where [i, j] is whether object i of 'dimensions1' and object j of
+                'dimensions2' have collided (the same as is_collision()); if 'dimensions2' is None the diagonal is True
+                because every object collides with itself"""
+
+        return (CollisionsEngine.get_batch_horizontal_collisions(dimensions1, dimensions2) &
+                CollisionsEngine.get_batch_vertical_collisions(dimensions1, dimensions2))
+
+    @staticmethod
+    def get_batch_collision_pairs(dimensions1, dimensions2=None):
+        """
+             Returns:
+                numpy.ndarray: a (number of collisions, 2) array with a row of [i, j] for every object i of 'dimensions1'
+                that collided with object j of 'dimensions2'; if 'dimensions2' is None every pair is only given once
+                (i < j) and objects are not paired with themselves"""
+
+        numpy = CollisionsEngine._import_numpy()
+        collisions = CollisionsEngine.get_batch_collisions(dimensions1, dimensions2)
+
+        if dimensions2 is None:
+            collisions = numpy.triu(collisions, k=1)
+
+        return numpy.argwhere(collisions)
+
+    @staticmethod
+    def _get_edges(dimensions):
+        """
+             Returns:
+                list[numpy.ndarray]: [left_edges, top_edges, right_edges, bottom_edges] of the objects in 'dimensions'"""
+
+        numpy = CollisionsEngine._import_numpy()
+        dimensions = numpy.asarray(dimensions, dtype=float).reshape(-1, 4)
+        left_edges, top_edges = dimensions[:, 0], dimensions[:, 1]
+
+        return [left_edges, top_edges, left_edges + dimensions[:, 2], top_edges + dimensions[:, 3]]
+
+    @staticmethod
+    def _import_numpy():
+        """
+             Returns:
+                module: numpy (an ImportError saying it is needed for batch collisions is raised if it is not installed)"""
+
+        return import_numpy("The batch collision methods of CollisionsEngine")
+
+    @staticmethod
+    def get_previous_dimensions(game_object):
+        """
+             Returns:
+                object: the version of the object from the last cycle (the same as HistoryKeeper.get_last(game_object.name)),
+                but it is only retrieved from the HistoryKeeper once per cycle"""
+
+        CollisionsEngine.update_previous_dimensions_cache()
+        name = game_object.name
+
+        if name not in CollisionsEngine.previous_dimensions:
+            CollisionsEngine.previous_dimensions[name] = HistoryKeeper.get_last(name)
+
+        return CollisionsEngine.previous_dimensions[name]
+
+    @staticmethod
+    def get_previous_edges(game_object):
+        """
+             Returns:
+                tuple[float]: (left_edge, top_edge, right_edge, bottom_edge) of the object from the last cycle (the same as
+                HistoryKeeper.get_last_edges(game_object.name)), but it is only retrieved from the HistoryKeeper once per
+                cycle. None if the object is not in the HistoryKeeper"""
+
+        CollisionsEngine.update_previous_dimensions_cache()
+        name = game_object.name
+
+        if name not in CollisionsEngine.previous_edges:
+            CollisionsEngine.previous_edges[name] = HistoryKeeper.get_last_edges(name)
+
+        return CollisionsEngine.previous_edges[name]
+
+    @staticmethod
+    def update_previous_dimensions_cache():
+        """Empties the caches of get_previous_dimensions() and get_previous_edges() if they are out of date"""
+
+        # The cache is out of date if the cycle changed or the HistoryKeeper was swapped by a World (the cycle number is
+        # used because the frame id repeats; the HistoryKeeper clears the cache itself when it removes values)
+        if (CollisionsEngine.previous_dimensions_cycle_number != VelocityCalculator.current_cycle_number
+                or CollisionsEngine.previous_dimensions_last_objects is not HistoryKeeper.last_objects):
+            CollisionsEngine.previous_dimensions = {}
+            CollisionsEngine.previous_edges = {}
+            CollisionsEngine.previous_dimensions_cycle_number = VelocityCalculator.current_cycle_number
+            CollisionsEngine.previous_dimensions_last_objects = HistoryKeeper.last_objects
+
+    @staticmethod
+    def clear_previous_dimensions():
+        """Empties the caches of get_previous_dimensions() and get_previous_edges() (called when the HistoryKeeper removes values)"""
+
+        CollisionsEngine.previous_dimensions = {}
+        CollisionsEngine.previous_edges = {}
+        CollisionsEngine.previous_dimensions_cycle_number = None
+
+    @staticmethod
+    def get_collision_data(object1, object2, is_collision=None):
+        """ Figures out every way object1 and object2 have collided in one pass; the directional collisions are the same as
+            is_left_collision(), is_right_collision(), is_top_collision(), and is_bottom_collision()
+
+            Returns:
+                CollisionData: how object1 has collided with object2 (by the perspective of object1)"""
+
+        left_edge1, top_edge1, right_edge1, bottom_edge1 = object1.left_edge, object1.top_edge, object1.right_edge, object1.bottom_edge
+        left_edge2, top_edge2, right_edge2, bottom_edge2 = object2.left_edge, object2.top_edge, object2.right_edge, object2.bottom_edge
+
+        is_horizontal_collision = left_edge1 <= right_edge2 and right_edge1 >= left_edge2
+        is_vertical_collision = top_edge1 <= bottom_edge2 and bottom_edge1 >= top_edge2
+
+        if is_collision is None:
+            is_collision = is_horizontal_collision and is_vertical_collision
+
+        prev_edges1 = CollisionsEngine.get_previous_edges(object1)
+        prev_edges2 = CollisionsEngine.get_previous_edges(object2)
+        has_previous_dimensions = prev_edges1 is not None and prev_edges2 is not None
+
+        is_left_collision = right_edge1 == left_edge2 and is_vertical_collision
+        is_right_collision = left_edge1 == right_edge2 and is_vertical_collision
+        is_top_collision, is_bottom_collision = False, False
+
+        if has_previous_dimensions:
+            prev_left_edge1, prev_top_edge1, prev_right_edge1, prev_bottom_edge1 = prev_edges1
+            prev_left_edge2, prev_top_edge2, prev_right_edge2, prev_bottom_edge2 = prev_edges2
+
+            is_left_collision = is_left_collision or (is_collision and prev_right_edge1 < prev_left_edge2 and right_edge1 > left_edge2)
+            is_right_collision = is_right_collision or (is_collision and prev_left_edge1 > prev_right_edge2 and left_edge1 < right_edge2)
+
+            # So rounding doesn't cause any issues
+            is_top_collision = ((is_collision and prev_bottom_edge1 < prev_top_edge2 and bottom_edge1 > top_edge2)
+                                or (int(bottom_edge1) == int(top_edge2) and is_horizontal_collision))
+            is_bottom_collision = ((is_collision and prev_top_edge1 > prev_bottom_edge2 and top_edge1 < bottom_edge2)
+                                   or (top_edge1 == bottom_edge2 and is_horizontal_collision))
+
+        penetration_depth, normal = 0, [0, 0]
+
+        if is_horizontal_collision and is_vertical_collision:
+            horizontal_overlap = min(right_edge1, right_edge2) - max(left_edge1, left_edge2)
+            vertical_overlap = min(bottom_edge1, bottom_edge2) - max(top_edge1, top_edge2)
+
+            # The objects are separated along the axis they overlap the least on
+            if horizontal_overlap < vertical_overlap:
+                penetration_depth = horizontal_overlap
+                normal = [-1, 0] if left_edge1 + right_edge1 < left_edge2 + right_edge2 else [1, 0]
+
+            else:
+                penetration_depth = vertical_overlap
+                normal = [0, -1] if top_edge1 + bottom_edge1 < top_edge2 + bottom_edge2 else [0, 1]
+
+        return CollisionData(is_collision, is_left_collision, is_right_collision, is_top_collision, is_bottom_collision,
+                             penetration_depth, normal)
+
+    @staticmethod
+    def get_time_of_impact(prev_object1, object1, prev_object2, object2):
+        """ Sweeps the boxes from where they were last cycle to where they are now (continuous collision detection), so
+            objects that moved so fast they went through each other within one cycle still collide
+
+            Args:
+                prev_object1 (object): object1 last cycle (anything with left_edge, top_edge, right_edge, and bottom_edge)
+                object1 (object): object1 now
+                prev_object2 (object): object2 last cycle
+                object2 (object): object2 now
+
+            Returns:
+                list[object]: [time_of_impact, face]; time_of_impact is how far through the cycle object1 hit object2
+                (0 is the start and 1 is the end) and face is the edge of object2 that was hit ('left', 'right', 'top',
+                or 'bottom'). None if they did not hit or were already overlapping at the start of the cycle
+        """
+
+        # The sweep is done from object2's perspective, so only object1 moves
+        horizontal_movement = (object1.left_edge - prev_object1.left_edge) - (object2.left_edge - prev_object2.left_edge)
+        vertical_movement = (object1.top_edge - prev_object1.top_edge) - (object2.top_edge - prev_object2.top_edge)
+
+        horizontal_times = CollisionsEngine._get_entry_and_exit_times(prev_object1.left_edge, prev_object1.right_edge,
+                                                                      prev_object2.left_edge, prev_object2.right_edge,
+                                                                      horizontal_movement)
+        vertical_times = CollisionsEngine._get_entry_and_exit_times(prev_object1.top_edge, prev_object1.bottom_edge,
+                                                                    prev_object2.top_edge, prev_object2.bottom_edge,
+                                                                    vertical_movement)
+
+        if horizontal_times is None or vertical_times is None:
+            return None
+
+        horizontal_entry_time, horizontal_exit_time = horizontal_times
+        vertical_entry_time, vertical_exit_time = vertical_times
+        entry_time = max(horizontal_entry_time, vertical_entry_time)
+        exit_time = min(horizontal_exit_time, vertical_exit_time)
+
+        if entry_time > exit_time or entry_time > 1 or entry_time < 0:
+            return None
+
+        if horizontal_entry_time > vertical_entry_time:
+            face = "left" if horizontal_movement > 0 else "right"
+
+        else:
+            face = "top" if vertical_movement > 0 else "bottom"
+
+        return [entry_time, face]
+
+    @staticmethod
+    def _get_entry_and_exit_times(start_edge1, end_edge1, start_edge2, end_edge2, movement):
+        """
+             Returns:
+                list[float]: [entry_time, exit_time]; when the moving range [start_edge1, end_edge1] starts and stops
+                overlapping [start_edge2, end_edge2] along one axis (None if it never overlaps)"""
+
+        if movement == 0:
+            is_overlapping = start_edge1 <= end_edge2 and end_edge1 >= start_edge2
+            return [-float("inf"), float("inf")] if is_overlapping else None
+
+        if movement > 0:
+            return [(start_edge2 - end_edge1) / movement, (end_edge2 - start_edge1) / movement]
+
+        return [(end_edge2 - start_edge1) / movement, (start_edge2 - end_edge1) / movement]
+
+    @staticmethod
+    def get_swept_collision(object1, object2):
+        """
+             Returns:
+                list[object]: [time_of_impact, face]; see get_time_of_impact() (the positions from last cycle come from
+                the HistoryKeeper). None if they did not hit or either object is not in the HistoryKeeper"""
+
+        prev_object1 = CollisionsEngine.get_previous_dimensions(object1)
+        prev_object2 = CollisionsEngine.get_previous_dimensions(object2)
+
+        if prev_object1 is None or prev_object2 is None:
+            return None
+
+        return CollisionsEngine.get_time_of_impact(prev_object1, object1, prev_object2, object2)
+
     @staticmethod
     def is_left_collision(object1, object2, is_collision=None, last_time=None):
         """
@@ -61,15 +393,17 @@ class CollisionsEngine:
                 bool: if object1 has collided with object2's right_edge because one of the objects has moved
                 (the object1 did not collide with object2 horizontally last cycle)"""
 
-        prev_object1 = HistoryKeeper.get_last(object1.name)
-        prev_object2 = HistoryKeeper.get_last(object2.name)
+        prev_edges1 = CollisionsEngine.get_previous_edges(object1)
+        prev_edges2 = CollisionsEngine.get_previous_edges(object2)
 
-        if prev_object1 is None or prev_object2 is None:
+        if prev_edges1 is None or prev_edges2 is None:
             return False
 
+        prev_left_edge1, prev_right_edge2 = prev_edges1[0], prev_edges2[2]
+
         is_collision = is_collision if is_collision is not None else CollisionsEngine.is_collision(object1, object2)
         object1_has_moved_into_object2 = (
-            prev_object1.left_edge > prev_object2.right_edge and object1.left_edge < object2.right_edge)
+            prev_left_edge1 > prev_right_edge2 and object1.left_edge < object2.right_edge)
 
         return is_collision and object1_has_moved_into_object2
 
@@ -80,15 +414,17 @@ class CollisionsEngine:
                 bool: if object1 has hit object2's left_edge because one of the objects has moved
                 (the object1 did not collide with object2 horizontally last cycle)"""
 
-        prev_object1 = HistoryKeeper.get_last(object1.name)
-        prev_object2 = HistoryKeeper.get_last(object2.name)
+        prev_edges1 = CollisionsEngine.get_previous_edges(object1)
+        prev_edges2 = CollisionsEngine.get_previous_edges(object2)
 
-        if prev_object1 is None or prev_object2 is None:
+        if prev_edges1 is None or prev_edges2 is None:
             return False
 
+        prev_right_edge1, prev_left_edge2 = prev_edges1[2], prev_edges2[0]
+
         is_collision = is_collision if is_collision is not None else CollisionsEngine.is_collision(object1, object2)
 
-        object1_has_moved_into_object2 = prev_object1.right_edge < prev_object2.left_edge and object1.right_edge > object2.left_edge
+        object1_has_moved_into_object2 = prev_right_edge1 < prev_left_edge2 and object1.right_edge > object2.left_edge
         return is_collision and object1_has_moved_into_object2
 
     @staticmethod
@@ -97,19 +433,21 @@ class CollisionsEngine:
              Returns:
                 bool: whether object1 has collided with object2's bottom_edge"""
 
-        prev_object1 = HistoryKeeper.get_last(object1.name)
-        prev_object2 = HistoryKeeper.get_last(object2.name)
+        prev_edges1 = CollisionsEngine.get_previous_edges(object1)
+        prev_edges2 = CollisionsEngine.get_previous_edges(object2)
 
-        if prev_object1 is None or prev_object2 is None:
+        if prev_edges1 is None or prev_edges2 is None:
             return False
 
+        prev_top_edge1, prev_bottom_edge2 = prev_edges1[1], prev_edges2[3]
+
         objects_are_touching = object1.top_edge == object2.bottom_edge and CollisionsEngine.is_horizontal_collision(
             object1,
             object2)
         is_collision = is_collision if is_collision is not None else CollisionsEngine.is_collision(object1, object2)
 
         # Meaning that it isn't the bottom object anymore
-        return (is_collision and prev_object1.top_edge > prev_object2.bottom_edge and
+        return (is_collision and prev_top_edge1 > prev_bottom_edge2 and
             object1.top_edge < object2.bottom_edge) or objects_are_touching
 
     @staticmethod
@@ -118,16 +456,18 @@ class CollisionsEngine:
              Returns:
                 bool: whether object1 has collided with object2's top_edge"""
 
-        prev_object1 = HistoryKeeper.get_last(object1.name)
-        prev_object2 = HistoryKeeper.get_last(object2.name)
+        prev_edges1 = CollisionsEngine.get_previous_edges(object1)
+        prev_edges2 = CollisionsEngine.get_previous_edges(object2)
 
-        if prev_object1 is None or prev_object2 is None:
+        if prev_edges1 is None or prev_edges2 is None:
             return False
 
+        prev_bottom_edge1, prev_top_edge2 = prev_edges1[3], prev_edges2[1]
+
         # So rounding doesn't cause any issues
         objects_are_touching = int(object1.bottom_edge) == int(object2.top_edge) and CollisionsEngine.is_horizontal_collision(object1, object2)
         is_collision = is_collision if is_collision is not None else CollisionsEngine.is_collision(object1, object2)
 
         # Meaning that it isn't the bottom object anymore
-        return (is_collision and prev_object1.bottom_edge < prev_object2.top_edge
+        return (is_collision and prev_bottom_edge1 < prev_top_edge2
                 and object1.bottom_edge > object2.top_edge) or objects_are_touching
@@ -0,0 +1,76 @@
+import time
+
+
+class FramePacer:
+    """ Makes the game loop run at a target number of frames per second without using 100% of the CPU. It sleeps for most
+        of the time left in the frame and then spin waits for the last bit, so each frame ends very close to its deadline
+        (sleeping alone is not very accurate). All the timing uses a monotonic, high resolution clock"""
+
+    frames_per_second = None
+    frame_duration = 0
+    spin_wait_time = 0.002  # The time before the deadline where it stops sleeping and spin waits
+    next_frame_deadline = None
+    last_frame_start_time = None
+
+    def __init__(self, frames_per_second=60, spin_wait_time=0.002):
+        """ Initializes the object
+
+            Args:
+                frames_per_second (float): the target frames per second (None means it is unlimited, so it never waits)
+                spin_wait_time (float): how long before the frame deadline it stops sleeping and starts spin waiting
+
+            Returns:
+                None
+        """
+
+        self.spin_wait_time = spin_wait_time
+        self.set_frames_per_second(frames_per_second)
+
+    def set_frames_per_second(self, frames_per_second):
+        """Sets the target frames per second (None means it is unlimited, so it never waits)"""
+
+        self.frames_per_second = frames_per_second
+        self.frame_duration = 0 if frames_per_second is None else 1 / frames_per_second
+        self.next_frame_deadline = None
+
+    def start_frame(self):
+        """ Marks the start of a new frame. This should be called at the start of every frame
+
+            Returns:
+                float: the time between the start of the last frame and the start of this frame (the frame duration if this
+                is the first frame)"""
+
+        current_time = time.perf_counter()
+        frame_time = self.frame_duration
+
+        if self.last_frame_start_time is not None:
+            frame_time = current_time - self.last_frame_start_time
+
+        self.last_frame_start_time = current_time
+        return frame_time
+
+    def wait_for_next_frame(self):
+        """Waits until the deadline of the current frame (does not wait if the frames per second is unlimited)"""
+
+        if self.frames_per_second is None:
+            return
+
+        current_time = time.perf_counter()
+
+        if self.next_frame_deadline is None:
+            self.next_frame_deadline = current_time
+
+        self.next_frame_deadline += self.frame_duration
+
+        # If the game is more than a frame behind, it should not try to catch up by running frames without waiting
+        if current_time - self.next_frame_deadline > self.frame_duration:
+            self.next_frame_deadline = current_time
+            return
+
+        sleep_time = self.next_frame_deadline - current_time - self.spin_wait_time
+
+        if sleep_time > 0:
+            time.sleep(sleep_time)
+
+        while time.perf_counter() < self.next_frame_deadline:
+            pass
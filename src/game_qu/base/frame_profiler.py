@@ -0,0 +1,162 @@
+import time
+
+
+class TimingsRingBuffer:
+    """ Stores the last 'size' timings. The list is allocated once, so adding a timing never allocates memory and old
+        timings are overwritten by new ones"""
+
+    timings = []
+    size = 0
+    next_index = 0
+    number_of_timings = 0
+
+    def __init__(self, size):
+        """Initializes the object"""
+
+        self.size = size
+        self.timings = [0.0] * size
+        self.next_index = 0
+        self.number_of_timings = 0
+
+    def add(self, timing):
+        """Adds the timing to the buffer (overwrites the oldest timing if the buffer is full)"""
+
+        self.timings[self.next_index] = timing
+        self.next_index = (self.next_index + 1) % self.size
+        self.number_of_timings = min(self.number_of_timings + 1, self.size)
+
+    def get_timings(self):
+        """
+             Returns:
+                list[float]: the timings that are currently stored (not in order)"""
+
+        return self.timings[:self.number_of_timings]
+
+    def get_statistics(self):
+        """
+             Returns:
+                dict[str, float]: the 'min', 'avg', 'p95', 'p99', and 'max' of the stored timings and the 'count' of them"""
+
+        timings = sorted(self.get_timings())
+
+        if len(timings) == 0:
+            return {"count": 0, "min": 0, "avg": 0, "p95": 0, "p99": 0, "max": 0}
+
+        last_index = len(timings) - 1
+        return {
+            "count": len(timings),
+            "min": timings[0],
+            "avg": sum(timings) / len(timings),
+            "p95": timings[int(last_index * .95)],
+            "p99": timings[int(last_index * .99)],
+            "max": timings[last_index]
+        }
+
+
+class FrameProfiler:
+    """ Records how long each phase of every frame takes (keyboard, window, each screen's run, each component class's run
+        and render, etc.). The time of each phase is added up for the whole frame and then stored in a ring buffer, so only
+        the last 'number_of_frames_stored' frames are kept. When it is not enabled every method returns right away, so
+        the calls can be left in the game loop"""
+
+    is_enabled = False
+    number_of_frames_stored = 240
+    phase_name_to_timings = {}
+    current_frame_times = {}
+    last_end_of_frame_time = None
+
+    @staticmethod
+    def enable(number_of_frames_stored=240):
+        """Starts recording the timings (only the last 'number_of_frames_stored' frames are kept)"""
+
+        FrameProfiler.number_of_frames_stored = number_of_frames_stored
+        FrameProfiler.reset()
+        FrameProfiler.is_enabled = True
+
+    @staticmethod
+    def disable():
+        """Stops recording the timings"""
+
+        FrameProfiler.is_enabled = False
+
+    @staticmethod
+    def reset():
+        """Removes all the timings that have been recorded"""
+
+        FrameProfiler.phase_name_to_timings = {}
+        FrameProfiler.current_frame_times = {}
+        FrameProfiler.last_end_of_frame_time = None
+
+    @staticmethod
+    def start_timer():
+        """
+             Returns:
+                float: the current time, which should be passed into add_time() once the phase is over (0 if the
+                FrameProfiler is not enabled)"""
+
+        return time.perf_counter() if FrameProfiler.is_enabled else 0
+
+    @staticmethod
+    def add_time(phase_name, start_time):
+        """Adds the time since 'start_time' (from start_timer()) to the time of the phase for the current frame"""
+
+        if not FrameProfiler.is_enabled:
+            return
+
+        current_frame_times = FrameProfiler.current_frame_times
+        current_frame_times[phase_name] = current_frame_times.get(phase_name, 0) + time.perf_counter() - start_time
+
+    @staticmethod
+    def add_component_time(component, phase_name, start_time):
+        """Adds the time since 'start_time' to the time of the component's class for the phase ('run', 'render', etc.)"""
+
+        if FrameProfiler.is_enabled:
+            FrameProfiler.add_time(f"{component.__class__.__name__}.{phase_name}", start_time)
+
+    @staticmethod
+    def end_frame():
+        """Stores the times of all the phases of the current frame and the time of the whole frame"""
+
+        if not FrameProfiler.is_enabled:
+            return
+
+        current_time = time.perf_counter()
+
+        if FrameProfiler.last_end_of_frame_time is not None:
+            FrameProfiler.current_frame_times["frame"] = current_time - FrameProfiler.last_end_of_frame_time
+
+        for phase_name, phase_time in FrameProfiler.current_frame_times.items():
+            timings = FrameProfiler.phase_name_to_timings.get(phase_name)
+
+            if timings is None:
+                timings = TimingsRingBuffer(FrameProfiler.number_of_frames_stored)
+                FrameProfiler.phase_name_to_timings[phase_name] = timings
+
+            timings.add(phase_time)
+
+        FrameProfiler.current_frame_times = {}
+        FrameProfiler.last_end_of_frame_time = current_time
+
+    @staticmethod
+    def get_statistics(phase_name):
+        """
+             Returns:
+                dict[str, float]: the 'min', 'avg', 'p95', 'p99', and 'max' time of the phase over the stored frames and
+                the 'count' of frames the phase was in (None if the phase has never been recorded)"""
+
+        timings = FrameProfiler.phase_name_to_timings.get(phase_name)
+        return timings.get_statistics() if timings is not None else None
+
+    @staticmethod
+    def get_all_statistics():
+        """
+             Returns:
+                dict[str, dict[str, float]]: the phase names to their statistics (see get_statistics()) sorted by the
+                average time with the slowest phase first"""
+
+        all_statistics = {}
+
+        for phase_name, timings in FrameProfiler.phase_name_to_timings.items():
+            all_statistics[phase_name] = timings.get_statistics()
+
+        return dict(sorted(all_statistics.items(), key=lambda item: item[1]["avg"], reverse=True))
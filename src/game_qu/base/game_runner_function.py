@@ -1,35 +1,109 @@
 import math
 import time
+from game_qu.base import important_constants
 from game_qu.base.important_variables import *
+from game_qu.base.frame_profiler import FrameProfiler
 from game_qu.base.history_keeper import HistoryKeeper
+from game_qu.base.input_recorder import InputRecorder
 from game_qu.base.velocity_calculator import VelocityCalculator
 from game_qu.base.library_abstraction import utility_functions
 
+# The time that has passed, but has not been run yet by a fixed time step (only used if FIXED_TIME_STEP is not None)
+time_step_accumulator = 0
+
+
 def run_game(main_screen):
     """ Runs all the game code. This will add 'main_screen' to the 'game_window,' so the 'main_screen' components and run
         function can be called. If there should be multiple screens for this game, game_screen.add_screen() should be called.
         This function specifically calls game_window.add_screen() and call_every_cycle()"""
 
     game_window.add_screen(main_screen)
-    utility_functions.call_every_cycle(_run_game_every_cycle)
+
+    # The fixed time step is read from important_constants (not the import), so LibraryChanger.set_fixed_time_step() can
+    # be called after this module is imported
+    if important_constants.FIXED_TIME_STEP is None:
+        utility_functions.call_every_cycle(_run_game_every_cycle)
+
+    else:
+        VelocityCalculator.set_delta_time(important_constants.FIXED_TIME_STEP)
+        utility_functions.call_every_cycle(_run_game_every_cycle_with_fixed_time_step)
 
 
 def _run_game_every_cycle(cycle_time, is_start_time, should_render):
     """ Runs all the code that should be called every game cycle. This function updates all the game components. This
         function should generally not be called because the run_game method will do that for you"""
 
+    start_time = FrameProfiler.start_timer()
     keyboard.run()
+    FrameProfiler.add_time("Keyboard.run", start_time)
+    InputRecorder.record_cycle()
+
+    start_time = FrameProfiler.start_timer()
     game_window.run(should_render)
+    FrameProfiler.add_time("Window.run", start_time)
 
-    if is_start_time:
-        cycle_time = time.time() - cycle_time
-
-    if cycle_time == 0:
-        cycle_time = math.pow(10, -7)
+    cycle_time = _get_cycle_time(cycle_time, is_start_time)
 
     HistoryKeeper.set_last_frame_id(VelocityCalculator.current_cycle_number)
     VelocityCalculator.set_delta_time(cycle_time)
     VelocityCalculator.current_cycle_number += 1
+    FrameProfiler.end_frame()
+
+
+def _run_game_every_cycle_with_fixed_time_step(cycle_time, is_start_time, should_render):
+    """ Runs the game in steps of FIXED_TIME_STEP until the time that has passed is used up (at most
+        MAX_FIXED_TIME_STEPS_PER_FRAME steps) and then renders the game once. This function should generally not be
+        called because the run_game method will do that for you"""
+
+    global time_step_accumulator
+
+    cycle_time = _get_cycle_time(cycle_time, is_start_time)
+    fixed_time_step = important_constants.FIXED_TIME_STEP
+
+    # If the computer can not keep up, the time that can not be run is thrown away, so the game slows down instead of
+    # having to run more and more steps every frame
+    max_time = fixed_time_step * important_constants.MAX_FIXED_TIME_STEPS_PER_FRAME
+    time_step_accumulator = min(time_step_accumulator + cycle_time, max_time)
+
+    while time_step_accumulator >= fixed_time_step:
+        _run_fixed_time_step(fixed_time_step)
+        time_step_accumulator -= fixed_time_step
+
+    VelocityCalculator.set_interpolation_alpha(time_step_accumulator / fixed_time_step)
 
+    start_time = FrameProfiler.start_timer()
+    game_window.render(should_render)
+    FrameProfiler.add_time("Window.render", start_time)
+    FrameProfiler.end_frame()
 
 
+def _run_fixed_time_step(fixed_time_step):
+    """Runs one step of the game that lasts 'fixed_time_step'"""
+
+    VelocityCalculator.set_delta_time(fixed_time_step)
+
+    start_time = FrameProfiler.start_timer()
+    keyboard.run()
+    FrameProfiler.add_time("Keyboard.run", start_time)
+    InputRecorder.record_cycle()
+
+    start_time = FrameProfiler.start_timer()
+    game_window.run_without_rendering()
+    FrameProfiler.add_time("Window.run", start_time)
+
+    HistoryKeeper.set_last_frame_id(VelocityCalculator.current_cycle_number)
+    VelocityCalculator.current_cycle_number += 1
+
+
+def _get_cycle_time(cycle_time, is_start_time):
+    """
+         Returns:
+            float: the time the cycle took ('cycle_time' is the start time of the cycle if 'is_start_time' is True)"""
+
+    if is_start_time:
+        cycle_time = time.time() - cycle_time
+
+    if cycle_time == 0:
+        cycle_time = math.pow(10, -7)
+
+    return cycle_time
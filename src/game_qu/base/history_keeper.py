@@ -1,14 +1,91 @@
+import sys
+from array import array
 from copy import deepcopy
 
+from game_qu.base.library_independant_utility_functions import import_numpy
 from game_qu.base.velocity_calculator import VelocityCalculator
 from game_qu.gui_components.dimensions import Dimensions
 from game_qu.base.important_constants import *
 
 
+class HistoryGroup:
+    """ The dimensions of a group of objects for the last NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES cycles stored as a struct
+        of arrays: frames[frame_id] is a (number of objects, 4) NumPy array of [left_edge, top_edge, length, height]"""
+
+    frames = None
+    numbers_of_objects = []
+    names = []  # names[frame_id] are the names of the objects (in the same order as the rows of frames[frame_id])
+
+    def __init__(self, numpy, capacity):
+        """Initializes the object with room for 'capacity' objects per frame"""
+
+        self.frames = numpy.zeros((NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES, capacity, 4))
+        self.numbers_of_objects = [None] * NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES
+        self.names = [None] * NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES
+
+
+class HistoryView:
+    """ What an object looked like when it was added to the HistoryKeeper, but only its 'history_tracked_attributes' were
+        recorded (shallowly). The tracked attributes give the recorded values, the properties and methods of the object's
+        class use the recorded values, and every other attribute comes from the object itself"""
+
+    def __init__(self, history_keeper_object, attribute_values, name):
+        """ Initializes the object
+
+            Args:
+                history_keeper_object (object): the object that was added to the HistoryKeeper
+                attribute_values (dict[str, object]): the tracked attribute names to the values they had
+                name (str): the name the object was added with
+
+            Returns:
+                None
+        """
+
+        self.__dict__.update(attribute_values)
+        self.__dict__["history_keeper_object"] = history_keeper_object
+        self.__dict__["name"] = name
+
+    def __getattr__(self, attribute_name):
+        """
+             Returns:
+                object: the attribute of the object (properties and methods use the recorded values)"""
+
+        history_keeper_object = self.__dict__["history_keeper_object"]
+        class_attribute = getattr(type(history_keeper_object), attribute_name, None)
+
+        if hasattr(class_attribute, "__get__") and not isinstance(class_attribute, (staticmethod, classmethod)):
+            return class_attribute.__get__(self, type(history_keeper_object))
+
+        return getattr(history_keeper_object, attribute_name)
+
+    def __setattr__(self, attribute_name, value):
+        raise AttributeError("The objects of the HistoryKeeper can not be changed")
+
+
 class HistoryKeeper:
     last_objects = {}
     last_frame_id = 0
 
+    # The history of objects that only need their dimensions stored. Every name is registered to an integer handle that has
+    # a ring of NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES slots in these arrays, so adding the dimensions every cycle does not
+    # allocate anything. The slot of 'handle' at 'frame_id' is (handle * NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES + frame_id)
+    names_to_handles = {}
+    dimensions_history = array("d")  # [left_edge, top_edge, length, height] of every slot
+    dimensions_history_is_stored = bytearray()  # 1 if the slot has dimensions stored (since the last reset)
+
+    group_names_to_groups = {}  # The HistoryGroups of add_group() (needs NumPy)
+    names_to_latest_views = {}  # The latest HistoryView of every object that has 'history_tracked_attributes'
+
+    # Eviction: names that were not added within the last NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES cycles are removed, so
+    # objects that do not exist anymore (like platforms that went off the screen) do not take up memory forever. It is off
+    # by default because get_last() of a name that was not added recently returns what the name had in an older cycle
+    # (the game can depend on that), but after eviction it returns None
+    eviction_is_enabled = False
+    names_to_last_cycle_numbers = {}  # The last cycle the names of 'last_objects' were added
+    handles_last_cycle_numbers = array("q")  # The last cycle each handle's dimensions were added
+    handles_are_evictable = bytearray()  # 1 if the handle was registered by add() instead of register()
+    free_handles = []  # The handles of removed names (their slots are reused by the next registered names)
+
     @staticmethod
     def add(history_keeper_object, name, needs_dimensions_only=False, needs_deepcopy=False):
         """ Adds the object to the HistoryKeeper; IMPORTANT: make sure to provide a unique name for each unique object!
@@ -16,24 +93,32 @@ class HistoryKeeper:
             Args:
                 history_keeper_object (object): the object that is going to be added to the HistoryKeeper
                 name (str): the unique name (identifier) for the object
-                needs_deepcopy (bool): the object provided is an instance of GameObject
+                needs_deepcopy (bool): the object provided is an instance of GameObject; if the object has
+                    'history_tracked_attributes' only those are recorded (see HistoryView) instead of deep copying it
                 needs_dimensions_only (bool): whether the object stored only needs the dimensions stored for it
      
             Returns:
                 None
         """
 
-        if needs_deepcopy:
-            history_keeper_object = deepcopy(history_keeper_object)
-            history_keeper_object.name = name
-
         if needs_dimensions_only:
-            history_keeper_object = Dimensions(history_keeper_object.left_edge, history_keeper_object.top_edge,
-                                               history_keeper_object.length, history_keeper_object.height)
+            handle = HistoryKeeper.names_to_handles.get(name)
+            handle = handle if handle is not None else HistoryKeeper.register(name, True)
+            HistoryKeeper.add_dimensions(handle, history_keeper_object)
+            return
+
+        tracked_attribute_names = getattr(history_keeper_object, "history_tracked_attributes", None) if needs_deepcopy else None
+
+        if tracked_attribute_names is not None:
+            history_keeper_object = HistoryKeeper.get_history_view(history_keeper_object, name, tracked_attribute_names)
+
+        elif needs_deepcopy:
+            history_keeper_object = deepcopy(history_keeper_object)
             history_keeper_object.name = name
 
         frame_id = HistoryKeeper.get_frame_id(VelocityCalculator.current_cycle_number)
         HistoryKeeper.last_objects[f"{name}_{frame_id}"] = history_keeper_object
+        HistoryKeeper.names_to_last_cycle_numbers[name] = VelocityCalculator.current_cycle_number
 
     @staticmethod
     def get_last(name):
@@ -59,8 +144,229 @@ class HistoryKeeper:
             Returns:
                 object: the version of the object from the last cycle
         """
+        handle = HistoryKeeper.names_to_handles.get(name)
+
+        if handle is not None:
+            dimensions = HistoryKeeper.get_dimensions_using_frame_id(handle, frame_id)
+
+            if dimensions is None:
+                return None
+
+            last_object = Dimensions(*dimensions)
+            last_object.name = name
+            return last_object
+
         return HistoryKeeper.last_objects.get(f"{name}_{frame_id}")
 
+    @staticmethod
+    def get_last_edges(name):
+        """
+             Returns:
+                tuple[float]: (left_edge, top_edge, right_edge, bottom_edge) of the object from the last cycle (None if
+                nothing was stored); see get_edges_using_frame_id()"""
+
+        return HistoryKeeper.get_edges_using_frame_id(name, HistoryKeeper.last_frame_id)
+
+    @staticmethod
+    def get_edges_using_frame_id(name, frame_id):
+        """
+             Returns:
+                tuple[float]: (left_edge, top_edge, right_edge, bottom_edge) of the object at that cycle (decided by
+                'frame_id'); None if nothing was stored. Unlike get_last_using_frame_id(), no object is created for the
+                dimensions, so this is what collision code that only needs the edges should use"""
+
+        handle = HistoryKeeper.names_to_handles.get(name)
+
+        if handle is None:
+            last_object = HistoryKeeper.last_objects.get(f"{name}_{frame_id}")
+            return None if last_object is None else (last_object.left_edge, last_object.top_edge, last_object.right_edge, last_object.bottom_edge)
+
+        slot = handle * NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES + frame_id
+
+        if not HistoryKeeper.dimensions_history_is_stored[slot]:
+            return None
+
+        index = slot * 4
+        dimensions_history = HistoryKeeper.dimensions_history
+        left_edge, top_edge = dimensions_history[index], dimensions_history[index + 1]
+        return left_edge, top_edge, left_edge + dimensions_history[index + 2], top_edge + dimensions_history[index + 3]
+
+    @staticmethod
+    def get_history_view(history_keeper_object, name, tracked_attribute_names):
+        """
+             Returns:
+                HistoryView: the object with the current values of its tracked attributes; copy on write, so the latest
+                HistoryView of the object is reused if none of the tracked attributes changed"""
+
+        latest_view = HistoryKeeper.names_to_latest_views.get(name)
+        view_attributes = latest_view.__dict__ if latest_view is not None else None
+        is_changed = latest_view is None or view_attributes["history_keeper_object"] is not history_keeper_object
+
+        if not is_changed:
+            for attribute_name in tracked_attribute_names:
+                value = getattr(history_keeper_object, attribute_name)
+                previous_value = view_attributes.get(attribute_name, view_attributes)
+
+                if not HistoryKeeper.is_same_value(value, previous_value):
+                    is_changed = True
+                    break
+
+        if is_changed:
+            attribute_values = {attribute_name: getattr(history_keeper_object, attribute_name) for attribute_name in tracked_attribute_names}
+            latest_view = HistoryView(history_keeper_object, attribute_values, name)
+            HistoryKeeper.names_to_latest_views[name] = latest_view
+
+        return latest_view
+
+    @staticmethod
+    def is_same_value(value, previous_value):
+        """
+             Returns:
+                bool: whether the value did not change; values whose comparison is not one bool (like NumPy arrays) are only
+                the same if they are the same object"""
+
+        if value is previous_value:
+            return True
+
+        try:
+            return bool(value == previous_value)
+
+        except (ValueError, TypeError):
+            return False
+
+    @staticmethod
+    def register(name, is_evictable=False):
+        """ Registers the name, so its dimensions can be stored with an integer handle (the slots for the handle are
+            allocated here, so HistoryKeeper.add_dimensions() never allocates anything)
+
+            Args:
+                name (str): the unique name (identifier) for the object
+                is_evictable (bool): whether the handle is removed once its dimensions were not added within the last
+                    NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES cycles (handles that are kept by the caller should not be)
+
+            Returns:
+                int: the handle of the name (the same handle if the name was already registered)"""
+
+        handle = HistoryKeeper.names_to_handles.get(name)
+
+        if handle is not None:
+            return handle
+
+        if len(HistoryKeeper.free_handles) != 0:
+            handle = HistoryKeeper.free_handles.pop()
+
+        else:
+            handle = len(HistoryKeeper.handles_last_cycle_numbers)
+            HistoryKeeper.dimensions_history.extend([0.0] * (NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES * 4))
+            HistoryKeeper.dimensions_history_is_stored.extend(bytes(NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES))
+            HistoryKeeper.handles_last_cycle_numbers.append(0)
+            HistoryKeeper.handles_are_evictable.append(0)
+
+        HistoryKeeper.names_to_handles[name] = handle
+        HistoryKeeper.handles_last_cycle_numbers[handle] = VelocityCalculator.current_cycle_number
+        HistoryKeeper.handles_are_evictable[handle] = is_evictable
+        return handle
+
+    @staticmethod
+    def add_dimensions(handle, history_keeper_object):
+        """Stores the dimensions of 'history_keeper_object' for this cycle in the slot of 'handle' (see register())"""
+
+        slot = handle * NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES + VelocityCalculator.current_cycle_number % NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES
+        index = slot * 4
+        dimensions_history = HistoryKeeper.dimensions_history
+
+        dimensions_history[index] = history_keeper_object.left_edge
+        dimensions_history[index + 1] = history_keeper_object.top_edge
+        dimensions_history[index + 2] = history_keeper_object.length
+        dimensions_history[index + 3] = history_keeper_object.height
+        HistoryKeeper.dimensions_history_is_stored[slot] = 1
+        HistoryKeeper.handles_last_cycle_numbers[handle] = VelocityCalculator.current_cycle_number
+
+    @staticmethod
+    def get_last_dimensions(handle):
+        """
+             Returns:
+                list[float]: [left_edge, top_edge, length, height] of the handle's object from the last cycle (None if
+                nothing was stored)"""
+
+        return HistoryKeeper.get_dimensions_using_frame_id(handle, HistoryKeeper.last_frame_id)
+
+    @staticmethod
+    def get_dimensions_using_frame_id(handle, frame_id):
+        """
+             Returns:
+                list[float]: [left_edge, top_edge, length, height] of the handle's object at that cycle (decided by
+                'frame_id'); None if nothing was stored (see get_edges_using_frame_id() for only the edges)"""
+
+        slot = handle * NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES + frame_id
+
+        if not HistoryKeeper.dimensions_history_is_stored[slot]:
+            return None
+
+        index = slot * 4
+        dimensions_history = HistoryKeeper.dimensions_history
+        return [dimensions_history[index], dimensions_history[index + 1], dimensions_history[index + 2], dimensions_history[index + 3]]
+
+    @staticmethod
+    def add_group(group_name, game_objects):
+        """ Stores the dimensions of every object in 'game_objects' for this cycle in one NumPy frame buffer (needs NumPy);
+            get_last_group() gives them back as an array
+
+            Args:
+                group_name (str): the unique name of the group
+                game_objects (list[object]): the objects of the group (their 'name' is stored too)
+
+            Returns:
+                None
+        """
+
+        numpy = import_numpy("HistoryKeeper groups")
+        number_of_objects = len(game_objects)
+        group = HistoryKeeper.group_names_to_groups.get(group_name)
+
+        if group is None:
+            group = HistoryKeeper.group_names_to_groups[group_name] = HistoryGroup(numpy, max(number_of_objects, 1))
+
+        # Growing the buffer if there are more objects than there is room for (keeping the frames stored so far)
+        if number_of_objects > group.frames.shape[1]:
+            frames = numpy.zeros((NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES, max(number_of_objects, group.frames.shape[1] * 2), 4))
+            frames[:, :group.frames.shape[1]] = group.frames
+            group.frames = frames
+
+        frame_id = HistoryKeeper.get_frame_id(VelocityCalculator.current_cycle_number)
+        edges = numpy.fromiter((edge for game_object in game_objects
+                                for edge in (game_object.left_edge, game_object.top_edge, game_object.length, game_object.height)),
+                               dtype=float, count=number_of_objects * 4)
+
+        group.frames[frame_id, :number_of_objects] = edges.reshape(number_of_objects, 4)
+        group.numbers_of_objects[frame_id] = number_of_objects
+        group.names[frame_id] = [game_object.name for game_object in game_objects]
+
+    @staticmethod
+    def get_last_group(group_name):
+        """
+             Returns:
+                list[object]: [dimensions, names]; the group's objects from the last cycle: dimensions is a (number of
+                objects, 4) NumPy array of [left_edge, top_edge, length, height] and names are the names of the objects
+                in the same order (None if the group was not stored last cycle). The array is a view of the frame buffer,
+                so it must be copied if it is needed after NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES more cycles"""
+
+        return HistoryKeeper.get_group_using_frame_id(group_name, HistoryKeeper.last_frame_id)
+
+    @staticmethod
+    def get_group_using_frame_id(group_name, frame_id):
+        """
+             Returns:
+                list[object]: [dimensions, names]; the group's objects at that cycle (decided by 'frame_id'); see
+                get_last_group()"""
+
+        group = HistoryKeeper.group_names_to_groups.get(group_name)
+
+        if group is None or group.numbers_of_objects[frame_id] is None:
+            return None
+
+        return [group.frames[frame_id, :group.numbers_of_objects[frame_id]], group.names[frame_id]]
+
     @staticmethod
     def reset():
         """Resets the HistoryKeeper, so it has no more values of past objects"""
@@ -68,12 +374,100 @@ class HistoryKeeper:
         HistoryKeeper.last_objects = {}
         HistoryKeeper.times = []
 
+        # The handles stay registered, so their slots can be reused
+        HistoryKeeper.dimensions_history_is_stored = bytearray(len(HistoryKeeper.dimensions_history_is_stored))
+        HistoryKeeper.group_names_to_groups = {}
+        HistoryKeeper.names_to_latest_views = {}
+        HistoryKeeper.names_to_last_cycle_numbers = {}
+        HistoryKeeper.clear_collisions_engine_cache()
+
+    @staticmethod
+    def remove(name):
+        """Removes everything the HistoryKeeper has stored for the name (its handle is freed, so it can be reused)"""
+
+        for frame_id in range(NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES):
+            HistoryKeeper.last_objects.pop(f"{name}_{frame_id}", None)
+
+        HistoryKeeper.names_to_last_cycle_numbers.pop(name, None)
+        HistoryKeeper.names_to_latest_views.pop(name, None)
+        handle = HistoryKeeper.names_to_handles.pop(name, None)
+
+        if handle is not None:
+            first_slot = handle * NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES
+            HistoryKeeper.dimensions_history_is_stored[first_slot:first_slot + NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES] = bytes(NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES)
+            HistoryKeeper.free_handles.append(handle)
+
+        HistoryKeeper.clear_collisions_engine_cache()
+
+    @staticmethod
+    def evict_stale_names(cycle_number):
+        """Removes every name that was not added within the NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES cycles up to 'cycle_number'"""
+
+        last_kept_cycle_number = cycle_number - NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES
+        stale_names = [name for name, last_cycle_number in HistoryKeeper.names_to_last_cycle_numbers.items()
+                       if last_cycle_number <= last_kept_cycle_number]
+
+        handles_last_cycle_numbers, handles_are_evictable = HistoryKeeper.handles_last_cycle_numbers, HistoryKeeper.handles_are_evictable
+        stale_names += [name for name, handle in HistoryKeeper.names_to_handles.items()
+                        if handles_are_evictable[handle] and handles_last_cycle_numbers[handle] <= last_kept_cycle_number]
+
+        for name in stale_names:
+            HistoryKeeper.remove(name)  # This also clears the dimensions CollisionsEngine has cached
+
+    @staticmethod
+    def clear_collisions_engine_cache():
+        """Clears the dimensions CollisionsEngine has cached from the HistoryKeeper, so removed values are not used"""
+
+        # Importing here because the CollisionsEngine imports the HistoryKeeper
+        from game_qu.base.engines import CollisionsEngine
+
+        CollisionsEngine.clear_previous_dimensions()
+
+    @staticmethod
+    def get_statistics():
+        """
+             Returns:
+                dict[str, int]: {'number_of_names', 'number_of_entries', 'number_of_handles', 'approximate_bytes'}; how
+                much the HistoryKeeper is storing (approximate_bytes is the memory of its containers and stored values)"""
+
+        approximate_bytes = sys.getsizeof(HistoryKeeper.last_objects)
+
+        for key, value in HistoryKeeper.last_objects.items():
+            approximate_bytes += sys.getsizeof(key) + sys.getsizeof(value)
+
+        for container in [HistoryKeeper.names_to_handles, HistoryKeeper.names_to_last_cycle_numbers, HistoryKeeper.names_to_latest_views,
+                          HistoryKeeper.dimensions_history, HistoryKeeper.dimensions_history_is_stored,
+                          HistoryKeeper.handles_last_cycle_numbers, HistoryKeeper.handles_are_evictable]:
+            approximate_bytes += sys.getsizeof(container)
+
+        for group in HistoryKeeper.group_names_to_groups.values():
+            approximate_bytes += group.frames.nbytes
+
+        names = set(HistoryKeeper.names_to_last_cycle_numbers.keys()) | set(HistoryKeeper.names_to_handles.keys())
+
+        return {
+            "number_of_names": len(names),
+            "number_of_entries": len(HistoryKeeper.last_objects) + sum(HistoryKeeper.dimensions_history_is_stored),
+            "number_of_handles": len(HistoryKeeper.names_to_handles),
+            "approximate_bytes": approximate_bytes
+        }
+
+    @staticmethod
+    def set_eviction_is_enabled(eviction_is_enabled):
+        """Sets whether stale names are evicted every NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES cycles (see evict_stale_names())"""
+
+        HistoryKeeper.eviction_is_enabled = eviction_is_enabled
+
     @staticmethod
     def set_last_frame_id(cycle_number):
-        """Sets the last time of the HistoryKeeper"""
+        """ Sets the last time of the HistoryKeeper (if eviction is enabled, the stale names are evicted every
+            NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES cycles)"""
 
         HistoryKeeper.last_frame_id = HistoryKeeper.get_frame_id(cycle_number)
 
+        if HistoryKeeper.eviction_is_enabled and cycle_number % NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES == 0:
+            HistoryKeeper.evict_stale_names(cycle_number)
+
     @staticmethod
     def get_frame_id(cycle_number):
         """
@@ -93,17 +487,9 @@ class HistoryKeeper:
 
         for x in range(NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES):
             key = f"{name}_{x}"
-            value = HistoryKeeper.last_objects.get(key)
+            value = HistoryKeeper.get_last_using_frame_id(name, x)
 
             if value is not None:
                 return_value[key] = value
 
         return return_value
-
-
-
-
-
-
-
-
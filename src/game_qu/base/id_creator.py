@@ -1,21 +1,35 @@
 import random
 
-from game_qu.base.unique_ids_list import unique_ids
 from game_qu.base.library_independant_utility_functions import get_string
 
 
 class IDCreator:
-    """A class that creates simple unique identifiers"""
+    """ A class that creates unique integer identifiers (they are cheap to hash and never collide). If recycling is on,
+        the identifiers that are released are handed out again with their generation increased by one, so a stale
+        identifier can be caught by checking the generation it was given with (see is_current_generation())"""
 
     all_chs = ['1', '2', '3', '4', '5', '6', '7', '8', '9', '0', '-', '=', 'q', 'w', 'e', 'r', 't', 'y', 'u', 'i', 'o', 'p', '[', ']', 'a', 's', 'd', 'f', 'g', 'h', 'j', 'k', 'l', ';', "'", 'z', 'c', 'v', 'b', 'n', 'm', ',', '.', '/', '~', '!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '_', '+', 'Q', 'W', 'E', 'R', 'T', 'Y', 'U', 'I', 'O', 'P', '{', '}', 'A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L', ':', 'Z', 'X', 'C', 'V', 'B', 'N', 'M', '<', '>', '?']
 
-    current_unique_id_index = -1  # So when one is added it goes to index 0
+    next_unique_id = 1  # Starts at 1, so an identifier is never falsy
+    is_recycling_ids = False
+    free_unique_ids = []
+    released_unique_ids = set()  # The identifiers that have been released and not handed out again
+    unique_ids_to_generations = {}  # Only the identifiers that have been released are stored (the rest are generation 0)
+
+    def __init__(self, is_recycling_ids=False):
+        """Initializes the object (the released identifiers are only handed out again if 'is_recycling_ids' is True)"""
+
+        self.next_unique_id = 1
+        self.is_recycling_ids = is_recycling_ids
+        self.free_unique_ids = []
+        self.released_unique_ids = set()
+        self.unique_ids_to_generations = {}
 
     def get_unique_id_of_length(self, length):
         """
              Returns:
-                str: a unique id with the length 'length.' IMPORTANT: it is recommended to call
-                'self.get_unique_id' because that method will be quicker."""
+                str: a random id with the length 'length.' IMPORTANT: it is not guaranteed to be unique, so it is
+                recommended to call 'self.get_unique_id' instead"""
 
         random.shuffle(self.all_chs)
         return get_string(self.all_chs[:length])
@@ -23,18 +37,59 @@ class IDCreator:
     def get_unique_id(self):
         """
              Returns:
-                str: a unique identifier"""
+                int: a unique identifier (a released one if recycling is on and one has been released)"""
+
+        if self.is_recycling_ids and len(self.free_unique_ids) != 0:
+            unique_id = self.free_unique_ids.pop()
+            self.released_unique_ids.remove(unique_id)
+            return unique_id
+
+        unique_id = self.next_unique_id
+        self.next_unique_id += 1
+        return unique_id
+
+    def release_unique_id(self, unique_id):
+        """ Releases the identifier, so it can be handed out again if recycling is on (its generation is increased by one).
+            An identifier can only be released once each time it is handed out"""
 
-        self.current_unique_id_index += 1
-        return_value = None
+        if unique_id not in range(1, self.next_unique_id):
+            raise ValueError(f"The identifier {unique_id} was never handed out")
 
-        if self.current_unique_id_index < len(unique_ids):
-            return_value = unique_ids[self.current_unique_id_index]
+        if unique_id in self.released_unique_ids:
+            raise ValueError(f"The identifier {unique_id} has already been released")
 
-        else:
-            return_value = self.get_unique_id_of_length(5)
+        self.released_unique_ids.add(unique_id)
+        self.unique_ids_to_generations[unique_id] = self.get_generation(unique_id) + 1
+
+        if self.is_recycling_ids:
+            self.free_unique_ids.append(unique_id)
+
+    def set_is_recycling_ids(self, is_recycling_ids):
+        """Sets whether the released identifiers are handed out again"""
+
+        self.is_recycling_ids = is_recycling_ids
+
+    def get_generation(self, unique_id):
+        """
+             Returns:
+                int: the number of times the identifier has been released"""
+
+        return self.unique_ids_to_generations.get(unique_id, 0)
+
+    def is_current_generation(self, unique_id, generation):
+        """
+             Returns:
+                bool: whether the identifier has not been released since it was given out with 'generation'"""
+
+        return self.get_generation(unique_id) == generation
+
+    def get_id_string(self, unique_id):
+        """
+             Returns:
+                str: the identifier and its generation as a string, like '#12' or '#12.3' (only meant for debugging)"""
 
-        return return_value
+        generation = self.get_generation(unique_id)
+        return f"#{unique_id}" if generation == 0 else f"#{unique_id}.{generation}"
 
 
 id_creator = IDCreator()
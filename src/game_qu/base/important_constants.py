@@ -4,5 +4,12 @@ SCREEN_LENGTH = 1300
 SCREEN_HEIGHT = 650
 BACKGROUND_COLOR = (200, 200, 200)
 NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES = 4
+NUMBER_OF_FRAMES_ROLLBACK_STORES = 8  # How many cycles back Rollback can restore the game to
 IS_USING_CONTROLLER = False
 DEFAULT_RENDERING_ENGINE = "pygame"
+FIXED_TIME_STEP = None  # None means the game runs with the measured time between cycles (no fixed time step)
+MAX_FIXED_TIME_STEPS_PER_FRAME = 5
+SCALED_IMAGES_CACHE_MAX_BYTES = 64 * 1024 * 1024  # The most memory the images that have been scaled can use (pygame only)
+RENDERED_TEXT_CACHE_MAX_BYTES = 16 * 1024 * 1024  # The most memory the text that has been rendered can use (pygame only)
+MAX_NUMBER_OF_FONTS_LOADED = 32  # The most font sizes that are loaded at once (pygame only)
+FRAMES_PER_SECOND = 60  # None means the frames per second is unlimited
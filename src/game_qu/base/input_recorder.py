@@ -0,0 +1,158 @@
+import random
+import struct
+
+from game_qu.base.library_abstraction import keys
+from game_qu.base.library_abstraction import utility_functions
+from game_qu.base.library_changer import LibraryChanger
+from game_qu.base.velocity_calculator import VelocityCalculator
+
+# The file starts with the header and then there is one cycle record for every cycle
+# Header: file signature, version, cycle number recording started at, whether there is a random seed, the random seed
+HEADER_FORMAT = "<4sHq?q"
+# Cycle record: delta time, pressed keys and buttons (bit 'key' is set if 'key' is pressed), mouse is pressed, mouse position
+CYCLE_RECORD_FORMAT = "<dQ?ff"
+FILE_SIGNATURE = b"GQIR"
+FILE_VERSION = 1
+
+
+class InputRecorder:
+    """ Records everything that the Keyboard reads every cycle (the keys, buttons, and mouse) and the delta time the cycle
+        ran with into a small binary file. InputReplayer can then run the game again with exactly the same input. The
+        recording should be started before run_game() is called, so the replay starts from the same state"""
+
+    file = None
+    keyboard = None
+
+    @staticmethod
+    def start_recording(path_to_file, random_seed=None):
+        """ Starts recording the input into the file at 'path_to_file.' If 'random_seed' is not None, the random module
+            is seeded with it and the seed is stored in the file, so the replay gets the same random numbers"""
+
+        # Importing here, so importing this module does not create the game window
+        from game_qu.base.important_variables import keyboard
+
+        InputRecorder.stop_recording()
+        InputRecorder.keyboard = keyboard
+
+        if random_seed is not None:
+            random.seed(random_seed)
+
+        InputRecorder.file = open(path_to_file, "wb")
+        header = struct.pack(HEADER_FORMAT, FILE_SIGNATURE, FILE_VERSION, VelocityCalculator.current_cycle_number,
+                             random_seed is not None, random_seed if random_seed is not None else 0)
+        InputRecorder.file.write(header)
+
+    @staticmethod
+    def stop_recording():
+        """Stops recording and closes the file (does nothing if it is not recording)"""
+
+        if InputRecorder.file is not None:
+            InputRecorder.file.close()
+            InputRecorder.file = None
+
+    @staticmethod
+    def is_recording():
+        """
+             Returns:
+                bool: whether the input is currently being recorded"""
+
+        return InputRecorder.file is not None
+
+    @staticmethod
+    def record_cycle():
+        """Records the input of the current cycle; must be called after Keyboard.run() (does nothing if it is not recording)"""
+
+        if InputRecorder.file is None:
+            return
+
+        keyboard = InputRecorder.keyboard
+        pressed_keys = 0
+
+        for key in keys.keys:
+            if keyboard.get_key_event(key).happened_this_cycle:
+                pressed_keys |= 1 << key
+
+        for button, button_event in keyboard.button_events.items():
+            if button_event.happened_this_cycle:
+                pressed_keys |= 1 << button
+
+        mouse_left_edge, mouse_top_edge = utility_functions.get_mouse_position()
+        cycle_record = struct.pack(CYCLE_RECORD_FORMAT, VelocityCalculator.time, pressed_keys,
+                                   bool(keyboard.mouse_clicked_event.happened_this_cycle), mouse_left_edge, mouse_top_edge)
+        InputRecorder.file.write(cycle_record)
+
+
+class InputReplayer:
+    """ Runs the game with the input recorded by InputRecorder. It must be used with the 'null' game library, so it can
+        set the input and it runs the game as fast as possible without rendering"""
+
+    @staticmethod
+    def read_recording(path_to_file):
+        """
+             Returns:
+                list[object]: [start_cycle_number, random_seed, cycle_records]; random_seed is None if there was no
+                seed and every cycle record is [delta_time, pressed_keys, mouse_is_pressed, mouse_left_edge, mouse_top_edge]"""
+
+        with open(path_to_file, "rb") as file:
+            data = file.read()
+
+        header_size = struct.calcsize(HEADER_FORMAT)
+        signature, version, start_cycle_number, has_random_seed, random_seed = struct.unpack(HEADER_FORMAT, data[:header_size])
+
+        if signature != FILE_SIGNATURE or version != FILE_VERSION:
+            raise ValueError(f"The file at {path_to_file} is not a recording made by this version of InputRecorder")
+
+        cycle_records = [list(cycle_record) for cycle_record in struct.iter_unpack(CYCLE_RECORD_FORMAT, data[header_size:])]
+        return [start_cycle_number, random_seed if has_random_seed else None, cycle_records]
+
+    @staticmethod
+    def replay(path_to_file, main_screen, should_render=False):
+        """ Runs the game with 'main_screen' (added to the game_window like run_game() does) using the recorded input.
+            The recording must have been started right before run_game() was called with the same screen in the same state
+
+            Returns:
+                int: the number of cycles that were replayed"""
+
+        if LibraryChanger.current_library_name != "null":
+            raise ValueError("InputReplayer can only be used with the 'null' game library (LibraryChanger.set_game_library('null'))")
+
+        # Importing here, so importing this module does not create the game window
+        from game_qu.base.history_keeper import HistoryKeeper
+        from game_qu.base.important_variables import keyboard, game_window
+
+        start_cycle_number, random_seed, cycle_records = InputReplayer.read_recording(path_to_file)
+
+        if random_seed is not None:
+            random.seed(random_seed)
+
+        VelocityCalculator.current_cycle_number = start_cycle_number
+        game_window.add_screen(main_screen)
+
+        for delta_time, pressed_keys, mouse_is_pressed, mouse_left_edge, mouse_top_edge in cycle_records:
+            InputReplayer.set_input(pressed_keys, mouse_is_pressed, mouse_left_edge, mouse_top_edge)
+            VelocityCalculator.set_delta_time(delta_time)
+
+            keyboard.run()
+            game_window.run(should_render)
+
+            HistoryKeeper.set_last_frame_id(VelocityCalculator.current_cycle_number)
+            VelocityCalculator.current_cycle_number += 1
+
+        return len(cycle_records)
+
+    @staticmethod
+    def set_input(pressed_keys, mouse_is_pressed, mouse_left_edge, mouse_top_edge):
+        """Sets the input of the 'null' game library to the recorded input"""
+
+        utility_functions.release_all()
+
+        for key in keys.keys + keys.buttons:
+            if pressed_keys & (1 << key):
+                if key in keys.buttons:
+                    utility_functions.press_button(key)
+
+                else:
+                    utility_functions.press_key(key)
+
+        utility_functions.set_mouse_is_pressed(mouse_is_pressed)
+        utility_functions.set_mouse_position(mouse_left_edge, mouse_top_edge)
@@ -0,0 +1,54 @@
+"""Contains all the keys and buttons that the user can use. Every game library uses these same values and maps them to its own
+keys, so they can be used without importing the game library"""
+
+KEY_A = 0
+KEY_B = 1
+KEY_C = 2
+KEY_D = 3
+KEY_E = 4
+KEY_F = 5
+KEY_G = 6
+KEY_H = 7
+KEY_I = 8
+KEY_J = 9
+KEY_K = 10
+KEY_L = 11
+KEY_M = 12
+KEY_N = 13
+KEY_O = 14
+KEY_P = 15
+KEY_Q = 16
+KEY_R = 17
+KEY_S = 18
+KEY_T = 19
+KEY_U = 20
+KEY_V = 21
+KEY_W = 22
+KEY_X = 23
+KEY_Y = 24
+KEY_Z = 25
+KEY_LEFT = 26
+KEY_RIGHT = 27
+KEY_UP = 28
+KEY_DOWN = 29
+KEY_QUESTION_MARK = 30
+KEY_PERIOD = 31
+KEY_COMMA = 32
+KEY_COLON = 33
+KEY_QUOTATION_MARKS = 34
+KEY_LEFT_BRACKET = 35
+KEY_RIGHT_BRACKET = 36
+KEY_ESCAPE = 37
+KEY_SLASH = 38
+BUTTON_X = 39
+BUTTON_A = 40
+BUTTON_B = 41
+BUTTON_Y = 42
+BUTTON_L = 43
+BUTTON_R = 44
+BUTTON_SELECT = 45
+BUTTON_START = 46
+DPAD_UP = 47
+DPAD_DOWN = 48
+DPAD_LEFT = 49
+DPAD_RIGHT = 50
@@ -21,20 +21,19 @@ class Keyboard:
     def __init__(self):
         """Initializes all the key events"""
 
-        for x in range(len(keys.keys)):
-            self.key_events.append(Event())
-            self.key_timed_events.append(TimedEvent(0))
+        # The events are new lists (not added onto the old ones), so creating a Keyboard again does not add more events
+        Keyboard.key_events = [Event() for key in keys.keys]
+        Keyboard.key_timed_events = [TimedEvent(0) for key in keys.keys]
 
         # Currently this game engine does not support controllers for pyglet
-        if LibraryChanger.current_library_name == "pygame":
+        if LibraryChanger.get_library_supports_controllers():
             self.create_button_events()
 
     def create_button_events(self):
         """Creates all the button Events and TimedEvents"""
 
-        for button in keys.buttons:
-            self.button_events[button] = Event()
-            self.button_timed_events[button] = TimedEvent(0)
+        Keyboard.button_events = {button: Event() for button in keys.buttons}
+        Keyboard.button_timed_events = {button: TimedEvent(0) for button in keys.buttons}
 
     def get_key_timed_event(self, key):
         """
@@ -97,7 +96,9 @@ class Keyboard:
         
         # If no controller is hooked up, then the buttons should not be run
         # Currently this game engine does not support controllers for pyglet
-        if LibraryChanger.current_library_name == "pygame" and variables.joystick is not None and IS_USING_CONTROLLER:
+        # The null game library has no joystick, but its buttons are scripted, so they should still be run
+        joystick_is_connected = variables.joystick is not None or LibraryChanger.current_library_name == "null"
+        if LibraryChanger.get_library_supports_controllers() and joystick_is_connected and IS_USING_CONTROLLER:
             self.run_buttons()
 
     def run_buttons(self):
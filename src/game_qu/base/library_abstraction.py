@@ -1,5 +1,15 @@
-"""This file holds the module variables that the game engine will be getting its functions and constants from (either pygame or pyglet)"""
+"""This file holds the module variables that the game engine will be getting its functions and constants from (pygame, pyglet, or null).
+The game library is only imported the first time one of these variables is used, so importing the game engine is cheap"""
 
-keys = None
-variables = None
-utility_functions = None
\ No newline at end of file
+
+def __getattr__(name):
+    """Imports the game library the first time 'keys,' 'variables,' or 'utility_functions' is used"""
+
+    if name not in ["keys", "variables", "utility_functions"]:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Importing here because library_changer imports this module
+    from game_qu.base.library_changer import LibraryChanger
+
+    LibraryChanger.load_game_library()
+    return globals()[name]
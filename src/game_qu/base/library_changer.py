@@ -9,7 +9,13 @@ class LibraryChanger:
         from game_qu.base.library_changer import LibraryChanger, so none of the other code is initialized with the old constants."""
 
     library_has_been_set = False
+    game_library_is_loaded = False
     current_library_name = ""
+    library_name_to_package_name = {
+        "pyglet": "game_qu.pyglet_abstraction",
+        "pygame": "game_qu.pygame_abstraction",
+        "null": "game_qu.null_abstraction"
+    }
 
     @staticmethod
     def set_screen_dimensions(screen_length, screen_height):
@@ -34,25 +40,51 @@ class LibraryChanger:
     def set_game_library(library_name):
         """ Sets the game library that runs all the code. Here are the valid names:
             'pyglet',
-            'pygame'"""
+            'pygame',
+            'null' (nothing is rendered and the input is scripted, so games can be run without a display)
+
+            The game library is only imported once it is first used (see load_game_library()), so setting it is cheap"""
 
-        valid_library_names = ["pyglet", "pygame"]
         LibraryChanger.library_has_been_set = True
 
-        if not valid_library_names.__contains__(library_name):
-            raise ValueError(f"Do not recognize 'library_name' {library_name}. Here are the valid values: ['pyglet', 'pygame']")
+        if not LibraryChanger.library_name_to_package_name.__contains__(library_name):
+            raise ValueError(f"Do not recognize 'library_name' {library_name}. Here are the valid values: {list(LibraryChanger.library_name_to_package_name.keys())}")
+
+        LibraryChanger.current_library_name = library_name
+
+        # If the old game library was already loaded, the new one has to be loaded now, so it replaces the old one
+        if LibraryChanger.game_library_is_loaded:
+            LibraryChanger.load_game_library()
 
-        if library_name == "pyglet":
-            LibraryChanger.current_library_name = library_name
-            library_abstraction.keys = importlib.import_module("game_qu.pyglet_abstraction.keys")
-            library_abstraction.utility_functions = importlib.import_module("game_qu.pyglet_abstraction.utility_functions")
-            library_abstraction.variables = importlib.import_module("game_qu.pyglet_abstraction.variables")
+    @staticmethod
+    def load_game_library():
+        """ Imports the modules of the game library (the default one if it has not been set) into
+            base/library_abstraction.py. This is called automatically the first time library_abstraction is used"""
+
+        if not LibraryChanger.library_has_been_set:
+            LibraryChanger.set_game_library(important_constants.DEFAULT_RENDERING_ENGINE)
 
-        else:
-            LibraryChanger.current_library_name = library_name
-            library_abstraction.keys = importlib.import_module("game_qu.pygame_abstraction.keys")
-            library_abstraction.utility_functions = importlib.import_module("game_qu.pygame_abstraction.utility_functions")
-            library_abstraction.variables = importlib.import_module("game_qu.pygame_abstraction.variables")
+        package_name = LibraryChanger.library_name_to_package_name[LibraryChanger.current_library_name]
+        library_abstraction.keys = importlib.import_module(f"{package_name}.keys")
+        library_abstraction.utility_functions = importlib.import_module(f"{package_name}.utility_functions")
+        library_abstraction.variables = importlib.import_module(f"{package_name}.variables")
+        LibraryChanger.game_library_is_loaded = True
+
+    @staticmethod
+    def get_library_supports_controllers():
+        """
+             Returns:
+                bool: whether the current game library supports controllers (currently pyglet does not)"""
+
+        return LibraryChanger.current_library_name == "pygame" or LibraryChanger.current_library_name == "null"
+
+    @staticmethod
+    def get_library_supports_dirty_rectangles():
+        """
+             Returns:
+                bool: whether the current game library can update only parts of the window (currently pyglet can not)"""
+
+        return LibraryChanger.current_library_name == "pygame" or LibraryChanger.current_library_name == "null"
 
     @staticmethod
     def get_library_has_been_set():
@@ -72,7 +104,10 @@ class LibraryChanger:
             BACKGROUND_COLOR = (200, 200, 200)
             NUMBER_OF_FRAMES_HISTORY_KEEPER_STORES = 4
             IS_USING_CONTROLLER = False
-            DEFAULT_RENDERING_ENGINE = "'pygame'"""
+            DEFAULT_RENDERING_ENGINE = "'pygame'"
+            FIXED_TIME_STEP = None
+            MAX_FIXED_TIME_STEPS_PER_FRAME = 5
+            FRAMES_PER_SECOND = 60"""
 
         setattr(important_constants, constant_name, constant_value)
 
@@ -81,3 +116,20 @@ class LibraryChanger:
         """Sets whether the game will be using a controller (important_constants.IS_USING_CONTROLLER) to 'is_using_controller'"""
 
         important_constants.IS_USING_CONTROLLER = is_using_controller
+
+    @staticmethod
+    def set_fixed_time_step(fixed_time_step, max_fixed_time_steps_per_frame=5):
+        """ Makes the game run with a fixed time step. Every frame the time that has passed is added up and the game is run
+            in steps of 'fixed_time_step' until that time is used up. At most 'max_fixed_time_steps_per_frame' steps
+            are run per frame, so the game slows down instead of falling further behind when the computer is too slow.
+            If 'fixed_time_step' is None, the game runs with the measured time between cycles (the default)"""
+
+        important_constants.FIXED_TIME_STEP = fixed_time_step
+        important_constants.MAX_FIXED_TIME_STEPS_PER_FRAME = max_fixed_time_steps_per_frame
+
+    @staticmethod
+    def set_frames_per_second(frames_per_second):
+        """ Sets the frames per second the game tries to run at (only affects pygame). If 'frames_per_second' is None,
+            the game runs as fast as possible (useful for benchmarks)"""
+
+        important_constants.FRAMES_PER_SECOND = frames_per_second
@@ -123,3 +123,22 @@ def max_value(item1, item2):
         return item1
 
     return item1 if item1 > item2 else item2
+
+
+def import_numpy(feature_name):
+    """ Imports NumPy (an optional dependency), so it is only imported by the features that need it
+
+        Args:
+            feature_name (str): the name of the feature that needs NumPy (used in the error message)
+
+         Returns:
+            module: numpy (an ImportError saying 'feature_name' needs NumPy is raised if it is not installed)
+    """
+
+    try:
+        import numpy
+
+    except ImportError as error:
+        raise ImportError(f"{feature_name} need NumPy (pip install numpy)") from error
+
+    return numpy
@@ -0,0 +1,110 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """ A cache that holds at most 'max_size' worth of values. When adding a value would go over that, the least recently
+        used values are removed until it fits. The size of a value comes from 'get_size' (1 per value by default), so the
+        cap can be a number of values or an amount of memory"""
+
+    keys_to_values = None  # OrderedDict; the least recently used key is first
+    keys_to_sizes = {}
+    max_size = 0
+    size = 0
+    get_size = None
+    number_of_hits = 0
+    number_of_misses = 0
+    number_of_evictions = 0
+
+    def __init__(self, max_size, get_size=None):
+        """ Initializes the object
+
+            Args:
+                max_size (int): the most the sizes of the values can add up to
+                get_size (function): get_size(value) -> int; the size of a value (None means every value has a size of 1)
+
+            Returns:
+                None
+        """
+
+        self.max_size = max_size
+        self.get_size = get_size if get_size is not None else lambda value: 1
+        self.keys_to_values = OrderedDict()
+        self.keys_to_sizes = {}
+
+    def get(self, key):
+        """
+             Returns:
+                object: the value of 'key' (None if it is not in the cache); it becomes the most recently used value"""
+
+        value = self.keys_to_values.get(key)
+
+        if value is None:
+            self.number_of_misses += 1
+            return None
+
+        self.number_of_hits += 1
+        self.keys_to_values.move_to_end(key)
+        return value
+
+    def add(self, key, value):
+        """ Adds the value (the least recently used values are removed if the cache is full); a value that is bigger than
+            the cache is not added"""
+
+        self.remove(key)
+        value_size = self.get_size(value)
+
+        if value_size > self.max_size:
+            return
+
+        self.keys_to_values[key] = value
+        self.keys_to_sizes[key] = value_size
+        self.size += value_size
+        self.evict_until_size(self.max_size)
+
+    def evict_until_size(self, max_size):
+        """Removes the least recently used values until the sizes of the values add up to 'max_size' or less"""
+
+        while self.size > max_size:
+            key, value = self.keys_to_values.popitem(last=False)
+            self.size -= self.keys_to_sizes.pop(key)
+            self.number_of_evictions += 1
+
+    def remove(self, key):
+        """Removes the value of 'key' (does nothing if it is not in the cache)"""
+
+        if self.keys_to_values.pop(key, None) is not None:
+            self.size -= self.keys_to_sizes.pop(key)
+
+    def remove_where(self, should_remove):
+        """Removes the values whose keys make should_remove(key) True"""
+
+        for key in [key for key in self.keys_to_values.keys() if should_remove(key)]:
+            self.remove(key)
+
+    def set_max_size(self, max_size):
+        """Sets the most the sizes of the values can add up to (the least recently used values are removed to fit)"""
+
+        self.max_size = max_size
+        self.evict_until_size(max_size)
+
+    def clear(self):
+        """Removes all the values (the statistics are kept)"""
+
+        self.keys_to_values.clear()
+        self.keys_to_sizes.clear()
+        self.size = 0
+
+    def get_statistics(self):
+        """
+             Returns:
+                dict[str, int]: {'number_of_values', 'size', 'max_size', 'number_of_hits', 'number_of_misses',
+                'number_of_evictions'}; how full the cache is and how well it has been working"""
+
+        return {
+            "number_of_values": len(self.keys_to_values),
+            "size": self.size,
+            "max_size": self.max_size,
+            "number_of_hits": self.number_of_hits,
+            "number_of_misses": self.number_of_misses,
+            "number_of_evictions": self.number_of_evictions
+        }
@@ -0,0 +1,216 @@
+import random
+import types
+from array import array
+from contextlib import nullcontext
+
+from game_qu.base.collision_layers import CollisionLayers
+from game_qu.base.engines import CollisionsEngine
+from game_qu.base.important_constants import NUMBER_OF_FRAMES_ROLLBACK_STORES
+from game_qu.base.velocity_calculator import VelocityCalculator
+
+# The types of values that can not change (or are code), so they are never copied or looked inside of
+IMMUTABLE_TYPES = {str, int, float, bool, complex, bytes, range, type(None), type, types.ModuleType, types.FunctionType,
+                   types.BuiltinFunctionType, types.MethodType, types.BuiltinMethodType, property, staticmethod, classmethod}
+CONTAINER_TYPES = {list, dict, set, tuple, frozenset, bytearray, array}
+
+
+class RollbackSnapshot:
+    """ The state of the game at the start of a cycle. Only shallow copies are stored: the attributes of every object and
+        the items of every list, dict, and set that can be reached from the game's state. Restoring puts those copies back
+        into the same objects, so every reference to an object stays valid and the values that can not change are shared"""
+
+    frame_number = None
+    global_values = []  # [owner, attribute_name, value]
+    dicts = []  # [dict, copy_of_dict]; the dicts include the __dict__ of objects
+    sequences = []  # [sequence, copy_of_sequence]; lists, bytearrays, arrays, and NumPy arrays
+    sets = []  # [set, copy_of_set]
+    random_state = None
+
+    def __init__(self, frame_number):
+        """Initializes the object with no state (see Rollback.save())"""
+
+        self.frame_number = frame_number
+        self.global_values, self.dicts, self.sequences, self.sets = [], [], [], []
+
+    def restore(self):
+        """Puts the game back into the state of this snapshot"""
+
+        for owner, attribute_name, value in self.global_values:
+            setattr(owner, attribute_name, value)
+
+        for dictionary, saved_dictionary in self.dicts:
+            dictionary.clear()
+            dictionary.update(saved_dictionary)
+
+        for sequence, saved_sequence in self.sequences:
+            sequence[:] = saved_sequence
+
+        for set_value, saved_set in self.sets:
+            set_value.clear()
+            set_value.update(saved_set)
+
+        random.setstate(self.random_state)
+
+
+class Rollback:
+    """ Saves the whole state of the game every cycle in a ring of NUMBER_OF_FRAMES_ROLLBACK_STORES snapshots (like the
+        HistoryKeeper's frames), so the game can be put back to any of those cycles and run again; for instance, when
+        the input of another player arrives late over the network. The state is the global state a World owns (the
+        HistoryKeeper, VelocityCalculator, Keyboard, screens, and random numbers) and everything that can be reached from
+        it: the components, paths, timed events, etc. Functions (like lambdas) are not saved, so they must not hold state"""
+
+    snapshots = []
+    root_objects = []
+    world = None
+
+    def __init__(self, root_objects=None, world=None, number_of_frames=NUMBER_OF_FRAMES_ROLLBACK_STORES):
+        """ Initializes the object
+
+            Args:
+                root_objects (list[object]): other objects whose state should be saved (the screens added to the game
+                    window are always saved)
+                world (World): the World whose state is saved (None means the global state)
+                number_of_frames (int): the number of cycles that are stored (how far back the game can be put)
+
+            Returns:
+                None
+        """
+
+        self.root_objects = root_objects if root_objects is not None else []
+        self.world = world
+        self.snapshots = [None] * number_of_frames
+
+    def get_world_context(self):
+        """
+             Returns:
+                object: the context manager that makes the World's state be used (if it is not already being used)"""
+
+        return self.world if self.world is not None and not self.world.is_active else nullcontext()
+
+    def save(self, frame_number=None):
+        """Saves the state of the game as it is at the start of cycle 'frame_number' (None means the current cycle)"""
+
+        with self.get_world_context():
+            if frame_number is None:
+                frame_number = VelocityCalculator.current_cycle_number
+
+            self.snapshots[frame_number % len(self.snapshots)] = self.get_snapshot(frame_number)
+
+    def get_snapshot(self, frame_number):
+        """
+             Returns:
+                RollbackSnapshot: the current state of the game"""
+
+        # Importing here, so importing this module does not set the game library
+        from game_qu.base.world import World
+
+        snapshot = RollbackSnapshot(frame_number)
+        dicts, sequences, sets = snapshot.dicts, snapshot.sequences, snapshot.sets
+        immutable_types, container_types = IMMUTABLE_TYPES, CONTAINER_TYPES
+        values_to_visit = list(self.root_objects)
+        # The collision layers are settings that are shared by every World (not the state of the game)
+        visited_ids = {id(self), id(self.snapshots), id(CollisionLayers.pair_matrix)}
+        add_visited_id = visited_ids.add
+
+        for owner, attribute_name, create_value in World.get_state_attributes():
+            value = getattr(owner, attribute_name)
+            snapshot.global_values.append([owner, attribute_name, value])
+
+            if type(value) not in immutable_types:
+                values_to_visit.append(value)
+
+        # Only the values that could change are visited (the immutable ones are filtered out before they are added)
+        while len(values_to_visit) != 0:
+            value = values_to_visit.pop()
+            value_id = id(value)
+
+            if value_id in visited_ids:
+                continue
+
+            add_visited_id(value_id)
+            value_type = type(value)
+
+            # Objects are checked first because most of the values are objects
+            if value_type not in container_types:
+                attributes = getattr(value, "__dict__", None)
+
+                if type(attributes) is dict:
+                    add_visited_id(id(attributes))
+                    dicts.append([attributes, attributes.copy()])
+                    values_to_visit += [item for item in attributes.values() if type(item) not in immutable_types]
+
+                elif value_type.__name__ == "ndarray":
+                    sequences.append([value, value.copy()])
+
+            elif value_type is list:
+                sequences.append([value, value[:]])
+                values_to_visit += [item for item in value if type(item) not in immutable_types]
+
+            elif value_type is dict:
+                dicts.append([value, value.copy()])
+                values_to_visit += [key for key in value.keys() if type(key) not in immutable_types]
+                values_to_visit += [item for item in value.values() if type(item) not in immutable_types]
+
+            elif value_type is set:
+                sets.append([value, value.copy()])
+                values_to_visit += [item for item in value if type(item) not in immutable_types]
+
+            elif value_type is tuple or value_type is frozenset:
+                values_to_visit += [item for item in value if type(item) not in immutable_types]
+
+            else:
+                sequences.append([value, value[:]])
+
+        snapshot.random_state = random.getstate()
+        return snapshot
+
+    def has_frame(self, frame_number):
+        """
+             Returns:
+                bool: whether the state of cycle 'frame_number' is stored (it is overwritten after 'number_of_frames' cycles)"""
+
+        snapshot = self.snapshots[frame_number % len(self.snapshots)]
+        return snapshot is not None and snapshot.frame_number == frame_number
+
+    def restore(self, frame_number):
+        """Puts the game back into the state it was in at the start of cycle 'frame_number' (it must be stored)"""
+
+        if not self.has_frame(frame_number):
+            raise ValueError(f"The state of cycle {frame_number} is not stored")
+
+        with self.get_world_context():
+            self.snapshots[frame_number % len(self.snapshots)].restore()
+
+            # The dimensions CollisionsEngine has cached could be from a cycle that was after this one
+            CollisionsEngine.clear_previous_dimensions()
+
+    def rollback(self, frame_number, run_cycle):
+        """ Puts the game back into the state of cycle 'frame_number' and runs the cycles from there up to the current
+            cycle again (the state of each cycle is saved again, so it can be rolled back to later)
+
+            Args:
+                frame_number (int): the cycle to go back to
+                run_cycle (function): run_cycle() -> None; runs one cycle of the game and adds one to
+                    VelocityCalculator.current_cycle_number (like World.run_cycle()); it should give the game the input
+                    of that cycle (which can be different than what was used the first time)
+
+            Returns:
+                int: the number of cycles that were run again
+        """
+
+        with self.get_world_context():
+            current_cycle_number = VelocityCalculator.current_cycle_number
+
+        self.restore(frame_number)
+        number_of_cycles = current_cycle_number - frame_number
+
+        for x in range(number_of_cycles):
+            self.save()
+            run_cycle()
+
+        return number_of_cycles
+
+    def clear(self):
+        """Removes all the saved states"""
+
+        self.snapshots = [None] * len(self.snapshots)
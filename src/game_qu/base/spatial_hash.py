@@ -0,0 +1,200 @@
+import math
+
+
+class SpatialHash:
+    """ A broad phase for collisions: a uniform grid where every object is stored in the cells it overlaps. Only objects
+        that share a cell can have collided, so get_candidate_pairs() returns far fewer pairs than checking every object
+        against every other object. The grid is updated incrementally; an object is only moved to other cells if the cells
+        it overlaps have changed"""
+
+    cell_size = None
+    cells = {}  # (column, row) -> {id(object): object}
+    object_ids_to_cell_bounds = {}  # id(object) -> [first_column, first_row, last_column, last_row]
+    object_ids_to_objects = {}
+    object_ids_to_layers = {}
+    pair_matrix = None
+
+    def __init__(self, cell_size=None, pair_matrix=None):
+        """ Initializes the object
+
+            Args:
+                cell_size (float): the length and height of each cell; None means it is the average length and height of
+                    the objects first given to update_all(). A cell size around the size of a typical object works best
+                pair_matrix (list[list[bool]]): [layer1][layer2] is whether objects on those layers can collide (see
+                    CollisionLayers.pair_matrix); pairs that can not collide are never returned. None means every pair can
+
+            Returns:
+                None
+        """
+
+        self.cell_size = cell_size
+        self.pair_matrix = pair_matrix
+        self.cells = {}
+        self.object_ids_to_cell_bounds = {}
+        self.object_ids_to_objects = {}
+        self.object_ids_to_layers = {}
+
+    def get_cell_bounds(self, game_object):
+        """
+             Returns:
+                list[int]: [first_column, first_row, last_column, last_row]; the cells 'game_object' overlaps"""
+
+        cell_size = self.cell_size
+
+        return [math.floor(game_object.left_edge / cell_size), math.floor(game_object.top_edge / cell_size),
+                math.floor(game_object.right_edge / cell_size), math.floor(game_object.bottom_edge / cell_size)]
+
+    def update(self, game_object, layer=0):
+        """Adds the object to the cells it overlaps (it is removed from the cells it no longer overlaps); 'layer' is its collision layer"""
+
+        object_id = id(game_object)
+        self.object_ids_to_layers[object_id] = layer
+        cell_bounds = self.get_cell_bounds(game_object)
+        previous_cell_bounds = self.object_ids_to_cell_bounds.get(object_id)
+
+        if cell_bounds == previous_cell_bounds:
+            return
+
+        if previous_cell_bounds is not None:
+            self._remove_from_cells(object_id, previous_cell_bounds)
+
+        first_column, first_row, last_column, last_row = cell_bounds
+
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self.cells.get((column, row))
+
+                if cell is None:
+                    cell = self.cells[(column, row)] = {}
+
+                cell[object_id] = game_object
+
+        self.object_ids_to_cell_bounds[object_id] = cell_bounds
+        self.object_ids_to_objects[object_id] = game_object
+
+    def remove(self, game_object):
+        """Removes the object from the SpatialHash (does nothing if it is not in it)"""
+
+        object_id = id(game_object)
+        cell_bounds = self.object_ids_to_cell_bounds.pop(object_id, None)
+
+        if cell_bounds is not None:
+            self._remove_from_cells(object_id, cell_bounds)
+            del self.object_ids_to_objects[object_id]
+            del self.object_ids_to_layers[object_id]
+
+    def _remove_from_cells(self, object_id, cell_bounds):
+        """Removes the object from the cells within 'cell_bounds' (empty cells are deleted)"""
+
+        first_column, first_row, last_column, last_row = cell_bounds
+
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self.cells[(column, row)]
+                del cell[object_id]
+
+                if len(cell) == 0:
+                    del self.cells[(column, row)]
+
+    def update_all(self, game_objects, layers=None):
+        """ Updates every object in 'game_objects' and removes the objects that are not in 'game_objects' anymore; 'layers'
+            are the collision layers of the objects (None means they are all on layer 0)"""
+
+        if self.cell_size is None and len(game_objects) != 0:
+            total_size = sum(game_object.length + game_object.height for game_object in game_objects)
+            self.cell_size = max(total_size / (len(game_objects) * 2), 1)
+
+        current_object_ids = {id(game_object) for game_object in game_objects}
+
+        for object_id in list(self.object_ids_to_objects.keys()):
+            if object_id not in current_object_ids:
+                self.remove(self.object_ids_to_objects[object_id])
+
+        for index, game_object in enumerate(game_objects):
+            self.update(game_object, layers[index] if layers is not None else 0)
+
+    def get_candidate_pairs(self):
+        """
+             Returns:
+                list[list[object]]: [object1, object2]; every pair of objects that share a cell (each pair is only
+                returned once). Only these pairs could have collided"""
+
+        candidate_pairs = []
+        found_pair_ids = set()
+
+        for cell in self.cells.values():
+            if len(cell) < 2:
+                continue
+
+            for object_items1, object_items2 in self._get_layer_groups_that_can_collide(cell):
+                is_same_group = object_items1 is object_items2
+
+                for i in range(len(object_items1)):
+                    object1_id, object1 = object_items1[i]
+
+                    for j in range(i + 1 if is_same_group else 0, len(object_items2)):
+                        object2_id, object2 = object_items2[j]
+                        pair_id = (object1_id, object2_id) if object1_id < object2_id else (object2_id, object1_id)
+
+                        if pair_id not in found_pair_ids:
+                            found_pair_ids.add(pair_id)
+                            candidate_pairs.append([object1, object2])
+
+        return candidate_pairs
+
+    def _get_layer_groups_that_can_collide(self, cell):
+        """
+             Returns:
+                list[list[object]]: [object_items1, object_items2]; the groups of the cell's objects (items of
+                [object_id, object]) whose layers can collide (the objects of the same layer are one group)"""
+
+        if self.pair_matrix is None:
+            object_items = list(cell.items())
+            return [[object_items, object_items]]
+
+        layers_to_object_items = {}
+
+        for object_id, game_object in cell.items():
+            layer = self.object_ids_to_layers[object_id]
+
+            if layer not in layers_to_object_items:
+                layers_to_object_items[layer] = []
+
+            layers_to_object_items[layer].append((object_id, game_object))
+
+        layers = list(layers_to_object_items.keys())
+        layer_groups = []
+
+        for i in range(len(layers)):
+            for j in range(i, len(layers)):
+                if self.pair_matrix[layers[i]][layers[j]]:
+                    layer_groups.append([layers_to_object_items[layers[i]], layers_to_object_items[layers[j]]])
+
+        return layer_groups
+
+    def get_nearby_objects(self, game_object):
+        """
+             Returns:
+                list[object]: the objects that share a cell with where 'game_object' is (it does not have to be in the
+                SpatialHash)"""
+
+        if self.cell_size is None:
+            return []
+
+        nearby_objects = {}
+        first_column, first_row, last_column, last_row = self.get_cell_bounds(game_object)
+
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                nearby_objects.update(self.cells.get((column, row), {}))
+
+        nearby_objects.pop(id(game_object), None)
+        return list(nearby_objects.values())
+
+    def clear(self):
+        """Removes all the objects from the SpatialHash"""
+
+        self.cells = {}
+        self.object_ids_to_cell_bounds = {}
+        self.object_ids_to_objects = {}
+        self.object_ids_to_layers = {}
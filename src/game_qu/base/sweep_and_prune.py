@@ -0,0 +1,183 @@
+from game_qu.base.engines import CollisionsEngine
+
+
+class SweepAndPrune:
+    """ A broad phase for collisions that keeps the left and right edges of every object sorted along the x axis. Because
+        objects barely move between cycles, the edges are still almost sorted every cycle, so an insertion sort puts them
+        back in order in close to linear time. This works best for screens where objects are spread out horizontally (like
+        a side scroller). Every cycle it also figures out which overlapping pairs started, kept, and stopped overlapping"""
+
+    endpoints = []  # [edge_value, is_right_edge, object_id]; sorted by edge value (left edges before right edges)
+    object_ids_to_endpoints = {}  # id(object) -> [left_endpoint, right_endpoint]
+    object_ids_to_objects = {}
+    object_ids_to_layers = {}
+    pair_matrix = None
+    overlapping_pairs = {}  # (object1_id, object2_id) -> [object1, object2]
+    entered_pairs = []
+    stayed_pairs = []
+    exited_pairs = []
+
+    def __init__(self, pair_matrix=None):
+        """ Initializes the object
+
+            Args:
+                pair_matrix (list[list[bool]]): [layer1][layer2] is whether objects on those layers can collide (see
+                    CollisionLayers.pair_matrix); pairs that can not collide are never returned. None means every pair can
+
+            Returns:
+                None
+        """
+
+        self.pair_matrix = pair_matrix
+        self.endpoints = []
+        self.object_ids_to_endpoints = {}
+        self.object_ids_to_objects = {}
+        self.object_ids_to_layers = {}
+        self.overlapping_pairs = {}
+        self.entered_pairs, self.stayed_pairs, self.exited_pairs = [], [], []
+
+    def update(self, game_object, layer=0):
+        """ Adds the object or updates where its edges are and its collision layer (update_all() or sort_endpoints() must
+            be called afterwards)"""
+
+        object_id = id(game_object)
+        self.object_ids_to_layers[object_id] = layer
+        object_endpoints = self.object_ids_to_endpoints.get(object_id)
+
+        if object_endpoints is None:
+            object_endpoints = [[game_object.left_edge, False, object_id], [game_object.right_edge, True, object_id]]
+            self.object_ids_to_endpoints[object_id] = object_endpoints
+            self.object_ids_to_objects[object_id] = game_object
+            self.endpoints += object_endpoints
+
+        else:
+            object_endpoints[0][0] = game_object.left_edge
+            object_endpoints[1][0] = game_object.right_edge
+
+    def remove(self, game_object):
+        """Removes the object from the SweepAndPrune (does nothing if it is not in it)"""
+
+        object_id = id(game_object)
+
+        if self.object_ids_to_endpoints.pop(object_id, None) is not None:
+            del self.object_ids_to_objects[object_id]
+            del self.object_ids_to_layers[object_id]
+            self.endpoints = [endpoint for endpoint in self.endpoints if endpoint[2] != object_id]
+
+    def sort_endpoints(self):
+        """Sorts the endpoints with an insertion sort (fast because they are almost sorted from the last cycle)"""
+
+        endpoints = self.endpoints
+
+        for i in range(1, len(endpoints)):
+            endpoint = endpoints[i]
+            edge_value, is_right_edge = endpoint[0], endpoint[1]
+            j = i - 1
+
+            # Left edges go before right edges with the same value, so touching objects count as overlapping
+            while j >= 0 and (endpoints[j][0] > edge_value or (endpoints[j][0] == edge_value and endpoints[j][1] > is_right_edge)):
+                endpoints[j + 1] = endpoints[j]
+                j -= 1
+
+            endpoints[j + 1] = endpoint
+
+    def update_all(self, game_objects, layers=None):
+        """ Updates every object in 'game_objects,' removes the objects that are not in 'game_objects' anymore, and updates
+            the overlapping pairs (see get_overlapping_pairs(), get_entered_pairs(), get_stayed_pairs(), and get_exited_pairs());
+            'layers' are the collision layers of the objects (None means they are all on layer 0)"""
+
+        current_object_ids = {id(game_object) for game_object in game_objects}
+        removed_object_ids = [object_id for object_id in self.object_ids_to_objects.keys() if object_id not in current_object_ids]
+
+        if len(removed_object_ids) != 0:
+            for object_id in removed_object_ids:
+                del self.object_ids_to_endpoints[object_id]
+                del self.object_ids_to_objects[object_id]
+                del self.object_ids_to_layers[object_id]
+
+            self.endpoints = [endpoint for endpoint in self.endpoints if endpoint[2] in current_object_ids]
+
+        for index, game_object in enumerate(game_objects):
+            self.update(game_object, layers[index] if layers is not None else 0)
+
+        self.sort_endpoints()
+        self.update_overlapping_pairs()
+
+    def update_overlapping_pairs(self):
+        """Sweeps through the sorted endpoints to find the overlapping pairs and whether they entered, stayed, or exited"""
+
+        previous_overlapping_pairs = self.overlapping_pairs
+        overlapping_pairs = {}
+        object_ids_to_objects, object_ids_to_layers, pair_matrix = self.object_ids_to_objects, self.object_ids_to_layers, self.pair_matrix
+        active_objects = {}  # The objects whose left edge has been passed, but not their right edge
+
+        for edge_value, is_right_edge, object_id in self.endpoints:
+            if is_right_edge:
+                del active_objects[object_id]
+                continue
+
+            game_object = object_ids_to_objects[object_id]
+            layer = object_ids_to_layers[object_id]
+
+            # Every active object overlaps horizontally, so only the layers and the vertical collision have to be checked
+            for other_object_id, other_object in active_objects.items():
+                layers_can_collide = pair_matrix is None or pair_matrix[layer][object_ids_to_layers[other_object_id]]
+
+                if layers_can_collide and CollisionsEngine.is_vertical_collision(other_object, game_object):
+                    pair_id = (other_object_id, object_id) if other_object_id < object_id else (object_id, other_object_id)
+                    overlapping_pairs[pair_id] = [other_object, game_object]
+
+            active_objects[object_id] = game_object
+
+        self.entered_pairs, self.stayed_pairs = [], []
+
+        for pair_id, pair in overlapping_pairs.items():
+            if pair_id in previous_overlapping_pairs:
+                self.stayed_pairs.append(pair)
+
+            else:
+                self.entered_pairs.append(pair)
+
+        self.exited_pairs = [pair for pair_id, pair in previous_overlapping_pairs.items() if pair_id not in overlapping_pairs]
+        self.overlapping_pairs = overlapping_pairs
+
+    def get_candidate_pairs(self):
+        """
+             Returns:
+                list[list[object]]: [object1, object2]; every pair of objects that overlaps (the same as get_overlapping_pairs())"""
+
+        return self.get_overlapping_pairs()
+
+    def get_overlapping_pairs(self):
+        """
+             Returns:
+                list[list[object]]: [object1, object2]; every pair of objects that overlapped when update_all() was last called"""
+
+        return list(self.overlapping_pairs.values())
+
+    def get_entered_pairs(self):
+        """
+             Returns:
+                list[list[object]]: [object1, object2]; the pairs that started overlapping when update_all() was last called"""
+
+        return self.entered_pairs
+
+    def get_stayed_pairs(self):
+        """
+             Returns:
+                list[list[object]]: [object1, object2]; the pairs that overlapped the last two times update_all() was called"""
+
+        return self.stayed_pairs
+
+    def get_exited_pairs(self):
+        """
+             Returns:
+                list[list[object]]: [object1, object2]; the pairs that stopped overlapping (or had an object removed) when
+                update_all() was last called"""
+
+        return self.exited_pairs
+
+    def clear(self):
+        """Removes all the objects from the SweepAndPrune"""
+
+        self.__init__(self.pair_matrix)
@@ -1,3 +0,0 @@
-"""A list of unique identifiers. This can be used for the HistoryKeeper to make hashing quicker and safer (the list is
-only so long however)."""
-unique_ids = ['1', '11', '12', '13', '14', '15', '16', '17', '18', '19', '10', '1-', '1=', '1q', '1w', '1e', '1r', '1t', '1y', '1u', '1i', '1o', '1p', '1[', '1]', '1a', '1s', '1d', '1f', '1g', '1h', '1j', '1k', '1l', '1;', "1'", '1z', '1c', '1v', '1b', '1n', '1m', '1,', '1.', '1/', '1~', '1!', '1@', '1#', '1$', '1%', '1^', '1&', '1*', '1(', '1)', '1_', '1+', '1Q', '1W', '1E', '1R', '1T', '1Y', '1U', '1I', '1O', '1P', '1{', '1}', '1A', '1S', '1D', '1F', '1G', '1H', '1J', '1K', '1L', '1:', '1Z', '1X', '1C', '1V', '1B', '1N', '1M', '1<', '1>', '1?', '2', '21', '22', '23', '24', '25', '26', '27', '28', '29', '20', '2-', '2=', '2q', '2w', '2e', '2r', '2t', '2y', '2u', '2i', '2o', '2p', '2[', '2]', '2a', '2s', '2d', '2f', '2g', '2h', '2j', '2k', '2l', '2;', "2'", '2z', '2c', '2v', '2b', '2n', '2m', '2,', '2.', '2/', '2~', '2!', '2@', '2#', '2$', '2%', '2^', '2&', '2*', '2(', '2)', '2_', '2+', '2Q', '2W', '2E', '2R', '2T', '2Y', '2U', '2I', '2O', '2P', '2{', '2}', '2A', '2S', '2D', '2F', '2G', '2H', '2J', '2K', '2L', '2:', '2Z', '2X', '2C', '2V', '2B', '2N', '2M', '2<', '2>', '2?', '3', '31', '32', '33', '34', '35', '36', '37', '38', '39', '30', '3-', '3=', '3q', '3w', '3e', '3r', '3t', '3y', '3u', '3i', '3o', '3p', '3[', '3]', '3a', '3s', '3d', '3f', '3g', '3h', '3j', '3k', '3l', '3;', "3'", '3z', '3c', '3v', '3b', '3n', '3m', '3,', '3.', '3/', '3~', '3!', '3@', '3#', '3$', '3%', '3^', '3&', '3*', '3(', '3)', '3_', '3+', '3Q', '3W', '3E', '3R', '3T', '3Y', '3U', '3I', '3O', '3P', '3{', '3}', '3A', '3S', '3D', '3F', '3G', '3H', '3J', '3K', '3L', '3:', '3Z', '3X', '3C', '3V', '3B', '3N', '3M', '3<', '3>', '3?', '4', '41', '42', '43', '44', '45', '46', '47', '48', '49', '40', '4-', '4=', '4q', '4w', '4e', '4r', '4t', '4y', '4u', '4i', '4o', '4p', '4[', '4]', '4a', '4s', '4d', '4f', '4g', '4h', '4j', '4k', '4l', '4;', "4'", '4z', '4c', '4v', '4b', '4n', '4m', '4,', '4.', '4/', '4~', '4!', '4@', '4#', '4$', '4%', '4^', '4&', '4*', '4(', '4)', '4_', '4+', '4Q', '4W', '4E', '4R', '4T', '4Y', '4U', '4I', '4O', '4P', '4{', '4}', '4A', '4S', '4D', '4F', '4G', '4H', '4J', '4K', '4L', '4:', '4Z', '4X', '4C', '4V', '4B', '4N', '4M', '4<', '4>', '4?', '5', '51', '52', '53', '54', '55', '56', '57', '58', '59', '50', '5-', '5=', '5q', '5w', '5e', '5r', '5t', '5y', '5u', '5i', '5o', '5p', '5[', '5]', '5a', '5s', '5d', '5f', '5g', '5h', '5j', '5k', '5l', '5;', "5'", '5z', '5c', '5v', '5b', '5n', '5m', '5,', '5.', '5/', '5~', '5!', '5@', '5#', '5$', '5%', '5^', '5&', '5*', '5(', '5)', '5_', '5+', '5Q', '5W', '5E', '5R', '5T', '5Y', '5U', '5I', '5O', '5P', '5{', '5}', '5A', '5S', '5D', '5F', '5G', '5H', '5J', '5K', '5L', '5:', '5Z', '5X', '5C', '5V', '5B', '5N', '5M', '5<', '5>', '5?', '6', '61', '62', '63', '64', '65', '66', '67', '68', '69', '60', '6-', '6=', '6q', '6w', '6e', '6r', '6t', '6y', '6u', '6i', '6o', '6p', '6[', '6]', '6a', '6s', '6d', '6f', '6g', '6h', '6j', '6k', '6l', '6;', "6'", '6z', '6c', '6v', '6b', '6n', '6m', '6,', '6.', '6/', '6~', '6!', '6@', '6#', '6$', '6%', '6^', '6&', '6*', '6(', '6)', '6_', '6+', '6Q', '6W', '6E', '6R', '6T', '6Y', '6U', '6I', '6O', '6P', '6{', '6}', '6A', '6S', '6D', '6F', '6G', '6H', '6J', '6K', '6L', '6:', '6Z', '6X', '6C', '6V', '6B', '6N', '6M', '6<', '6>', '6?', '7', '71', '72', '73', '74', '75', '76', '77', '78', '79', '70', '7-', '7=', '7q', '7w', '7e', '7r', '7t', '7y', '7u', '7i', '7o', '7p', '7[', '7]', '7a', '7s', '7d', '7f', '7g', '7h', '7j', '7k', '7l', '7;', "7'", '7z', '7c', '7v', '7b', '7n', '7m', '7,', '7.', '7/', '7~', '7!', '7@', '7#', '7$', '7%', '7^', '7&', '7*', '7(', '7)', '7_', '7+', '7Q', '7W', '7E', '7R', '7T', '7Y', '7U', '7I', '7O', '7P', '7{', '7}', '7A', '7S', '7D', '7F', '7G', '7H', '7J', '7K', '7L', '7:', '7Z', '7X', '7C', '7V', '7B', '7N', '7M', '7<', '7>', '7?', '8', '81', '82', '83', '84', '85', '86', '87', '88', '89', '80', '8-', '8=', '8q', '8w', '8e', '8r', '8t', '8y', '8u', '8i', '8o', '8p', '8[', '8]', '8a', '8s', '8d', '8f', '8g', '8h', '8j', '8k', '8l', '8;', "8'", '8z', '8c', '8v', '8b', '8n', '8m', '8,', '8.', '8/', '8~', '8!', '8@', '8#', '8$', '8%', '8^', '8&', '8*', '8(', '8)', '8_', '8+', '8Q', '8W', '8E', '8R', '8T', '8Y', '8U', '8I', '8O', '8P', '8{', '8}', '8A', '8S', '8D', '8F', '8G', '8H', '8J', '8K', '8L', '8:', '8Z', '8X', '8C', '8V', '8B', '8N', '8M', '8<', '8>', '8?', '9', '91', '92', '93', '94', '95', '96', '97', '98', '99', '90', '9-', '9=', '9q', '9w', '9e', '9r', '9t', '9y', '9u', '9i', '9o', '9p', '9[', '9]', '9a', '9s', '9d', '9f', '9g', '9h', '9j', '9k', '9l', '9;', "9'", '9z', '9c', '9v', '9b', '9n', '9m', '9,', '9.', '9/', '9~', '9!', '9@', '9#', '9$', '9%', '9^', '9&', '9*', '9(', '9)', '9_', '9+', '9Q', '9W', '9E', '9R', '9T', '9Y', '9U', '9I', '9O', '9P', '9{', '9}', '9A', '9S', '9D', '9F', '9G', '9H', '9J', '9K', '9L', '9:', '9Z', '9X', '9C', '9V', '9B', '9N', '9M', '9<', '9>', '9?', '0', '01', '02', '03', '04', '05', '06', '07', '08', '09', '00', '0-', '0=', '0q', '0w', '0e', '0r', '0t', '0y', '0u', '0i', '0o', '0p', '0[', '0]', '0a', '0s', '0d', '0f', '0g', '0h', '0j', '0k', '0l', '0;', "0'", '0z', '0c', '0v', '0b', '0n', '0m', '0,', '0.', '0/', '0~', '0!', '0@', '0#', '0$', '0%', '0^', '0&', '0*', '0(', '0)', '0_', '0+', '0Q', '0W', '0E', '0R', '0T', '0Y', '0U', '0I', '0O', '0P', '0{', '0}', '0A', '0S', '0D', '0F', '0G', '0H', '0J', '0K', '0L', '0:', '0Z', '0X', '0C', '0V', '0B', '0N', '0M', '0<', '0>', '0?', '-', '-1', '-2', '-3', '-4', '-5', '-6', '-7', '-8', '-9', '-0', '--', '-=', '-q', '-w', '-e', '-r', '-t', '-y', '-u', '-i', '-o', '-p', '-[', '-]', '-a', '-s', '-d', '-f', '-g', '-h', '-j', '-k', '-l', '-;', "-'", '-z', '-c', '-v', '-b', '-n', '-m', '-,', '-.', '-/', '-~', '-!', '-@', '-#', '-$', '-%', '-^', '-&', '-*', '-(', '-)', '-_', '-+', '-Q', '-W', '-E', '-R', '-T', '-Y', '-U', '-I', '-O', '-P', '-{', '-}', '-A', '-S', '-D', '-F', '-G', '-H', '-J', '-K', '-L', '-:', '-Z', '-X', '-C', '-V', '-B', '-N', '-M', '-<', '->', '-?', '=', '=1', '=2', '=3', '=4', '=5', '=6', '=7', '=8', '=9']
\ No newline at end of file
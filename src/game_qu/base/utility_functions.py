@@ -10,25 +10,41 @@ from game_qu.base.fraction import Fraction
 from game_qu.base.important_variables import keyboard, SCREEN_LENGTH, SCREEN_HEIGHT, IS_USING_CONTROLLER
 import random
 
-from game_qu.base.library_abstraction import utility_functions
+from game_qu.base import library_abstraction
 from game_qu.base.range import Range
 
+
+def _get_game_library_function(function_name):
+    """
+             Returns:
+            function: a function that calls the game library's function with the name 'function_name.' The game library
+            is only imported once the function is first called, so importing this module does not import it"""
+
+    def call_game_library_function(*args, **kwargs):
+        return getattr(library_abstraction.utility_functions, function_name)(*args, **kwargs)
+
+    call_game_library_function.__name__ = function_name
+    return call_game_library_function
+
+
 # Retrieving the functions from the game library code
-load_image = getattr(utility_functions, "load_image")
-load_text = getattr(utility_functions, "load_text")
-render_text = getattr(utility_functions, "render_text")
-render_image = getattr(utility_functions, "render_image")
-render_ellipse = getattr(utility_functions, "render_ellipse")
-render_rectangle = getattr(utility_functions, "render_rectangle")
-set_up_window = getattr(utility_functions, "set_up_window")
-key_is_pressed = getattr(utility_functions, "key_is_pressed")
-mouse_was_pressed = getattr(utility_functions, "mouse_was_pressed")
-call_every_cycle = getattr(utility_functions, "call_every_cycle")
-is_mouse_collision = getattr(utility_functions, "is_mouse_collision")
-get_time_passed = getattr(utility_functions, "get_time_passed")
-load_and_transform_image = getattr(utility_functions, "load_and_transform_image")
-get_directional_path_to_image = getattr(utility_functions, "get_directional_path_to_image")
-get_mouse_position = getattr(utility_functions, "get_mouse_position")
+load_image = _get_game_library_function("load_image")
+load_text = _get_game_library_function("load_text")
+render_text = _get_game_library_function("render_text")
+render_image = _get_game_library_function("render_image")
+render_ellipse = _get_game_library_function("render_ellipse")
+render_rectangle = _get_game_library_function("render_rectangle")
+set_clip_rectangle = _get_game_library_function("set_clip_rectangle")
+set_rectangles_to_update = _get_game_library_function("set_rectangles_to_update")
+set_up_window = _get_game_library_function("set_up_window")
+key_is_pressed = _get_game_library_function("key_is_pressed")
+mouse_was_pressed = _get_game_library_function("mouse_was_pressed")
+call_every_cycle = _get_game_library_function("call_every_cycle")
+is_mouse_collision = _get_game_library_function("is_mouse_collision")
+get_time_passed = _get_game_library_function("get_time_passed")
+load_and_transform_image = _get_game_library_function("load_and_transform_image")
+get_directional_path_to_image = _get_game_library_function("get_directional_path_to_image")
+get_mouse_position = _get_game_library_function("get_mouse_position")
 
 def key_is_pressed(key):
     """
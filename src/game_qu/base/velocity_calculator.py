@@ -4,6 +4,7 @@ class VelocityCalculator:
     time = 0
     delta_time = 0
     current_cycle_number = 1
+    interpolation_alpha = 1  # How far the rendered frame is between the last fixed time step and the next one (0 to 1)
 
     @staticmethod
     def get_velocity(unit_of_measurement, amount):
@@ -35,3 +36,17 @@ class VelocityCalculator:
         VelocityCalculator.time = time
         VelocityCalculator.delta_time = time
 
+    @staticmethod
+    def set_interpolation_alpha(interpolation_alpha):
+        """Sets how far the rendered frame is between the last fixed time step and the next one (0 to 1)"""
+
+        VelocityCalculator.interpolation_alpha = interpolation_alpha
+
+    @staticmethod
+    def get_interpolated_value(previous_value, current_value):
+        """
+             Returns:
+                float: the value between 'previous_value' and 'current_value' that should be rendered. If the game is
+                not using a fixed time step this is always 'current_value'"""
+
+        return previous_value + (current_value - previous_value) * VelocityCalculator.interpolation_alpha
@@ -0,0 +1,189 @@
+import random
+from array import array
+
+from game_qu.base.library_changer import LibraryChanger
+from game_qu.base.important_constants import DEFAULT_RENDERING_ENGINE
+
+if not LibraryChanger.get_library_has_been_set():
+    LibraryChanger.set_game_library(DEFAULT_RENDERING_ENGINE)
+
+from game_qu.base.events import Event
+from game_qu.base.history_keeper import HistoryKeeper
+from game_qu.base.keyboard import Keyboard
+from game_qu.base.library_abstraction import keys
+from game_qu.base.library_abstraction import variables
+from game_qu.base.timed_event import TimedEvent
+from game_qu.base.velocity_calculator import VelocityCalculator
+from game_qu.gui_components.window import Window
+
+
+class World:
+    """ Owns all the state of the game engine that is normally global (the HistoryKeeper, VelocityCalculator, Keyboard
+        events, the game window's screens, the random numbers, and the scripted input of the 'null' game library). Every
+        World has its own copy of that state, so many games can be run in one process. A World's state is only used while
+        it is active, so everything (including creating the screens) should be done within 'with world:' or run_cycle()"""
+
+    current_world = None
+
+    state = {}
+    saved_state = {}
+    random_state = None
+    saved_random_state = None
+    saved_world = None
+    is_active = False
+
+    def __init__(self, random_seed=None):
+        """ Initializes the object with fresh state
+
+            Args:
+                random_seed (int): the seed for the World's random numbers (None means it is seeded by the system)
+
+            Returns:
+                None
+        """
+
+        self.state = {}
+
+        for owner, attribute_name, create_value in World.get_state_attributes():
+            self.state[(owner, attribute_name)] = create_value()
+
+        self.random_state = random.Random(random_seed).getstate()
+        self.saved_state = {}
+
+    @staticmethod
+    def get_state_attributes():
+        """
+             Returns:
+                list[list[object]]: [owner, attribute_name, create_value]; all the global attributes a World owns and
+                the functions that create their starting values"""
+
+        state_attributes = [
+            [HistoryKeeper, "last_objects", dict],
+            [HistoryKeeper, "names_to_handles", dict],
+            [HistoryKeeper, "dimensions_history", lambda: array("d")],
+            [HistoryKeeper, "dimensions_history_is_stored", bytearray],
+            [HistoryKeeper, "group_names_to_groups", dict],
+            [HistoryKeeper, "names_to_latest_views", dict],
+            [HistoryKeeper, "names_to_last_cycle_numbers", dict],
+            [HistoryKeeper, "handles_last_cycle_numbers", lambda: array("q")],
+            [HistoryKeeper, "handles_are_evictable", bytearray],
+            [HistoryKeeper, "free_handles", list],
+            [HistoryKeeper, "last_frame_id", lambda: 0],
+            [VelocityCalculator, "time", lambda: 0],
+            [VelocityCalculator, "delta_time", lambda: 0],
+            [VelocityCalculator, "current_cycle_number", lambda: 1],
+            [VelocityCalculator, "interpolation_alpha", lambda: 1],
+            [Keyboard, "key_events", lambda: [Event() for key in keys.keys]],
+            [Keyboard, "key_timed_events", lambda: [TimedEvent(0) for key in keys.keys]],
+            [Keyboard, "button_events", lambda: World.get_button_dictionary(Event)],
+            [Keyboard, "button_timed_events", lambda: World.get_button_dictionary(lambda: TimedEvent(0))],
+            [Keyboard, "mouse_clicked_event", Event],
+            [Window, "screens", list]
+        ]
+
+        if LibraryChanger.current_library_name == "null":
+            state_attributes += [
+                [variables, "pressed_keys", set],
+                [variables, "pressed_buttons", set],
+                [variables, "mouse_is_pressed", lambda: False],
+                [variables, "mouse_position", lambda: (0, 0)]
+            ]
+
+        return state_attributes
+
+    @staticmethod
+    def get_button_dictionary(create_value):
+        """
+             Returns:
+                dict[int, object]: every button to a value made by 'create_value' (empty if controllers are not supported)"""
+
+        if not LibraryChanger.get_library_supports_controllers():
+            return {}
+
+        return {button: create_value() for button in keys.buttons}
+
+    @staticmethod
+    def create_global_variables():
+        """ Creates the keyboard and the game window if they have not been created yet. They are only created the first
+            time they are used, and creating them while a World is active would set up the World's state instead of the
+            global state"""
+
+        # Importing here, so importing this module does not create the game window
+        from game_qu.base.important_variables import keyboard, game_window
+
+        keyboard.get_value()
+        game_window.get_value()
+
+    def activate(self):
+        """Makes the game engine use this World's state (the state that was being used is restored by deactivate())"""
+
+        if self.is_active:
+            raise ValueError("This World is already active")
+
+        World.create_global_variables()
+
+        for (owner, attribute_name), value in self.state.items():
+            self.saved_state[(owner, attribute_name)] = getattr(owner, attribute_name)
+            setattr(owner, attribute_name, value)
+
+        self.saved_random_state = random.getstate()
+        random.setstate(self.random_state)
+
+        self.saved_world = World.current_world
+        World.current_world = self
+        self.is_active = True
+
+    def deactivate(self):
+        """Stores the game engine's state in this World and restores the state that was being used before activate()"""
+
+        if not self.is_active:
+            raise ValueError("This World is not active")
+
+        for (owner, attribute_name), saved_value in self.saved_state.items():
+            # The value is gotten again because it could have been replaced (HistoryKeeper.reset() creates a new dict)
+            self.state[(owner, attribute_name)] = getattr(owner, attribute_name)
+            setattr(owner, attribute_name, saved_value)
+
+        self.random_state = random.getstate()
+        random.setstate(self.saved_random_state)
+
+        self.saved_state = {}
+        World.current_world = self.saved_world
+        self.is_active = False
+
+    def __enter__(self):
+        self.activate()
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.deactivate()
+
+    def add_screen(self, screen):
+        """Adds the screen to this World's screens (the screens that run_cycle() runs)"""
+
+        # Importing here, so importing this module does not create the game window
+        from game_qu.base.important_variables import game_window
+
+        with self:
+            game_window.add_screen(screen)
+
+    def run_cycle(self, delta_time, should_render=False):
+        """Runs one cycle of this World's screens that lasts 'delta_time' (the same as one cycle of run_game())"""
+
+        # Importing here, so importing this module does not create the game window
+        from game_qu.base.important_variables import keyboard, game_window
+
+        with self:
+            VelocityCalculator.set_delta_time(delta_time)
+
+            keyboard.run()
+            game_window.run(should_render)
+
+            HistoryKeeper.set_last_frame_id(VelocityCalculator.current_cycle_number)
+            VelocityCalculator.current_cycle_number += 1
+
+    def run_cycles(self, delta_time, number_of_cycles, should_render=False):
+        """Runs 'number_of_cycles' cycles of this World's screens that each last 'delta_time'"""
+
+        for x in range(number_of_cycles):
+            self.run_cycle(delta_time, should_render)
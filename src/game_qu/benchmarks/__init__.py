@@ -0,0 +1,2 @@
+"""Holds the benchmarks for the hot paths of the game engine (collisions, the HistoryKeeper, paths, the Keyboard, and the
+Window). They all run with the 'null' game library, so no display is needed. Run them with 'python -m game_qu.benchmarks'"""
@@ -0,0 +1,71 @@
+"""Runs the benchmarks and writes the results as JSON. If a baseline is given, the results are compared against it and the
+exit code is 1 if any benchmark got slower than allowed"""
+
+import argparse
+import json
+import platform
+import sys
+
+from game_qu.benchmarks.engine_benchmarks import run_benchmarks, compare_results, get_benchmark_creators
+from game_qu.benchmarks.import_time_benchmarks import run_import_time_benchmarks
+
+
+def main():
+    """Runs the benchmarks with the command line arguments"""
+
+    parser = argparse.ArgumentParser(prog="python -m game_qu.benchmarks", description="Benchmarks the hot paths of the game engine")
+    parser.add_argument("--output", help="the path of the JSON file the results are written to (printed if not given)")
+    parser.add_argument("--compare", help="the path of a JSON file with baseline results to compare against")
+    parser.add_argument("--allowed-slowdown", type=float, default=.1, help="how much slower than the baseline is allowed (.1 is 10%%)")
+    parser.add_argument("--minimum-time", type=float, default=.2, help="the minimum time (in seconds) of each timed batch")
+    parser.add_argument("--repeats", type=int, default=5, help="the number of timed batches (the fastest is used)")
+    parser.add_argument("--benchmark", action="append", help="the name of a benchmark to run (can be given multiple times)")
+    parser.add_argument("--list", action="store_true", help="lists the names of the benchmarks")
+    parser.add_argument("--skip-import-times", action="store_true", help="does not measure how long importing the modules takes")
+    arguments = parser.parse_args()
+
+    if arguments.list:
+        print("\n".join(get_benchmark_creators().keys()))
+        return 0
+
+    results = run_benchmarks(arguments.benchmark, arguments.minimum_time, arguments.repeats)
+
+    if not arguments.skip_import_times and arguments.benchmark is None:
+        results.update(run_import_time_benchmarks(arguments.repeats))
+
+    # Importing a module that should be light must never import the game library
+    imports_game_library = False
+
+    for name, result in results.items():
+        if len(result.get("imported_game_library_modules", [])) != 0:
+            imports_game_library = True
+            print(f"{name}: imported {', '.join(result['imported_game_library_modules'])} REGRESSION", file=sys.stderr)
+
+    output = {"python_version": platform.python_version(), "platform": platform.platform(), "results": results}
+
+    if arguments.output is not None:
+        with open(arguments.output, "w") as file:
+            json.dump(output, file, indent=4)
+
+    else:
+        print(json.dumps(output, indent=4))
+
+    if arguments.compare is None:
+        return 1 if imports_game_library else 0
+
+    with open(arguments.compare) as file:
+        baseline_results = json.load(file)["results"]
+
+    comparison = compare_results(results, baseline_results, arguments.allowed_slowdown)
+    has_regression = False
+
+    for name, values in comparison.items():
+        status = "REGRESSION" if values["is_regression"] else "ok"
+        has_regression |= values["is_regression"]
+        print(f"{name}: {values['baseline'] * 1000:.4f} ms -> {values['current'] * 1000:.4f} ms ({values['ratio']:.2f}x) {status}")
+
+    return 1 if has_regression or imports_game_library else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
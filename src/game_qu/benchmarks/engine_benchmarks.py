@@ -0,0 +1,370 @@
+import random
+import time
+
+from game_qu.base.library_changer import LibraryChanger
+
+if not LibraryChanger.get_library_has_been_set():
+    LibraryChanger.set_game_library("null")
+
+from game_qu.base.engines import CollisionsEngine
+from game_qu.base.history_keeper import HistoryKeeper
+from game_qu.base.rollback import Rollback
+from game_qu.base.important_variables import keyboard, game_window, KEY_A, KEY_D, KEY_W, KEY_S, KEY_F, SCREEN_LENGTH, SCREEN_HEIGHT
+from game_qu.base.velocity_calculator import VelocityCalculator
+from game_qu.base.world import World
+from game_qu.gui_components.component import Component
+from game_qu.gui_components.dimensions import Dimensions
+from game_qu.gui_components.screen import Screen
+from game_qu.math.bounded_function import BoundedFunction
+from game_qu.math.matrix import Matrix
+from game_qu.math.piecewise_function import PiecewiseFunction
+from game_qu.math.point import Point
+from game_qu.math.polynomial import Polynomial, PolynomialTerm
+from game_qu.paths.velocity_followable_path import VelocityFollowablePath
+from game_qu.platformer.platform import Platform
+from game_qu.platformer.platformer_screen import PlatformerScreen
+from game_qu.platformer.player import Player
+
+NUMBER_OF_QUERIES = 1000
+
+
+class BenchmarkPlatformerScreen(PlatformerScreen):
+    """A PlatformerScreen with one player and 'number_of_platforms' platforms spread across the screen"""
+
+    def __init__(self, number_of_platforms, broad_phase_name="spatial_hash"):
+        """Initializes the object"""
+
+        self.broad_phase_name = broad_phase_name
+        super().__init__()
+
+        platform_length = SCREEN_LENGTH / max(number_of_platforms, 1)
+
+        for x in range(number_of_platforms - 1):
+            top_edge = random.uniform(SCREEN_HEIGHT * .3, SCREEN_HEIGHT * .9)
+            self.platforms.append(Platform(platform_length * x, top_edge, platform_length * .8, SCREEN_HEIGHT * .05))
+
+    def get_enemy_types(self):
+        return []
+
+    def get_game_difficulty(self):
+        return 0
+
+    def get_score_from_passing_platform(self):
+        return 1
+
+    def get_start_platform_coordinates(self):
+        return [0, SCREEN_HEIGHT * .85, SCREEN_LENGTH * .5, SCREEN_HEIGHT * .15]
+
+    def get_players(self):
+        return [Player(KEY_A, KEY_D, KEY_W, KEY_S, KEY_F)]
+
+
+def get_random_dimensions(number_of_dimensions):
+    """
+         Returns:
+            list[Dimensions]: 'number_of_dimensions' Dimensions that are randomly placed on the screen"""
+
+    all_dimensions = []
+
+    for x in range(number_of_dimensions):
+        length, height = random.uniform(10, 60), random.uniform(10, 60)
+        dimensions = Dimensions(random.uniform(0, SCREEN_LENGTH - length), random.uniform(0, SCREEN_HEIGHT - height), length, height)
+        dimensions.name = f"dimensions{x}"
+        all_dimensions.append(dimensions)
+
+    return all_dimensions
+
+
+def create_collisions_engine_benchmark(number_of_objects):
+    """
+         Returns:
+            function: runs CollisionsEngine.is_collision() on every pair of 'number_of_objects' objects"""
+
+    all_dimensions = get_random_dimensions(number_of_objects)
+
+    def run_benchmark():
+        for x in range(len(all_dimensions)):
+            object1 = all_dimensions[x]
+
+            for y in range(x + 1, len(all_dimensions)):
+                CollisionsEngine.is_collision(object1, all_dimensions[y])
+
+    return run_benchmark
+
+
+def create_run_all_collisions_benchmark(number_of_platforms, broad_phase_name="spatial_hash"):
+    """
+         Returns:
+            function: runs PlatformerScreen.run_all_collisions() with 'number_of_platforms' platforms using the broad phase
+            'broad_phase_name'"""
+
+    world = World(0)
+
+    with world:
+        screen = BenchmarkPlatformerScreen(number_of_platforms, broad_phase_name)
+
+    def run_benchmark():
+        with world:
+            screen.run_all_collisions()
+
+    return run_benchmark
+
+
+def create_history_keeper_benchmark(number_of_objects):
+    """
+         Returns:
+            function: adds 'number_of_objects' objects to the HistoryKeeper and gets them from the last cycle"""
+
+    world = World(0)
+    all_dimensions = get_random_dimensions(number_of_objects)
+
+    def run_benchmark():
+        with world:
+            for dimensions in all_dimensions:
+                HistoryKeeper.add(dimensions, dimensions.name, needs_dimensions_only=True)
+
+            HistoryKeeper.set_last_frame_id(VelocityCalculator.current_cycle_number)
+            VelocityCalculator.current_cycle_number += 1
+
+            for dimensions in all_dimensions:
+                HistoryKeeper.get_last(dimensions.name)
+
+    return run_benchmark
+
+
+def create_history_keeper_handles_benchmark(number_of_objects):
+    """
+         Returns:
+            function: adds the dimensions of 'number_of_objects' objects to the HistoryKeeper using handles and gets them
+            from the last cycle"""
+
+    world = World(0)
+    all_dimensions = get_random_dimensions(number_of_objects)
+
+    with world:
+        handles = [HistoryKeeper.register(dimensions.name) for dimensions in all_dimensions]
+
+    def run_benchmark():
+        with world:
+            for x in range(len(all_dimensions)):
+                HistoryKeeper.add_dimensions(handles[x], all_dimensions[x])
+
+            HistoryKeeper.set_last_frame_id(VelocityCalculator.current_cycle_number)
+            VelocityCalculator.current_cycle_number += 1
+
+            for handle in handles:
+                HistoryKeeper.get_last_dimensions(handle)
+
+    return run_benchmark
+
+
+def create_rollback_benchmark(number_of_platforms, number_of_frames):
+    """
+         Returns:
+            function: puts a PlatformerScreen with 'number_of_platforms' platforms back 'number_of_frames' cycles and runs
+            those cycles again (a rollback has to fit within one frame)"""
+
+    world = World(0)
+
+    with world:
+        screen = BenchmarkPlatformerScreen(number_of_platforms)
+
+    world.add_screen(screen)
+    rollback = Rollback(world=world, number_of_frames=number_of_frames)
+
+    for x in range(number_of_frames):
+        rollback.save()
+        world.run_cycle(1 / 60)
+
+    def run_benchmark():
+        with world:
+            frame_number = VelocityCalculator.current_cycle_number - number_of_frames
+
+        rollback.rollback(frame_number, lambda: world.run_cycle(1 / 60))
+
+    return run_benchmark
+
+
+def create_piecewise_function_benchmark(number_of_functions):
+    """
+         Returns:
+            function: calls PiecewiseFunction.get_y_coordinate() NUMBER_OF_QUERIES times on a piecewise function that has
+            'number_of_functions' functions"""
+
+    functions = []
+
+    for x in range(number_of_functions):
+        polynomial = Polynomial(Matrix([])).set_terms([PolynomialTerm(x, 2), PolynomialTerm(1, 1), PolynomialTerm(x, 0)])
+        functions.append(BoundedFunction(polynomial, x, x + 1))
+
+    piecewise_function = PiecewiseFunction(functions)
+    x_coordinates = [random.uniform(0, number_of_functions) for x in range(NUMBER_OF_QUERIES)]
+
+    def run_benchmark():
+        for x_coordinate in x_coordinates:
+            piecewise_function.get_y_coordinate(x_coordinate)
+
+    return run_benchmark
+
+
+def create_velocity_followable_path_benchmark(number_of_points):
+    """
+         Returns:
+            function: calls VelocityFollowablePath.get_coordinates_at_time() NUMBER_OF_QUERIES times on a path that has
+            'number_of_points' points"""
+
+    points = [Point(random.uniform(0, SCREEN_LENGTH), random.uniform(0, SCREEN_HEIGHT)) for x in range(number_of_points)]
+    path = VelocityFollowablePath(Point(0, 0), points, 100)
+    times = [random.uniform(0, path.max_time) for x in range(NUMBER_OF_QUERIES)]
+
+    def run_benchmark():
+        for path_time in times:
+            path.get_coordinates_at_time(path_time)
+
+    return run_benchmark
+
+
+def create_keyboard_benchmark():
+    """
+         Returns:
+            function: runs Keyboard.run()"""
+
+    world = World(0)
+
+    def run_benchmark():
+        with world:
+            keyboard.run()
+
+    return run_benchmark
+
+
+def create_window_benchmark(number_of_components):
+    """
+         Returns:
+            function: runs and renders one frame of a Window that has a screen with 'number_of_components' components"""
+
+    world = World(0)
+
+    with world:
+        screen = Screen()
+        screen.components = []
+
+        for dimensions in get_random_dimensions(number_of_components):
+            component = Component()
+            component.number_set_dimensions(dimensions.left_edge, dimensions.top_edge, dimensions.length, dimensions.height)
+            screen.components.append(component)
+
+    world.add_screen(screen)
+
+    def run_benchmark():
+        with world:
+            game_window.run(True)
+
+    return run_benchmark
+
+
+def get_benchmark_creators():
+    """
+         Returns:
+            dict[str, function]: the name of each benchmark to the function that creates it (creating it does the setup
+            that should not be timed)"""
+
+    benchmark_creators = {}
+
+    for number_of_objects in [10, 100, 1000]:
+        benchmark_creators[f"collisions_engine_{number_of_objects}_objects"] = lambda n=number_of_objects: create_collisions_engine_benchmark(n)
+
+    for number_of_platforms in [10, 100, 300]:
+        benchmark_creators[f"run_all_collisions_{number_of_platforms}_platforms"] = lambda n=number_of_platforms: create_run_all_collisions_benchmark(n)
+
+    benchmark_creators["run_all_collisions_300_platforms_sweep_and_prune"] = lambda: create_run_all_collisions_benchmark(300, "sweep_and_prune")
+    benchmark_creators["history_keeper_1000_objects"] = lambda: create_history_keeper_benchmark(1000)
+    benchmark_creators["history_keeper_1000_objects_handles"] = lambda: create_history_keeper_handles_benchmark(1000)
+    benchmark_creators["rollback_8_frames_10_platforms"] = lambda: create_rollback_benchmark(10, 8)
+    benchmark_creators["piecewise_function_10_functions"] = lambda: create_piecewise_function_benchmark(10)
+    benchmark_creators["velocity_followable_path_10_points"] = lambda: create_velocity_followable_path_benchmark(10)
+    benchmark_creators["keyboard_run"] = create_keyboard_benchmark
+
+    for number_of_components in [10, 100, 1000, 10000]:
+        benchmark_creators[f"window_run_{number_of_components}_components"] = lambda n=number_of_components: create_window_benchmark(n)
+
+    return benchmark_creators
+
+
+def time_benchmark(run_benchmark, minimum_time=.2, number_of_repeats=5):
+    """ Times the benchmark by running it in batches that each take at least 'minimum_time' (the fastest batch is used,
+        so noise from other programs affects the result as little as possible)
+
+        Returns:
+            dict[str, float]: {'seconds_per_iteration', 'iterations'}; the time of one run of the benchmark and how many
+            times it was run per batch"""
+
+    # Finding how many iterations are needed for one batch to take at least 'minimum_time'
+    iterations = 1
+
+    while True:
+        start_time = time.perf_counter()
+
+        for x in range(iterations):
+            run_benchmark()
+
+        batch_time = time.perf_counter() - start_time
+
+        if batch_time >= minimum_time:
+            break
+
+        iterations *= 2
+
+    fastest_batch_time = batch_time
+
+    for x in range(number_of_repeats - 1):
+        start_time = time.perf_counter()
+
+        for y in range(iterations):
+            run_benchmark()
+
+        fastest_batch_time = min(fastest_batch_time, time.perf_counter() - start_time)
+
+    return {"seconds_per_iteration": fastest_batch_time / iterations, "iterations": iterations}
+
+
+def run_benchmarks(names=None, minimum_time=.2, number_of_repeats=5):
+    """
+         Returns:
+            dict[str, dict[str, float]]: the name of each benchmark to its result (see time_benchmark()); only the
+            benchmarks with names in 'names' are run (all of them are run if it is None)"""
+
+    results = {}
+
+    for name, create_benchmark in get_benchmark_creators().items():
+        if names is not None and name not in names:
+            continue
+
+        # So every benchmark uses the same random numbers every time it is run
+        random.seed(0)
+        results[name] = time_benchmark(create_benchmark(), minimum_time, number_of_repeats)
+
+    return results
+
+
+def compare_results(results, baseline_results, allowed_slowdown=.1):
+    """
+         Returns:
+            dict[str, dict[str, float]]: the name of each benchmark that is in both results to {'baseline', 'current',
+            'ratio', 'is_regression'}; a ratio above 1 means it got slower and it is a regression if the ratio is more
+            than 1 + 'allowed_slowdown'"""
+
+    comparison = {}
+
+    for name, result in results.items():
+        if name not in baseline_results:
+            continue
+
+        baseline_time = baseline_results[name]["seconds_per_iteration"]
+        current_time = result["seconds_per_iteration"]
+        ratio = current_time / baseline_time if baseline_time != 0 else float("inf")
+
+        comparison[name] = {"baseline": baseline_time, "current": current_time, "ratio": ratio,
+                            "is_regression": ratio > 1 + allowed_slowdown}
+
+    return comparison
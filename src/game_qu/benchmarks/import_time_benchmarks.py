@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+
+# The modules that should be importable without importing a game library or creating the game window
+IMPORT_TARGETS = [
+    "game_qu.math.piecewise_function",
+    "game_qu.math.vector_2d",
+    "game_qu.math.polynomial",
+    "game_qu.math.physics_function",
+    "game_qu.base.utility_functions",
+    "game_qu.base.important_variables"
+]
+GAME_LIBRARY_MODULES = ["pygame", "pyglet", "game_qu.pygame_abstraction.utility_functions",
+                        "game_qu.pyglet_abstraction.utility_functions", "game_qu.null_abstraction.utility_functions"]
+
+
+def measure_import_time(module_name):
+    """ Imports the module in a new Python process (so nothing is already imported) with '-X importtime'
+
+        Returns:
+            list[object]: [import_time, imported_game_library_modules]; the time (in seconds) it took to import all the
+            game_qu modules and the game library modules that were imported (should be empty)"""
+
+    package_directory = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    environment = dict(os.environ, PYTHONPATH=package_directory + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    code = (f"import sys, {module_name}\n"
+            f"print(','.join(name for name in {GAME_LIBRARY_MODULES} if name in sys.modules))")
+
+    completed_process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True,
+                                       text=True, env=environment, check=True)
+
+    # Every line looks like 'import time: self [us] | cumulative | imported package'; the top level game_qu modules are
+    # the ones without indentation, so adding their cumulative times gives the time of importing everything once
+    import_time = 0
+
+    for line in completed_process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        self_time, cumulative_time, imported_module = line[len("import time:"):].split("|")
+
+        if imported_module.strip().startswith("game_qu") and not imported_module[1:].startswith(" "):
+            import_time += int(cumulative_time) / 1_000_000
+
+    imported_game_library_modules = [name for name in completed_process.stdout.strip().split(",") if name != ""]
+    return [import_time, imported_game_library_modules]
+
+
+def run_import_time_benchmarks(number_of_repeats=5):
+    """
+         Returns:
+            dict[str, dict[str, object]]: 'import_{module_name}' to {'seconds_per_iteration', 'iterations',
+            'imported_game_library_modules'}; the fastest import of 'number_of_repeats' imports"""
+
+    results = {}
+
+    for module_name in IMPORT_TARGETS:
+        import_times = []
+        imported_game_library_modules = []
+
+        for x in range(number_of_repeats):
+            import_time, imported_game_library_modules = measure_import_time(module_name)
+            import_times.append(import_time)
+
+        results[f"import_{module_name}"] = {"seconds_per_iteration": min(import_times), "iterations": 1,
+                                            "imported_game_library_modules": imported_game_library_modules}
+
+    return results
@@ -20,6 +20,7 @@ class Component(Dimensions):
     is_visible = True
     should_run_when_not_visible = True
     last_frame_id_when_visible = 0
+    is_dirty = False  # Whether it has to be rendered again even though get_render_state() did not change
     image_length = 1
     image_height = 1
 
@@ -71,8 +72,27 @@ class Component(Dimensions):
         else:
             render_rectangle(self.left_edge, self.top_edge, self.length, self.height, self.color)
 
+        self.update_last_frame_id_when_visible()
+
+    def update_last_frame_id_when_visible(self):
+        """Records that the component was visible this cycle (so it can be clicked next cycle)"""
+
         self.last_frame_id_when_visible = HistoryKeeper.get_frame_id(VelocityCalculator.current_cycle_number)
 
+    def get_render_state(self):
+        """
+             Returns:
+                tuple: (left_edge, top_edge, length, height, ...); everything that decides how the component looks. If the
+                Window is using dirty rectangles, the component is only rendered again when this changes (a component that
+                overrides render() should add what it uses). It must be rendered within its dimensions"""
+
+        return (self.left_edge, self.top_edge, self.length, self.height, self.color, self.path_to_image)
+
+    def mark_dirty(self):
+        """Makes the component be rendered again even if get_render_state() has not changed (see get_render_state())"""
+
+        self.is_dirty = True
+
     def got_clicked(self):
         """
              Returns:
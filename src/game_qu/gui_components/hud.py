@@ -54,6 +54,7 @@ class HUD(Component):
 
         grid = Grid(Dimensions(0, 0, length, height), rows, columns)
         grid.turn_into_grid(self.components, None, None)
+        self.number_set_dimensions(0, 0, length, height)  # So the HUD's dimensions contain its components
 
     def update(self, player_points, high_score=0):
         """Updates the points in the 'player_points_fields' and if the 'high_score_is_needed' it updates the high score in the 'high_score_field'"""
@@ -70,11 +71,19 @@ class HUD(Component):
         for component in self.components:
             component.render()
 
+    def get_render_state(self):
+        """
+             Returns:
+                tuple: everything that decides how the HUD looks (see Component.get_render_state())"""
+
+        return super().get_render_state() + tuple(component.get_render_state() for component in self.components)
+
     def set_dimensions(self, left_edge, top_edge, length, height):
         """Changes the dimensions of the Grid that defines the components layouts"""
 
         grid = Grid(Dimensions(left_edge, top_edge, length, height), self.rows, self.columns)
         grid.turn_into_grid(self.components, None, None)
+        self.number_set_dimensions(left_edge, top_edge, length, height)
 
     def set_rows_and_columns(self, rows, columns):
         """Sets the 'self.rows' and 'self.columns' to the values provided: 'rows' and 'columns'"""
@@ -39,6 +39,8 @@ class IntermediateScreen(Screen):
     def create_screens(self, number_of_screens, texts):
         """Initializes all the screens (equal to the number_of_screens)"""
 
+        self.screens = []
+
         for x in range(number_of_screens):
             screen = Screen()
 
@@ -0,0 +1,79 @@
+from game_qu.base.colors import black, white
+from game_qu.base.frame_profiler import FrameProfiler
+from game_qu.base.timed_event import TimedEvent
+from game_qu.gui_components.component import Component
+from game_qu.gui_components.text_box import TextBox
+
+
+class ProfilerOverlay(Component):
+    """ Shows the slowest phases that the FrameProfiler has recorded (their average, p95, and p99 times in milliseconds).
+        Add it to a screen's components and set its dimensions like any other component. The text is only updated every
+        'update_time' seconds, so the overlay itself barely affects the timings"""
+
+    text_boxes = []
+    update_event = None
+    number_of_phases_shown = 0
+
+    def __init__(self, number_of_phases_shown=8, font_size=12, update_time=.5, background_color=black, text_color=white):
+        """ Initializes the object
+
+            Args:
+                number_of_phases_shown (int): how many phases are shown (the slowest ones are shown)
+                font_size (int): the size of the font
+                update_time (float): how often (in seconds) the text is updated
+                background_color (tuple): the (Red, Green, Blue) values of the overlay's background
+                text_color (tuple): the (Red, Green, Blue) values of the text's color
+
+            Returns:
+                None
+        """
+
+        super().__init__("")
+
+        self.number_of_phases_shown = number_of_phases_shown
+        self.update_event = TimedEvent(update_time)
+        self.update_event.start()
+
+        # One more text box for the header
+        self.text_boxes = [TextBox("", font_size, background_color, text_color, False) for x in range(number_of_phases_shown + 1)]
+
+    def run(self):
+        """Updates the text of the overlay every 'update_time' seconds"""
+
+        self.update_event.run(False, False)
+
+        if self.update_event.is_done():
+            self.update_texts()
+            self.update_event.start()
+
+    def update_texts(self):
+        """Updates the text of the text boxes to the current statistics of the FrameProfiler"""
+
+        all_statistics = list(FrameProfiler.get_all_statistics().items())
+        self.text_boxes[0].set_text("phase: avg / p95 / p99 (ms)")
+
+        for x in range(self.number_of_phases_shown):
+            text = ""
+
+            if x < len(all_statistics):
+                phase_name, statistics = all_statistics[x]
+                text = f"{phase_name}: {statistics['avg'] * 1000:.2f} / {statistics['p95'] * 1000:.2f} / {statistics['p99'] * 1000:.2f}"
+
+            self.text_boxes[x + 1].set_text(text)
+
+    def render(self):
+        """Renders the text boxes onto the screen (each one takes up an equal part of the overlay's height)"""
+
+        text_box_height = self.height / len(self.text_boxes)
+
+        for x in range(len(self.text_boxes)):
+            text_box = self.text_boxes[x]
+            text_box.number_set_dimensions(self.left_edge, self.top_edge + text_box_height * x, self.length, text_box_height)
+            text_box.render()
+
+    def get_render_state(self):
+        """
+             Returns:
+                tuple: everything that decides how the overlay looks (see Component.get_render_state())"""
+
+        return super().get_render_state() + tuple(text_box.text for text_box in self.text_boxes)
@@ -72,5 +72,19 @@ class Screen(Component):
 
         self.path_to_background_image = path_to_background_image
 
+    def get_render_state(self):
+        """
+             Returns:
+                tuple: everything that decides how the screen itself looks (its background and what its render() draws).
+                If the Window is using dirty rectangles, the whole window is rendered again when this changes or
+                mark_dirty() was called. A screen whose render() draws something should add what it uses; if it does
+                not override this, this is None, which makes the whole window be rendered every frame"""
+
+        # The screen draws something in render(), but does not say what it uses, so it could change every frame
+        if type(self).render is not Screen.render and type(self).get_render_state is Screen.get_render_state:
+            return None
+
+        return (self.path_to_background_image, self.background_color)
+
     def render(self):
         pass
@@ -52,6 +52,14 @@ class TextBox(Component):
         render_text(left_edge, top_edge, self.text_color, self.background_color, self.text, self.font_size,
                     self.is_centered, self.name, is_rendering_background=self.is_rendering_background)
 
+    def get_render_state(self):
+        """
+             Returns:
+                tuple: everything that decides how the TextBox looks (see Component.get_render_state())"""
+
+        return super().get_render_state() + (self.text, self.font_size, self.text_color, self.background_color,
+                                             self.is_centered, self.is_rendering_background)
+
     def set_background_color(self, background_color):
         """Sets the background_color of the TextBox by setting 'self.color' and 'self.background_color' to the value provided ('background_color')"""
 
@@ -1,13 +1,29 @@
+import math
+
 from game_qu.base.count_event import CountEvent
+from game_qu.base.frame_profiler import FrameProfiler
 from game_qu.base.library_abstraction import utility_functions
+from game_qu.base.library_changer import LibraryChanger
 
 
 class Window:
-    """Shows everything onto the users screen through adding components to it and displaying those added components"""
+    """ Shows everything onto the users screen through adding components to it and displaying those added components.
+        If the Window is using dirty rectangles (see set_is_using_dirty_rectangles()), it only renders what changed, so
+        everything that is drawn must say when it changes: a component through its get_render_state() or mark_dirty(),
+        and a screen that draws in render() (like a custom background) through its get_render_state() or mark_dirty()
+        (which make the whole window be rendered again). Anything else that is drawn is not rendered again when it changes"""
 
     screens = []
     is_rendering = True
     is_rendering_count_event = None
+    length = 0
+    height = 0
+    background_color = None
+
+    # Dirty rectangles (see set_is_using_dirty_rectangles())
+    is_using_dirty_rectangles = False
+    component_ids_to_render_states = {}  # id(component) -> [component, render_state]; the components rendered last frame
+    screens_render_state = None  # [screen, render_state] of the visible screens last frame (None means unknown)
 
     def __init__(self, length, height, background_color, title):
         """ Creates a window with the length, height, and title of the values given
@@ -23,6 +39,8 @@ class Window:
         """
 
         utility_functions.set_up_window(length, height, background_color, title)
+        self.length, self.height, self.background_color = length, height, background_color
+        self.component_ids_to_render_states = {}
         self.is_rendering_count_event = CountEvent(0)
         self.is_rendering_count_event.set_is_infinite(True)
 
@@ -61,35 +79,236 @@ class Window:
         """ Calls the run() and render_background() method of all visible screens. It will also call the run() and render()
             methods for each of the Component(s) that the get_components() method returns for the visible screens"""
 
-        # The window should be rendered if it was told to render or the rendering count event is done (the event is
-        # modified by the user to define rendering behavior)
-        user_says_to_render = self.is_rendering_count_event.current_count_is_positive()
-        self.is_rendering_count_event.decrement()
+        should_render = self.update_should_render(should_render)
 
-        if user_says_to_render:
-            should_render = True
+        # The components have to all be run first, so it is known what changed before anything is rendered
+        if self.is_using_dirty_rectangles:
+            self.run_without_rendering()
 
-        else:
-            should_render &= self.is_rendering_count_event.get_is_infinite()
+            if should_render:
+                self.render_dirty_rectangles()
+
+            return
 
         for screen in self.screens:
             if not screen.is_visible:
                 continue
 
             if screen.is_visible:
+                start_time = FrameProfiler.start_timer()
                 screen.run()
+                FrameProfiler.add_component_time(screen, "run", start_time)
 
             if screen.is_visible and should_render:
+                start_time = FrameProfiler.start_timer()
                 screen.render_background()
                 screen.render()
+                FrameProfiler.add_component_time(screen, "render", start_time)
 
             for component in screen.get_components():
                 can_run_normally = component.is_visible and component.get_is_visible()
                 if can_run_normally or component.should_run_when_not_visible:
+                    start_time = FrameProfiler.start_timer()
                     component.run()
+                    FrameProfiler.add_component_time(component, "run", start_time)
 
                 if should_render and component.is_visible:
+                    start_time = FrameProfiler.start_timer()
+                    component.render()
+                    FrameProfiler.add_component_time(component, "render", start_time)
+
+    def run_without_rendering(self):
+        """ Calls the run() method of all visible screens and the run() method of their Component(s). Nothing is rendered
+            (used for running fixed time steps that are not rendered)"""
+
+        for screen in self.screens:
+            if not screen.is_visible:
+                continue
+
+            start_time = FrameProfiler.start_timer()
+            screen.run()
+            FrameProfiler.add_component_time(screen, "run", start_time)
+
+            for component in screen.get_components():
+                can_run_normally = component.is_visible and component.get_is_visible()
+                if can_run_normally or component.should_run_when_not_visible:
+                    start_time = FrameProfiler.start_timer()
+                    component.run()
+                    FrameProfiler.add_component_time(component, "run", start_time)
+
+    def render(self, should_render):
+        """ Calls the render_background() and render() method of all visible screens and the render() method of their
+            visible Component(s). Nothing is run"""
+
+        should_render = self.update_should_render(should_render)
+
+        if not should_render:
+            return
+
+        if self.is_using_dirty_rectangles:
+            self.render_dirty_rectangles()
+            return
+
+        for screen in self.screens:
+            if not screen.is_visible:
+                continue
+
+            start_time = FrameProfiler.start_timer()
+            screen.render_background()
+            screen.render()
+            FrameProfiler.add_component_time(screen, "render", start_time)
+
+            for component in screen.get_components():
+                if component.is_visible:
+                    start_time = FrameProfiler.start_timer()
                     component.render()
+                    FrameProfiler.add_component_time(component, "render", start_time)
+
+    def set_is_using_dirty_rectangles(self, is_using_dirty_rectangles):
+        """ Sets whether only the parts of the window that changed are rendered and updated every frame (instead of the
+            whole window). A component or screen changed if its get_render_state() changed or mark_dirty() was called
+            (see Window). This is much faster for screens that barely change (like menus and HUDs). Only pygame and
+            'null' support it"""
+
+        if is_using_dirty_rectangles and not LibraryChanger.get_library_supports_dirty_rectangles():
+            raise ValueError(f"The game library {LibraryChanger.current_library_name} does not support dirty rectangles")
+
+        self.is_using_dirty_rectangles = is_using_dirty_rectangles
+        self.component_ids_to_render_states = {}
+        self.screens_render_state = None  # So the whole window is rendered the first frame
+        utility_functions.set_rectangles_to_update([] if is_using_dirty_rectangles else None)
+
+    def render_dirty_rectangles(self):
+        """ Renders the union of the rectangles that changed: the old and new dimensions of every component that changed,
+            appeared, or disappeared since the last frame. Only the background and the components that overlap that
+            rectangle are rendered (within it) and only it is updated. The whole window is rendered if the visible screens
+            or how they look changed (see Screen.get_render_state())"""
+
+        visible_screens = [screen for screen in self.screens if screen.is_visible]
+        screens_render_state = [[screen, screen.get_render_state()] for screen in visible_screens]
+        screens_to_components = []  # [screen, [[component, render_state]]]
+        previous_render_states = self.component_ids_to_render_states
+        render_states = {}
+        dirty_bounds = None  # [left_edge, top_edge, right_edge, bottom_edge]
+
+        for screen in visible_screens:
+            components = []
+
+            for component in screen.get_components():
+                if not component.is_visible:
+                    continue
+
+                render_state = component.get_render_state()
+                previous_render_state = previous_render_states.get(id(component))
+                components.append([component, render_state])
+                render_states[id(component)] = [component, render_state]
+
+                if previous_render_state is None or previous_render_state[1] != render_state or component.is_dirty:
+                    dirty_bounds = Window.get_bounds_union(dirty_bounds, render_state)
+                    component.is_dirty = False
+
+                    if previous_render_state is not None:
+                        dirty_bounds = Window.get_bounds_union(dirty_bounds, previous_render_state[1])
+
+            screens_to_components.append([screen, components])
+
+        for component_id, (component, render_state) in previous_render_states.items():
+            if component_id not in render_states:
+                dirty_bounds = Window.get_bounds_union(dirty_bounds, render_state)
+
+        # A screen with no render state could have changed, so it is rendered every frame
+        is_rendering_everything = (screens_render_state != self.screens_render_state
+                                   or any(render_state is None or screen.is_dirty for screen, render_state in screens_render_state))
+
+        for screen in visible_screens:
+            screen.is_dirty = False
+
+        self.component_ids_to_render_states, self.screens_render_state = render_states, screens_render_state
+
+        rectangle = [0, 0, self.length, self.height] if is_rendering_everything else self.get_window_rectangle(dirty_bounds)
+        utility_functions.set_rectangles_to_update([rectangle] if rectangle is not None else [])
+
+        if rectangle is None:
+            for screen, components in screens_to_components:
+                for component, render_state in components:
+                    component.update_last_frame_id_when_visible()
+
+            return
+
+        rectangle_left_edge, rectangle_top_edge, rectangle_length, rectangle_height = rectangle
+        utility_functions.set_clip_rectangle(rectangle)
+        utility_functions.render_rectangle(0, 0, self.length, self.height, self.background_color)
+
+        for screen, components in screens_to_components:
+            start_time = FrameProfiler.start_timer()
+            screen.render_background()
+            screen.render()
+            FrameProfiler.add_component_time(screen, "render", start_time)
+
+            for component, render_state in components:
+                left_edge, top_edge, length, height = render_state[:4]
+                is_overlapping = (left_edge <= rectangle_left_edge + rectangle_length and left_edge + length >= rectangle_left_edge
+                                  and top_edge <= rectangle_top_edge + rectangle_height and top_edge + height >= rectangle_top_edge)
+
+                if not is_overlapping:
+                    component.update_last_frame_id_when_visible()
+                    continue
+
+                start_time = FrameProfiler.start_timer()
+                component.render()
+                FrameProfiler.add_component_time(component, "render", start_time)
+
+        utility_functions.set_clip_rectangle(None)
+
+    @staticmethod
+    def get_bounds_union(bounds, render_state):
+        """
+             Returns:
+                list[float]: [left_edge, top_edge, right_edge, bottom_edge]; the smallest bounds that contain 'bounds' (None
+                means no bounds) and the dimensions of 'render_state' (see Component.get_render_state())"""
+
+        left_edge, top_edge, length, height = render_state[:4]
+
+        if bounds is None:
+            return [left_edge, top_edge, left_edge + length, top_edge + height]
+
+        return [min(bounds[0], left_edge), min(bounds[1], top_edge),
+                max(bounds[2], left_edge + length), max(bounds[3], top_edge + height)]
+
+    def get_window_rectangle(self, bounds):
+        """
+             Returns:
+                list[int]: [left_edge, top_edge, length, height]; the pixels of the window that 'bounds' covers (one more
+                pixel on each side, so nothing is missed from rounding); None if it does not cover any of the window"""
+
+        if bounds is None:
+            return None
+
+        left_edge, top_edge = max(math.floor(bounds[0]) - 1, 0), max(math.floor(bounds[1]) - 1, 0)
+        right_edge, bottom_edge = min(math.ceil(bounds[2]) + 1, self.length), min(math.ceil(bounds[3]) + 1, self.height)
+
+        if right_edge <= left_edge or bottom_edge <= top_edge:
+            return None
+
+        return [left_edge, top_edge, right_edge - left_edge, bottom_edge - top_edge]
+
+    def update_should_render(self, should_render):
+        """ Updates the rendering count event (the event is modified by the user to define rendering behavior)
+
+            Returns:
+                bool: whether the window should be rendered this frame"""
+
+        # The window should be rendered if it was told to render or the rendering count event is done
+        user_says_to_render = self.is_rendering_count_event.current_count_is_positive()
+        self.is_rendering_count_event.decrement()
+
+        if user_says_to_render:
+            should_render = True
+
+        else:
+            should_render &= self.is_rendering_count_event.get_is_infinite()
+
+        return should_render
 
     def stop_rendering(self):
         """Stops the program from rendering"""
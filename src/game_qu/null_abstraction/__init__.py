@@ -0,0 +1,3 @@
+"""Holds all the code for the 'null' game library. It has the same interface as the pygame and pyglet abstractions, but it
+does not open a window or render anything. The input comes from a script instead of a keyboard, so games can be run on
+machines that have no display as fast as the computer allows."""
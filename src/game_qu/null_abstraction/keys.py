@@ -0,0 +1,10 @@
+"""Contains all the keys that the user can use. The values are the game engine's keys (see key_constants), which are the
+same as the pygame keys, so scripted input works the same no matter which game library the game is normally run with"""
+
+from game_qu.base.key_constants import *
+
+# The null game library has no real keyboard, so the game engine keys are the keys
+keyboard_keys_to_game_engine_keys = {key: key for key in range(DPAD_RIGHT + 1)}
+
+keys = [x for x in range(39)]
+buttons = [BUTTON_A, BUTTON_X, BUTTON_Y, BUTTON_B, BUTTON_START, BUTTON_SELECT, BUTTON_L, BUTTON_R, DPAD_UP, DPAD_DOWN, DPAD_RIGHT, DPAD_LEFT]
@@ -0,0 +1,270 @@
+from game_qu.null_abstraction import variables
+import os
+import struct
+import time
+
+images = {}
+
+
+def convert_to_int(*args):
+    """
+             Returns:
+            list[int]: each arg as an int"""
+
+    return_value = []
+
+    for arg in args:
+        return_value.append(int(arg))
+
+    return return_value
+
+
+def _get_png_size(path_to_image):
+    """
+             Returns:
+            list[int]: {image_length, image_height}; the size stored in the header of the png (or [1, 1] if the file
+            is not a png or does not exist, so the game can still run on machines that do not have the images)"""
+
+    if not os.path.isfile(path_to_image):
+        return [1, 1]
+
+    with open(path_to_image, "rb") as file:
+        header = file.read(24)
+
+    # The png signature is 8 bytes followed by the IHDR chunk that has the width and height in it
+    if len(header) < 24 or header[:8] != b"\x89PNG\r\n\x1a\n":
+        return [1, 1]
+
+    return list(struct.unpack(">II", header[16:24]))
+
+
+def load_image(path_to_image):
+    """ Loads the image from that path_to_image (only the size is stored because nothing is rendered)
+
+         Returns:
+            list[int]: {image_length, image_height}; the length and height of the image"""
+
+    if images.get(path_to_image) is None:
+        images[path_to_image] = _get_png_size(path_to_image)
+
+    return images[path_to_image]
+
+
+def load_text(name, font_size, background_color, text_color):
+    """Does nothing because no text is rendered (exists so the interface is the same as the other game libraries)"""
+
+    pass
+
+
+def render_text(left_edge, top_edge, text_color, background_color, text, font_size, is_centered, name, is_rendering_background=True):
+    """Does nothing because nothing is rendered (exists so the interface is the same as the other game libraries)"""
+
+    pass
+
+
+def render_image(path_to_image, left_edge, top_edge, length, height):
+    """Does nothing because nothing is rendered (exists so the interface is the same as the other game libraries)"""
+
+    pass
+
+
+def render_rectangle(left_edge, top_edge, length, height, color):
+    """Does nothing because nothing is rendered (exists so the interface is the same as the other game libraries)"""
+
+    pass
+
+
+def render_ellipse(left_edge, top_edge, length, height, color):
+    """Does nothing because nothing is rendered (exists so the interface is the same as the other game libraries)"""
+
+    pass
+
+
+def set_clip_rectangle(rectangle):
+    """Stores the rectangle that would limit what is rendered (nothing is rendered)"""
+
+    variables.clip_rectangle = rectangle
+
+
+def set_rectangles_to_update(rectangles):
+    """Stores the rectangles of the window that would be updated this frame (nothing is rendered)"""
+
+    variables.rectangles_to_update = rectangles
+
+
+def set_up_window(length, height, background_color, title):
+    """Stores the window's attributes; no window is actually opened"""
+
+    variables.window_length, variables.window_height = convert_to_int(length, height)
+    variables.background_color = background_color
+    variables.title = title
+
+
+def key_is_pressed(keyboard_key):
+    """
+             Returns:
+            bool: if the 'keyboard_key' is currently pressed this game cycle"""
+
+    return keyboard_key in variables.pressed_keys
+
+
+def button_is_pressed(button):
+    """
+             Returns:
+            bool: if the 'button' is currently pressed this game cycle"""
+
+    return button in variables.pressed_buttons
+
+
+def mouse_was_pressed():
+    """
+             Returns:
+            bool: whether the mouse is currently held down this game cycle"""
+
+    return variables.mouse_is_pressed
+
+
+def press_key(keyboard_key):
+    """Makes the game engine think the 'keyboard_key' is held down until release_key() is called"""
+
+    variables.pressed_keys.add(keyboard_key)
+
+
+def release_key(keyboard_key):
+    """Makes the game engine think the 'keyboard_key' is no longer held down"""
+
+    variables.pressed_keys.discard(keyboard_key)
+
+
+def press_button(button):
+    """Makes the game engine think the 'button' is held down until release_button() is called"""
+
+    variables.pressed_buttons.add(button)
+
+
+def release_button(button):
+    """Makes the game engine think the 'button' is no longer held down"""
+
+    variables.pressed_buttons.discard(button)
+
+
+def set_mouse_is_pressed(mouse_is_pressed):
+    """Sets whether the game engine thinks the mouse is held down"""
+
+    variables.mouse_is_pressed = mouse_is_pressed
+
+
+def set_mouse_position(left_edge, top_edge):
+    """Sets where the game engine thinks the mouse is"""
+
+    variables.mouse_position = (left_edge, top_edge)
+
+
+def release_all():
+    """Makes the game engine think no keys, buttons, or the mouse are held down"""
+
+    variables.pressed_keys.clear()
+    variables.pressed_buttons.clear()
+    variables.mouse_is_pressed = False
+
+
+def set_input_script(input_script):
+    """ Sets the function that is called with the cycle number before every cycle. This function should use press_key(),
+        release_key(), set_mouse_position(), etc. to script what the 'person' playing the game does"""
+
+    variables.input_script = input_script
+
+
+def set_max_cycles(max_cycles):
+    """Sets how many cycles call_every_cycle() runs before it stops (None means it runs until stop_running() is called)"""
+
+    variables.max_cycles = max_cycles
+
+
+def set_fixed_cycle_time(fixed_cycle_time):
+    """ Sets how long every cycle lasts (None means the measured time is used). Setting this makes the game run exactly
+        the same every time no matter how fast the computer is"""
+
+    variables.fixed_cycle_time = fixed_cycle_time
+
+
+def stop_running():
+    """Makes call_every_cycle() return after the current cycle"""
+
+    variables.is_running = False
+
+
+def call_every_cycle(function):
+    """ Calls the 'function' given every game cycle as fast as the computer allows. It stops once 'max_cycles' cycles
+        have been run or stop_running() has been called"""
+
+    variables.is_running = True
+    variables.current_cycle = 0
+
+    while variables.is_running:
+        if variables.max_cycles is not None and variables.current_cycle >= variables.max_cycles:
+            break
+
+        if variables.input_script is not None:
+            variables.input_script(variables.current_cycle)
+
+        if variables.fixed_cycle_time is not None:
+            function(variables.fixed_cycle_time, False, variables.is_rendering)
+
+        else:
+            function(time.time(), True, variables.is_rendering)
+
+        variables.current_cycle += 1
+
+    variables.is_running = False
+
+
+def run_checking_closing():
+    """There is no window to close, so this does nothing"""
+
+    pass
+
+
+def is_mouse_collision(dimensions):
+    """
+             Returns:
+            bool: whether the mouse has collided with that rectangle - dimensions (left_edge, top_edge, length, height)"""
+
+    mouse_left_edge, mouse_top_edge = variables.mouse_position
+
+    is_horizontal_collision = dimensions.left_edge <= mouse_left_edge <= dimensions.left_edge + dimensions.length
+    is_vertical_collision = dimensions.top_edge <= mouse_top_edge <= dimensions.top_edge + dimensions.height
+    return is_horizontal_collision and is_vertical_collision
+
+
+def get_mouse_position():
+    """
+        Returns:
+            tuple[int]: {left_edge, top_edge}; the position of the mouse"""
+
+    return variables.mouse_position
+
+
+def get_time_passed(start_time):
+    """
+             Returns:
+            bool: the amount of time that has passed between the current time and start time"""
+
+    return time.time() - start_time
+
+
+def load_and_transform_image(image_path):
+    """Loads the image at the 'image_path' and the horizontal mirror of it (both have the same size)"""
+
+    images[f"{image_path}_right.png"] = _get_png_size(f"{image_path}_right.png")
+    images[f"{image_path}_left.png"] = images[f"{image_path}_right.png"]
+
+
+def get_directional_path_to_image(base_image_path, direction_is_right, additional_path_after_direction):
+    """
+             Returns:
+            str: the path to the image that includes direction"""
+
+    direction_image_path = "right" if direction_is_right else "left"
+
+    return f"{base_image_path}_{direction_image_path}{additional_path_after_direction}.png"
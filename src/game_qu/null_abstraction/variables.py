@@ -0,0 +1,25 @@
+"""Has all the variables that are important for the null game library code to run"""
+
+joystick = None
+
+WINDOW = None
+window_length = 0
+window_height = 0
+title = ""
+background_color = None
+clip_rectangle = None
+rectangles_to_update = None
+
+# The scripted input (what the game engine thinks is currently pressed)
+pressed_keys = set()
+pressed_buttons = set()
+mouse_is_pressed = False
+mouse_position = (0, 0)
+
+# Decides how the game loop runs
+input_script = None  # Called with the cycle number before every cycle, so it can press and release keys
+max_cycles = None  # The game loop stops after this many cycles (None means it runs until stop_running() is called)
+fixed_cycle_time = None  # If this is not None, every cycle lasts this long instead of the measured time
+is_rendering = False  # Whether the render functions are called (they do nothing, so by default they are skipped)
+is_running = False
+current_cycle = 0
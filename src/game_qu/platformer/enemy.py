@@ -14,6 +14,9 @@ class Enemy(WeaponUser, abc.ABC):
     health_bar = None
     object_type = "Enemy"
     is_on_platform = True
+    # Only the values that are replaced (not changed in place) are recorded (see GameObject)
+    history_tracked_attributes = ["left_edge", "top_edge", "length", "height", "is_moving_right", "is_facing_right",
+                                  "hit_points_left", "is_on_platform"]
 
     def __init__(self, damage, hit_points, platform, base_path_to_image):
         """Initializes the object"""
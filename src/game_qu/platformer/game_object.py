@@ -7,6 +7,9 @@ class GameObject(Component):
 
     object_type = ""
     name = None
+    # The attributes HistoryKeeper.add(needs_deepcopy=True) records instead of deep copying the object (None means it is
+    # deep copied). They are recorded shallowly, so a tracked attribute should be replaced instead of modified
+    history_tracked_attributes = None
 
     def __init__(self, path_to_image=""):
         """Initializes the object"""
@@ -31,6 +34,21 @@ class GameObject(Component):
 
         pass
 
+    def on_collision_enter(self, other_object):
+        """Runs what should happen the cycle this game object starts touching 'other_object' (see ContactManager)"""
+
+        pass
+
+    def on_collision_stay(self, other_object):
+        """Runs what should happen every cycle after the first that this game object keeps touching 'other_object'"""
+
+        pass
+
+    def on_collision_exit(self, other_object):
+        """Runs what should happen the cycle this game object stops touching 'other_object'"""
+
+        pass
+
     def get_all_components(self):
         """
             Returns:
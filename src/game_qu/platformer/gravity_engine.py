@@ -11,6 +11,7 @@ class GravityEngine:
         """Initializes the object"""
 
         self.acceleration = acceleration
+        self.game_object_to_physics_path = {}
         self.add_game_objects(game_objects)
 
     def add_game_objects(self, game_objects):
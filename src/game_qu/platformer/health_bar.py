@@ -60,6 +60,13 @@ class HealthBar(Component):
         if self.health_gone_bar.length != 0:
             self.health_gone_bar.render()
 
+    def get_render_state(self):
+        """
+             Returns:
+                tuple: everything that decides how the health bar looks (see Component.get_render_state())"""
+
+        return super().get_render_state() + (self.game_character.hit_points_left, self.game_character.total_hit_points)
+
     def default_set_size_function(self):
         """Runs the default way to size the health bar"""
 
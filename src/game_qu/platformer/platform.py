@@ -13,6 +13,7 @@ class Platform(GameObject):
 
     color = (150, 75, 0)
     object_type = "Platform"
+    history_tracked_attributes = ["left_edge", "top_edge", "length", "height"]
 
     def __init__(self, left_edge=0, top_edge=0, length=0, height=0):
         """Initializes the object"""
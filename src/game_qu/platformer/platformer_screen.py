@@ -4,6 +4,8 @@ from game_qu.base.id_creator import id_creator
 from game_qu.base.velocity_calculator import VelocityCalculator
 from game_qu.gui_components.dimensions import Dimensions
 from game_qu.base.engines import CollisionsEngine
+from game_qu.base.collision_layers import CollisionLayers
+from game_qu.base.contact_manager import ContactManager
 from game_qu.base.history_keeper import HistoryKeeper
 from game_qu.platformer.generator import Generator
 from game_qu.platformer.gravity_engine import GravityEngine
@@ -30,6 +32,8 @@ class PlatformerScreen(Screen):
     gravity_engine = None
     rightmost_platform = None
     generator = None
+    broad_phase = None  # Finds the pairs of objects that could have collided, so only those pairs are checked
+    contact_manager = None  # Keeps the pairs of objects that are touching and calls their collision callbacks
     intermediate_screen = IntermediateScreen()
 
     # Modifiable Numbers
@@ -40,6 +44,8 @@ class PlatformerScreen(Screen):
     hud_length = SCREEN_LENGTH - health_grid_length
     hud_height = VelocityCalculator.get_dimension(SCREEN_HEIGHT, 6)
     player_keys = [KEY_A, KEY_D, KEY_W, KEY_S, KEY_F]
+    broad_phase_name = "spatial_hash"  # See CollisionsEngine.create_broad_phase()
+    continuous_collisions_are_enabled = True  # Whether players that move fast enough to go through platforms still hit them
 
     hud = None
 
@@ -53,6 +59,12 @@ class PlatformerScreen(Screen):
         """Initializes the object"""
 
         super().__init__("")
+
+        # So every PlatformerScreen has its own state instead of sharing the class attributes
+        self.player_health_bars, self.collidable_objects, self.other_game_objects = [], [], []
+        self.intermediate_screen = IntermediateScreen()
+        self.broad_phase = self.create_broad_phase()
+        self.contact_manager = ContactManager()
         self.hud = HUD(1, [], self.hud_length, self.hud_height, 1, None, high_score_is_needed=True)
 
         self.setup_platforms()
@@ -66,6 +78,7 @@ class PlatformerScreen(Screen):
 
         for player in self.players:
             player.gravity_engine = self.gravity_engine
+            player.contact_manager = self.contact_manager
             player.left_edge = self.platforms[0].left_edge + 10
             player.base_top_edge = self.platforms[0].top_edge - player.height
             player.set_top_edge(player.base_top_edge)
@@ -202,7 +215,7 @@ class PlatformerScreen(Screen):
 
         self.setup_platforms()
         self.gravity_engine.reset()
-        HistoryKeeper.last_objects = {}
+        HistoryKeeper.reset()
 
         high_score_message = f"New High Score: {self.high_score}"
         non_high_score_message = f"Score: {self.player_score}"
@@ -219,17 +232,107 @@ class PlatformerScreen(Screen):
 
         self.get_code_ready_for_collisions()
 
-        for i in range(len(self.game_objects)):
-            object1 = self.game_objects[i]
+        # The players that went through a platform are moved back to where they hit it, so they are touching the face
+        # they hit and the collisions below (and the players' collision data) see them hitting that face
+        if self.continuous_collisions_are_enabled:
+            self.run_continuous_collisions()
+
+        layers = [CollisionLayers.get_object_layer(game_object) for game_object in self.game_objects]
+        self.broad_phase.update_all(self.game_objects, layers)
+
+        # The pairs are sorted, so the collisions run in the same order as checking every pair of game objects would
+        game_object_ids_to_indexes = {id(game_object): index for index, game_object in enumerate(self.game_objects)}
+        candidate_pairs = []
+
+        # The broad phase only gives pairs whose collision layers can collide (so not pairs like platform and platform)
+        for object1, object2 in self.broad_phase.get_candidate_pairs():
+            index1, index2 = game_object_ids_to_indexes[id(object1)], game_object_ids_to_indexes[id(object2)]
+            candidate_pairs.append([index1, index2] if index1 < index2 else [index2, index1])
+
+        colliding_pairs = []
+
+        for index1, index2 in sorted(candidate_pairs):
+            object1, object2 = self.game_objects[index1], self.game_objects[index2]
+
+            if CollisionsEngine.is_collision(object1, object2):
+                colliding_pairs.append([object1, object2])
+
+        # The collision callbacks (on_collision_enter(), etc.) are called before the collisions are run
+        self.contact_manager.update(colliding_pairs)
+
+        for object1, object2 in colliding_pairs:
+            self.run_collision(object1, object2)
+
+    def run_continuous_collisions(self):
+        """Moves every player that went through a platform this cycle to where it first hit a platform"""
+
+        for player, platform, time_of_impact, face in self.get_continuous_collisions():
+            self.move_to_time_of_impact(player, platform, time_of_impact, face)
+
+    def get_continuous_collisions(self):
+        """
+            Returns:
+                list[list[object]]: [player, platform, time_of_impact, face]; the first platform each player went through
+                this cycle without overlapping it (it moved farther than the platform and its own size within one cycle).
+                See CollisionsEngine.get_time_of_impact() for 'time_of_impact' and 'face'
+        """
+
+        continuous_collisions = []
+
+        # With no platforms there is nothing to go through
+        if len(self.platforms) == 0:
+            return continuous_collisions
+
+        # All the platforms only move by side scrolling, so they all moved the same amount
+        reference_platform = self.platforms[0]
+        prev_reference_platform = CollisionsEngine.get_previous_dimensions(reference_platform)
+        platforms_horizontal_movement = 0 if prev_reference_platform is None else reference_platform.left_edge - prev_reference_platform.left_edge
+
+        for player in self.players:
+            prev_player = CollisionsEngine.get_previous_dimensions(player)
+
+            if prev_player is None:
+                continue
 
-            for j in range(i, len(self.game_objects)):
-                object2 = self.game_objects[j]
+            # A player can only go through a platform if it moved farther than its own size
+            horizontal_movement = player.left_edge - prev_player.left_edge - platforms_horizontal_movement
+            vertical_movement = player.top_edge - prev_player.top_edge
 
-                collision_is_possible = len(object1.object_type) != len(object2.object_type)
-                collision_has_happened = collision_is_possible and CollisionsEngine.is_collision(object1, object2)
+            if abs(horizontal_movement) <= player.length and abs(vertical_movement) <= player.height:
+                continue
 
-                if collision_has_happened:
-                    self.run_collision(object1, object2)
+            first_collision = None
+
+            for platform in self.platforms:
+                swept_collision = None if CollisionsEngine.is_collision(player, platform) else CollisionsEngine.get_swept_collision(player, platform)
+
+                # Only the first platform the player hit matters because the player would have stopped there
+                if swept_collision is not None and (first_collision is None or swept_collision[0] < first_collision[2]):
+                    first_collision = [player, platform] + swept_collision
+
+            if first_collision is not None:
+                continuous_collisions.append(first_collision)
+
+        return continuous_collisions
+
+    def move_to_time_of_impact(self, player, platform, time_of_impact, face):
+        """Moves the player to where it was (relative to the platform) when it hit the platform's 'face' this cycle"""
+
+        prev_player = CollisionsEngine.get_previous_dimensions(player)
+        prev_platform = CollisionsEngine.get_previous_dimensions(platform)
+
+        # The movement is from the platform's perspective (like CollisionsEngine.get_time_of_impact()), so the platform stays still
+        horizontal_movement = (player.left_edge - prev_player.left_edge) - (platform.left_edge - prev_platform.left_edge)
+        vertical_movement = (player.top_edge - prev_player.top_edge) - (platform.top_edge - prev_platform.top_edge)
+        left_edge = platform.left_edge + (prev_player.left_edge - prev_platform.left_edge) + horizontal_movement * time_of_impact
+        top_edge = platform.top_edge + (prev_player.top_edge - prev_platform.top_edge) + vertical_movement * time_of_impact
+
+        # The edge that hit the face is put exactly on it, so the player is touching the face instead of barely missing it
+        faces_to_left_edges = {"left": platform.left_edge - player.length, "right": platform.right_edge}
+        faces_to_top_edges = {"top": platform.top_edge - player.height, "bottom": platform.bottom_edge}
+
+        player.set_left_edge(faces_to_left_edges.get(face, left_edge))
+        player.set_top_edge(faces_to_top_edges.get(face, top_edge))
 
     def run_collision(self, main_object, other_object):
         """ Runs the collisions between the 'main_object' and the 'other_object;' the main_object acts upon the other_object.
@@ -276,23 +379,44 @@ class PlatformerScreen(Screen):
     def is_player(self, game_object):
         """
             Returns:
-                boolean: if the game_object is the player --> object type would be 'Player'"""
+                boolean: if the game_object is the player --> its collision layer would be 'Player'"""
 
-        return len(game_object.object_type) == 6
+        return CollisionLayers.get_object_layer(game_object) == CollisionLayers.get_layer("Player")
 
     def is_player_weapon(self, game_object):
         """
             Returns:
-                boolean: if the game_object is the player's weapon --> object type would be 'Player Weapon'"""
+                boolean: if the game_object is the player's weapon --> its collision layer would be 'Player Weapon'"""
 
-        return len(game_object.object_type) == 13
+        return CollisionLayers.get_object_layer(game_object) == CollisionLayers.get_layer("Player Weapon")
 
     def is_platform(self, game_object):
         """
             Returns:
-                boolean: if the game_object is a platform --> object type would be 'Platform'"""
+                boolean: if the game_object is a platform --> its collision layer would be 'Platform'"""
+
+        return CollisionLayers.get_object_layer(game_object) == CollisionLayers.get_layer("Platform")
+
+    def create_broad_phase(self):
+        """
+            Returns:
+                object: the broad phase of the collisions (decided by 'broad_phase_name')
+        """
+
+        if self.broad_phase_name == "spatial_hash":
+            return CollisionsEngine.create_broad_phase(self.broad_phase_name, cell_size=self.get_collisions_cell_size(),
+                                                       pair_matrix=CollisionLayers.pair_matrix)
+
+        return CollisionsEngine.create_broad_phase(self.broad_phase_name, pair_matrix=CollisionLayers.pair_matrix)
+
+    def get_collisions_cell_size(self):
+        """
+            Returns:
+                float: the size of the cells of the SpatialHash used for collisions (None means it is the average size
+                of the game objects); it should be around the size of a typical game object
+        """
 
-        return len(game_object.object_type) == 8
+        return None
 
     def get_additional_generation_items(self, new_platform):
         """
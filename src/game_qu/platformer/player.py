@@ -84,6 +84,10 @@ class Player(WeaponUser):
     base_top_edge = -1
     jump_key_held_in_time = -1
     jump_types = None
+    # The paths and timed events are changed in place, so only the values that are replaced are recorded (see GameObject)
+    history_tracked_attributes = ["left_edge", "top_edge", "length", "height", "current_velocity", "is_on_platform",
+                                  "is_facing_right", "hit_points_left", "has_jumped", "can_move_left", "can_move_right",
+                                  "platform_is_on"]
 
     # Booleans
     can_move_down = False
@@ -343,7 +347,7 @@ class Player(WeaponUser):
 
         # The player should only act upon the collision data if there was stuff in the History Keeper because if there wasn't
         # Then the game is automatically going to say it was not a collision (top, left, right, bottom)
-        if HistoryKeeper.get_last(self.name) is not None:
+        if HistoryKeeper.get_last_edges(self.name) is not None:
             self.alter_player_horizontal_movement()
             self.alter_player_vertical_movement()
 
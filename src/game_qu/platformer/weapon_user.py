@@ -19,6 +19,7 @@ class WeaponUser(GameObject):
     collidable_components = []
     is_addable = True
     base_path_to_image = ""
+    contact_manager = None  # The ContactManager of the screen (None means the collision data is always figured out)
 
     # Collision Data
     left_collision_data = [False, None]
@@ -96,10 +97,16 @@ class WeaponUser(GameObject):
 
         is_same_coordinates = self.right_edge == inanimate_object.left_edge or self.left_edge == inanimate_object.right_edge
 
-        return [CollisionsEngine.is_left_collision(self, inanimate_object, is_collision),
-                CollisionsEngine.is_right_collision(self, inanimate_object, is_collision),
-                CollisionsEngine.is_top_collision(self, inanimate_object, is_collision) and not is_same_coordinates,
-                CollisionsEngine.is_bottom_collision(self, inanimate_object, is_collision) and not is_same_coordinates]
+        # The contact's collision data is reused, so resting contacts (like standing on a platform) are cheap
+        if self.contact_manager is not None and is_collision:
+            collision_data = self.contact_manager.get_collision_data(self, inanimate_object)
+
+        else:
+            collision_data = CollisionsEngine.get_collision_data(self, inanimate_object, is_collision)
+
+        return [collision_data.is_left_collision, collision_data.is_right_collision,
+                collision_data.is_top_collision and not is_same_coordinates,
+                collision_data.is_bottom_collision and not is_same_coordinates]
 
     def update_collision_data(self, inanimate_object, current_collision_data, is_collision):
         """Updates the values of the 'current_collision_data' to reflect 'is_collision' and 'inanimate_object'"""
@@ -144,6 +151,13 @@ class WeaponUser(GameObject):
 
         super().render()
 
+    def get_render_state(self):
+        """
+             Returns:
+                tuple: everything that decides how the weapon user looks (see Component.get_render_state())"""
+
+        return super().get_render_state() + (self.base_path_to_image, self.is_facing_right)
+
     def get_components(self):
         """
             Returns:
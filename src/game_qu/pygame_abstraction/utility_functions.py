@@ -1,10 +1,20 @@
+from game_qu.base import important_constants
+from game_qu.base.frame_pacer import FramePacer
+from game_qu.base.frame_profiler import FrameProfiler
+from game_qu.base.lru_cache import LRUCache
 from game_qu.pygame_abstraction import variables
 from game_qu.pygame_abstraction.keys import *
 import pygame
 import time
 
-fonts = {}
+fonts = LRUCache(important_constants.MAX_NUMBER_OF_FONTS_LOADED)  # font_size -> font
 images = {}
+# (path_to_image, length, height) -> the image scaled to that size, so images are not scaled every time they are rendered
+scaled_images = LRUCache(important_constants.SCALED_IMAGES_CACHE_MAX_BYTES,
+                         lambda image: image.get_bytesize() * image.get_width() * image.get_height())
+# (text, font_size, text_color, background_color) -> the rendered text, so text that has not changed is not rendered again
+rendered_texts = LRUCache(important_constants.RENDERED_TEXT_CACHE_MAX_BYTES,
+                          lambda image: image.get_bytesize() * image.get_width() * image.get_height())
 
 def convert_to_int(*args):
     """
@@ -32,19 +42,37 @@ def load_image(path_to_image):
 def load_text(name, font_size, background_color, text_color):
     """Loads the text for quick rendering (should be called before the game starts running)"""
 
-    if fonts.get(font_size) is None:
-        fonts[font_size] = pygame.font.Font("freesansbold.ttf", font_size)
+    get_font(font_size)
+
+def get_font(font_size):
+    """
+             Returns:
+            pygame.font.Font: the font with the size 'font_size' (it is loaded if it is not loaded)"""
+
+    font = fonts.get(font_size)
+
+    if font is None:
+        font = pygame.font.Font("freesansbold.ttf", font_size)
+        fonts.add(font_size, font)
+
+    return font
 
 def render_text(left_edge, top_edge, text_color, background_color, text, font_size, is_centered, name, is_rendering_background=True):
     """Renders the text onto the screen"""
 
     left_edge, top_edge = convert_to_int(left_edge, top_edge)
 
-    font = fonts.get(font_size)
     if not is_rendering_background:
         background_color = None
 
-    rendered_text = font.render(text, True, text_color, background_color)
+    # The colors could be lists, so they are made into tuples (lists can not be keys)
+    key = (text, font_size, tuple(text_color), tuple(background_color) if background_color is not None else None)
+    rendered_text = rendered_texts.get(key)
+
+    if rendered_text is None:
+        rendered_text = get_font(font_size).render(text, True, text_color, background_color)
+        rendered_texts.add(key, rendered_text)
+
     text_rectangle = rendered_text.get_rect()
 
     if is_centered:
@@ -60,8 +88,12 @@ def render_image(path_to_image, left_edge, top_edge, length, height):
     """Renders the image onto the screen"""
 
     left_edge, top_edge, length, height = convert_to_int(left_edge, top_edge, length, height)
-    image = images.get(path_to_image)
-    image = pygame.transform.scale(image, (length, height))
+    image = scaled_images.get((path_to_image, length, height))
+
+    if image is None:
+        image = pygame.transform.scale(images.get(path_to_image), (length, height))
+        scaled_images.add((path_to_image, length, height), image)
+
     variables.window.blit(image, (left_edge, top_edge))
 
 
@@ -78,6 +110,20 @@ def render_ellipse(left_edge, top_edge, length, height, color):
     left_edge, top_edge, length, height = convert_to_int(left_edge, top_edge, length, height)
     pygame.draw.ellipse(variables.window, color, [left_edge, top_edge, length, height])
 
+def set_clip_rectangle(rectangle):
+    """ Makes everything that is rendered only change the pixels within 'rectangle' ([left_edge, top_edge, length, height]);
+        None means the whole window"""
+
+    variables.window.set_clip(rectangle)
+
+
+def set_rectangles_to_update(rectangles):
+    """ Makes only the 'rectangles' ([left_edge, top_edge, length, height]) of the window be updated this frame and stops
+        the window from being filled with the background color every frame. None means the whole window is filled and
+        updated every frame (the default)"""
+
+    variables.rectangles_to_update = rectangles
+
 def set_up_window(length, height, background_color, title):
     """Initializes all the pygame code, so the game be run and rendered"""
 
@@ -149,18 +195,37 @@ def mouse_was_pressed():
 
 
 def call_every_cycle(function):
-    """Makes pygame call the 'function' given every game cycle (60fps)"""
+    """ Makes pygame call the 'function' given every game cycle. It runs at important_constants.FRAMES_PER_SECOND
+        (unlimited if it is None) and the CPU is idle while it waits for the next frame"""
+
+    frame_pacer = FramePacer(important_constants.FRAMES_PER_SECOND)
 
     while True:
-        start_time = time.time()
+        cycle_time = frame_pacer.start_frame()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
 
-        variables.window.fill(variables.background_color)
+        # If only some rectangles are updated, the window renders the background of those rectangles itself
+        if variables.rectangles_to_update is None:
+            start_time = FrameProfiler.start_timer()
+            variables.window.fill(variables.background_color)
+            FrameProfiler.add_time("window fill", start_time)
 
-        function(start_time, True, True)
-        pygame.display.update()
+        function(cycle_time, False, True)
+
+        start_time = FrameProfiler.start_timer()
+
+        if variables.rectangles_to_update is None:
+            pygame.display.update()
+
+        else:
+            pygame.display.update(variables.rectangles_to_update)
+            variables.rectangles_to_update = []
+
+        FrameProfiler.add_time("pygame.display.update", start_time)
+
+        frame_pacer.wait_for_next_frame()
 
 def run_checking_closing():
     """Runs all the pygame code that checks to make sure the game should be closed"""
@@ -203,6 +268,9 @@ def load_and_transform_image(image_path):
     images[f"{image_path}_right.png"] = base_image
     images[f"{image_path}_left.png"] = transformed_image
 
+    # The images that were scaled from the images that were replaced are not correct anymore
+    scaled_images.remove_where(lambda key: key[0] == f"{image_path}_right.png" or key[0] == f"{image_path}_left.png")
+
 
 def get_directional_path_to_image(base_image_path, direction_is_right, additional_path_after_direction):
     """
@@ -15,5 +15,6 @@ if pygame.joystick.get_count() >= 1:
 
 WINDOW = None
 BACKGROUND_COLOR = None
+rectangles_to_update = None  # None means the whole window is updated every frame (see utility_functions.set_rectangles_to_update())
 RENDERS_PER_SECOND = 100000
 RUN_CALLS_PER_SECOND = 10000
@@ -0,0 +1,5 @@
+"""Makes the tests use the 'null' game library, so they run without a display and without pygame or pyglet installed"""
+
+from game_qu.base.library_changer import LibraryChanger
+
+LibraryChanger.set_game_library("null")
@@ -0,0 +1,118 @@
+"""Tests that the broad phases find every pair of objects that collided (and respect the collision layers)"""
+
+import random
+
+from game_qu.base.engines import CollisionsEngine
+from game_qu.gui_components.dimensions import Dimensions
+
+# Layer 0 collides with layers 1 and 2, layer 1 does not collide with itself or layer 2, and layer 2 collides with itself
+PAIR_MATRIX = [[False, True, True], [True, False, False], [True, False, True]]
+
+
+def create_objects(random_generator, number_of_objects):
+    """
+         Returns:
+            list[object]: [game_objects, layers]; objects with random dimensions and their random collision layers"""
+
+    game_objects, layers = [], []
+
+    for x in range(number_of_objects):
+        game_objects.append(Dimensions(random_generator.uniform(0, 1000), random_generator.uniform(0, 600),
+                                       random_generator.uniform(5, 80), random_generator.uniform(5, 80)))
+        layers.append(random_generator.randrange(len(PAIR_MATRIX)))
+
+    return [game_objects, layers]
+
+
+def move_objects(random_generator, game_objects):
+    """Moves every object a little bit (like one cycle of the game)"""
+
+    for game_object in game_objects:
+        game_object.left_edge += random_generator.uniform(-15, 15)
+        game_object.top_edge += random_generator.uniform(-15, 15)
+
+
+def get_brute_force_pairs(game_objects, layers):
+    """
+         Returns:
+            set[tuple[int]]: (index1, index2); every pair of objects that collided and whose layers can collide"""
+
+    collided_pairs = set()
+
+    for i in range(len(game_objects)):
+        for j in range(i + 1, len(game_objects)):
+            if PAIR_MATRIX[layers[i]][layers[j]] and CollisionsEngine.is_collision(game_objects[i], game_objects[j]):
+                collided_pairs.add((i, j))
+
+    return collided_pairs
+
+
+def get_index_pairs(pairs, game_objects):
+    """
+         Returns:
+            set[tuple[int]]: (index1, index2); the indexes of the objects in 'pairs' (index1 is the smaller one)"""
+
+    object_ids_to_indexes = {id(game_object): index for index, game_object in enumerate(game_objects)}
+    index_pairs = set()
+
+    for object1, object2 in pairs:
+        index1, index2 = object_ids_to_indexes[id(object1)], object_ids_to_indexes[id(object2)]
+        index_pairs.add((min(index1, index2), max(index1, index2)))
+
+    assert len(index_pairs) == len(pairs), "a pair was returned more than once"
+    return index_pairs
+
+
+def test_spatial_hash_finds_every_collided_pair():
+    """The candidate pairs of the SpatialHash include every pair that collided and no pair whose layers can not collide"""
+
+    random_generator = random.Random(0)
+    game_objects, layers = create_objects(random_generator, 200)
+    spatial_hash = CollisionsEngine.create_broad_phase("spatial_hash", cell_size=50, pair_matrix=PAIR_MATRIX)
+
+    for cycle in range(10):
+        spatial_hash.update_all(game_objects, layers)
+        candidate_pairs = get_index_pairs(spatial_hash.get_candidate_pairs(), game_objects)
+
+        assert get_brute_force_pairs(game_objects, layers) <= candidate_pairs
+        assert all(PAIR_MATRIX[layers[index1]][layers[index2]] for index1, index2 in candidate_pairs)
+
+        move_objects(random_generator, game_objects)
+
+
+def test_sweep_and_prune_finds_the_collided_pairs():
+    """The overlapping pairs of the SweepAndPrune are exactly the pairs that collided and whose layers can collide"""
+
+    random_generator = random.Random(1)
+    game_objects, layers = create_objects(random_generator, 200)
+    sweep_and_prune = CollisionsEngine.create_broad_phase("sweep_and_prune", pair_matrix=PAIR_MATRIX)
+    previous_pairs = set()
+
+    for cycle in range(10):
+        sweep_and_prune.update_all(game_objects, layers)
+        collided_pairs = get_brute_force_pairs(game_objects, layers)
+
+        assert get_index_pairs(sweep_and_prune.get_candidate_pairs(), game_objects) == collided_pairs
+        assert get_index_pairs(sweep_and_prune.get_entered_pairs(), game_objects) == collided_pairs - previous_pairs
+        assert get_index_pairs(sweep_and_prune.get_stayed_pairs(), game_objects) == collided_pairs & previous_pairs
+        assert get_index_pairs(sweep_and_prune.get_exited_pairs(), game_objects) == previous_pairs - collided_pairs
+
+        previous_pairs = collided_pairs
+        move_objects(random_generator, game_objects)
+
+
+def test_removed_objects_are_not_in_pairs():
+    """Objects that are not given to update_all() anymore are removed from both broad phases"""
+
+    random_generator = random.Random(2)
+    game_objects, layers = create_objects(random_generator, 100)
+    broad_phases = [CollisionsEngine.create_broad_phase("spatial_hash", cell_size=50, pair_matrix=PAIR_MATRIX),
+                    CollisionsEngine.create_broad_phase("sweep_and_prune", pair_matrix=PAIR_MATRIX)]
+
+    for broad_phase in broad_phases:
+        broad_phase.update_all(game_objects, layers)
+        broad_phase.update_all(game_objects[:50], layers[:50])
+
+        remaining_object_ids = {id(game_object) for game_object in game_objects[:50]}
+        paired_object_ids = {id(game_object) for pair in broad_phase.get_candidate_pairs() for game_object in pair}
+        assert paired_object_ids <= remaining_object_ids
@@ -0,0 +1,76 @@
+"""Tests the contacts and collision callbacks of the ContactManager"""
+
+from game_qu.base.contact_manager import ContactManager
+from game_qu.base.history_keeper import HistoryKeeper
+from game_qu.base.velocity_calculator import VelocityCalculator
+from game_qu.base.world import World
+from game_qu.gui_components.dimensions import Dimensions
+
+
+class CallbackRecorder(Dimensions):
+    """Dimensions that record the collision callbacks they get"""
+
+    def __init__(self, name, left_edge, top_edge, length, height):
+        super().__init__(left_edge, top_edge, length, height)
+        self.name = name
+        self.callbacks = []
+
+    def on_collision_enter(self, other_object):
+        self.callbacks.append(["enter", other_object.name])
+
+    def on_collision_stay(self, other_object):
+        self.callbacks.append(["stay", other_object.name])
+
+    def on_collision_exit(self, other_object):
+        self.callbacks.append(["exit", other_object.name])
+
+
+def end_cycle(game_objects):
+    """Adds the objects to the HistoryKeeper and ends the cycle (like the game loop does)"""
+
+    for game_object in game_objects:
+        HistoryKeeper.add(game_object, game_object.name, needs_dimensions_only=True)
+
+    HistoryKeeper.set_last_frame_id(VelocityCalculator.current_cycle_number)
+    VelocityCalculator.current_cycle_number += 1
+
+
+def test_collision_callbacks():
+    """The callbacks are called when the pair starts touching, keeps touching, and stops touching"""
+
+    player, platform = CallbackRecorder("player", 0, 0, 10, 10), CallbackRecorder("platform", 0, 10, 100, 10)
+    contact_manager = ContactManager()
+
+    contact_manager.update([[player, platform]])
+    contact_manager.update([[platform, player]])
+    contact_manager.update([])
+
+    assert player.callbacks == [["enter", "platform"], ["stay", "platform"], ["exit", "platform"]]
+    assert platform.callbacks == [["enter", "player"], ["stay", "player"], ["exit", "player"]]
+    assert not contact_manager.is_touching(player, platform)
+
+
+def test_resting_contact_reuses_collision_data():
+    """A contact whose objects did not move reuses its CollisionData, and one whose objects moved figures it out again"""
+
+    with World(0):
+        player, platform = CallbackRecorder("player", 0, 0, 10, 10), CallbackRecorder("platform", 0, 10, 100, 10)
+        contact_manager = ContactManager()
+
+        end_cycle([player, platform])
+        contact_manager.update([[player, platform]])
+        first_collision_data = contact_manager.get_collision_data(player, platform)
+
+        end_cycle([player, platform])
+        contact_manager.update([[player, platform]])
+        resting_collision_data = contact_manager.get_collision_data(player, platform)
+
+        end_cycle([player, platform])
+        player.left_edge += 5
+        contact_manager.update([[player, platform]])
+        moved_collision_data = contact_manager.get_collision_data(player, platform)
+
+    assert first_collision_data.is_top_collision
+    assert resting_collision_data is first_collision_data
+    assert moved_collision_data is not first_collision_data
+    assert moved_collision_data.is_top_collision
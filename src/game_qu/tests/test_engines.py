@@ -0,0 +1,77 @@
+"""Tests the swept collisions of the CollisionsEngine (continuous collision detection)"""
+
+from game_qu.base.engines import CollisionsEngine
+from game_qu.gui_components.dimensions import Dimensions
+
+
+def test_fast_object_hits_what_it_went_through():
+    """An object that went all the way through another object within one cycle hits its near edge"""
+
+    platform = Dimensions(100, 0, 10, 100)
+    time_of_impact, face = CollisionsEngine.get_time_of_impact(Dimensions(0, 40, 20, 20), Dimensions(200, 40, 20, 20),
+                                                               platform, platform)
+
+    # The right edge goes from 20 to 220 and reaches the platform's left edge (100) 40% of the way through
+    assert abs(time_of_impact - 0.4) < 1e-9
+    assert face == "left"
+
+
+def test_faces_that_are_hit():
+    """The face is the edge of the second object that the first object hit"""
+
+    platform = Dimensions(100, 100, 100, 100)
+    movements = {"left": [[0, 120], [150, 120]], "right": [[250, 120], [50, 120]],
+                 "top": [[120, 0], [120, 150]], "bottom": [[120, 250], [120, 50]]}
+
+    for expected_face, [[prev_left_edge, prev_top_edge], [left_edge, top_edge]] in movements.items():
+        time_of_impact, face = CollisionsEngine.get_time_of_impact(Dimensions(prev_left_edge, prev_top_edge, 20, 20),
+                                                                   Dimensions(left_edge, top_edge, 20, 20), platform, platform)
+        assert face == expected_face
+        assert 0 <= time_of_impact <= 1
+
+
+def test_touching_at_the_start_and_end_of_the_cycle():
+    """Touching counts as hitting: at the start of the cycle it is time 0 and at the end it is time 1"""
+
+    platform = Dimensions(100, 0, 10, 100)
+
+    assert CollisionsEngine.get_time_of_impact(Dimensions(80, 40, 20, 20), Dimensions(90, 40, 20, 20),
+                                               platform, platform) == [0, "left"]
+    assert CollisionsEngine.get_time_of_impact(Dimensions(70, 40, 20, 20), Dimensions(80, 40, 20, 20),
+                                               platform, platform) == [1, "left"]
+
+
+def test_already_overlapping_is_not_a_hit():
+    """Objects that were already overlapping at the start of the cycle did not hit each other during it"""
+
+    platform = Dimensions(100, 0, 10, 100)
+
+    assert CollisionsEngine.get_time_of_impact(Dimensions(95, 40, 20, 20), Dimensions(150, 40, 20, 20),
+                                               platform, platform) is None
+    assert CollisionsEngine.get_time_of_impact(Dimensions(95, 40, 20, 20), Dimensions(95, 40, 20, 20),
+                                               platform, platform) is None
+
+
+def test_misses():
+    """Objects that never overlap during the cycle did not hit each other"""
+
+    platform = Dimensions(100, 0, 10, 100)
+    misses = [
+        [Dimensions(0, 40, 20, 20), Dimensions(50, 40, 20, 20)],  # Stopped before the platform
+        [Dimensions(0, 200, 20, 20), Dimensions(200, 200, 20, 20)],  # Went under the platform
+        [Dimensions(200, 40, 20, 20), Dimensions(300, 40, 20, 20)],  # Moved away from the platform
+        [Dimensions(0, 40, 20, 20), Dimensions(0, 40, 20, 20)]  # Did not move
+    ]
+
+    for prev_object, game_object in misses:
+        assert CollisionsEngine.get_time_of_impact(prev_object, game_object, platform, platform) is None
+
+
+def test_both_objects_moving():
+    """The time of impact uses how the objects moved relative to each other"""
+
+    # Both move right, but the first one moves 100 more, so it closes the gap of 50 half way through the cycle
+    time_of_impact, face = CollisionsEngine.get_time_of_impact(Dimensions(0, 0, 50, 50), Dimensions(200, 0, 50, 50),
+                                                               Dimensions(100, 0, 50, 50), Dimensions(200, 0, 50, 50))
+    assert abs(time_of_impact - 0.5) < 1e-9
+    assert face == "left"
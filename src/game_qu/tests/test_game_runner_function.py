@@ -0,0 +1,37 @@
+"""Tests the game loop of run_game()"""
+
+from game_qu.base import game_runner_function
+from game_qu.base.important_variables import game_window
+from game_qu.base.library_abstraction import utility_functions
+from game_qu.base.library_changer import LibraryChanger
+from game_qu.base.velocity_calculator import VelocityCalculator
+from game_qu.base.world import World
+from game_qu.gui_components.screen import Screen
+
+
+def test_fixed_time_step_set_after_import():
+    """LibraryChanger.set_fixed_time_step() is used even though it was called after game_runner_function was imported"""
+
+    screen = Screen()
+
+    # The World keeps the cycles that are run from changing the global state
+    with World(0):
+        LibraryChanger.set_fixed_time_step(1 / 120)
+        utility_functions.set_fixed_cycle_time(1 / 60)
+        utility_functions.set_max_cycles(10)
+
+        try:
+            start_cycle_number = VelocityCalculator.current_cycle_number
+            game_runner_function.run_game(screen)
+            number_of_cycles_run = VelocityCalculator.current_cycle_number - start_cycle_number
+            delta_time = VelocityCalculator.delta_time
+
+        finally:
+            LibraryChanger.set_fixed_time_step(None)
+            utility_functions.set_fixed_cycle_time(None)
+            utility_functions.set_max_cycles(None)
+            game_window.remove_screen(screen)
+
+    # Every frame lasts two fixed time steps
+    assert number_of_cycles_run == 20
+    assert delta_time == 1 / 120
@@ -0,0 +1,118 @@
+"""Tests what the HistoryKeeper gives back for the objects added to it"""
+
+from game_qu.base.history_keeper import HistoryKeeper
+from game_qu.base.velocity_calculator import VelocityCalculator
+from game_qu.base.world import World
+from game_qu.gui_components.dimensions import Dimensions
+
+
+def add_and_end_cycle(history_keeper_object, name, **arguments):
+    """Adds the object to the HistoryKeeper and ends the cycle, so the object is what HistoryKeeper.get_last() gives"""
+
+    HistoryKeeper.add(history_keeper_object, name, **arguments)
+    HistoryKeeper.set_last_frame_id(VelocityCalculator.current_cycle_number)
+    VelocityCalculator.current_cycle_number += 1
+
+
+def test_last_edges_match_last_object():
+    """get_last_edges() gives the same edges as get_last() for objects that are stored both ways"""
+
+    with World(0):
+        dimensions_only = Dimensions(10, 20, 30, 40)
+        copied_dimensions = Dimensions(1.5, 2.5, 3.5, 4.5)
+        HistoryKeeper.add(dimensions_only, "dimensions_only", needs_dimensions_only=True)
+        add_and_end_cycle(copied_dimensions, "copied_dimensions", needs_deepcopy=True)
+
+        for name in ["dimensions_only", "copied_dimensions"]:
+            last_object = HistoryKeeper.get_last(name)
+            expected_edges = (last_object.left_edge, last_object.top_edge, last_object.right_edge, last_object.bottom_edge)
+            assert HistoryKeeper.get_last_edges(name) == expected_edges
+
+        assert HistoryKeeper.get_last_edges("dimensions_only") == (10, 20, 40, 60)
+
+
+def test_last_edges_of_object_not_stored():
+    """get_last_edges() is None for names that were never added or were not added last cycle"""
+
+    with World(0):
+        add_and_end_cycle(Dimensions(0, 0, 1, 1), "dimensions", needs_dimensions_only=True)
+        assert HistoryKeeper.get_last_edges("dimensions") is not None
+
+        HistoryKeeper.set_last_frame_id(VelocityCalculator.current_cycle_number)
+        VelocityCalculator.current_cycle_number += 1
+
+        assert HistoryKeeper.get_last_edges("dimensions") is None
+        assert HistoryKeeper.get_last_edges("never_added") is None
+
+
+class AmbiguousValue:
+    """A value whose comparison is not one bool (like a NumPy array)"""
+
+    def __eq__(self, other):
+        return self
+
+    def __bool__(self):
+        raise ValueError("The truth value of an AmbiguousValue is ambiguous")
+
+
+def test_tracked_attributes_are_recorded_copy_on_write():
+    """Objects with 'history_tracked_attributes' are recorded as HistoryViews that are reused until a value changes"""
+
+    from game_qu.platformer.platform import Platform
+
+    with World(0):
+        platform = Platform(10, 20, 30, 40)
+        add_and_end_cycle(platform, "platform", needs_deepcopy=True)
+        first_view = HistoryKeeper.get_last("platform")
+
+        add_and_end_cycle(platform, "platform", needs_deepcopy=True)
+        unchanged_view = HistoryKeeper.get_last("platform")
+
+        platform.left_edge = 50
+        add_and_end_cycle(platform, "platform", needs_deepcopy=True)
+        changed_view = HistoryKeeper.get_last("platform")
+
+    assert unchanged_view is first_view
+    assert first_view.right_edge == 40
+    assert changed_view is not first_view
+    assert changed_view.right_edge == 80
+
+
+def test_tracked_attribute_that_can_not_be_compared():
+    """A tracked attribute whose comparison is not one bool (like a NumPy array) does not raise an error"""
+
+    from game_qu.platformer.platform import Platform
+
+    class PlatformWithArray(Platform):
+        history_tracked_attributes = Platform.history_tracked_attributes + ["values"]
+
+    with World(0):
+        platform = PlatformWithArray(0, 0, 10, 10)
+        platform.values = AmbiguousValue()
+        add_and_end_cycle(platform, "platform", needs_deepcopy=True)
+        first_view = HistoryKeeper.get_last("platform")
+
+        add_and_end_cycle(platform, "platform", needs_deepcopy=True)
+        same_value_view = HistoryKeeper.get_last("platform")
+
+        platform.values = AmbiguousValue()
+        add_and_end_cycle(platform, "platform", needs_deepcopy=True)
+        new_value_view = HistoryKeeper.get_last("platform")
+
+    assert same_value_view is first_view
+    assert new_value_view is not first_view
+
+
+def test_game_objects_declare_tracked_attributes():
+    """The Player, Enemy, and Platform are recorded with their tracked attributes instead of being deep copied"""
+
+    from game_qu.platformer.enemy import Enemy
+    from game_qu.platformer.platform import Platform
+    from game_qu.platformer.player import Player
+
+    for game_object_class in [Player, Enemy, Platform]:
+        tracked_attributes = game_object_class.history_tracked_attributes
+
+        assert tracked_attributes is not None
+        assert all(hasattr(game_object_class, attribute_name) or attribute_name in ["left_edge", "top_edge"]
+                   for attribute_name in tracked_attributes)
@@ -0,0 +1,73 @@
+"""Tests the identifiers the IDCreator hands out"""
+
+import pytest
+
+from game_qu.base.id_creator import IDCreator
+
+
+def test_identifiers_are_unique():
+    """Without recycling, released identifiers are never handed out again"""
+
+    id_creator = IDCreator()
+    unique_ids = [id_creator.get_unique_id() for x in range(100)]
+    id_creator.release_unique_id(unique_ids[0])
+
+    assert len(set(unique_ids)) == 100
+    assert id_creator.get_unique_id() not in unique_ids
+
+
+def test_released_identifiers_are_recycled():
+    """With recycling, released identifiers are handed out again before new ones"""
+
+    id_creator = IDCreator(is_recycling_ids=True)
+    first_id, second_id, third_id = [id_creator.get_unique_id() for x in range(3)]
+
+    id_creator.release_unique_id(second_id)
+
+    assert id_creator.get_unique_id() == second_id
+    assert id_creator.get_unique_id() == third_id + 1
+
+
+def test_generations():
+    """Releasing an identifier increases its generation, so an old reference to it can be caught"""
+
+    id_creator = IDCreator(is_recycling_ids=True)
+    unique_id = id_creator.get_unique_id()
+    generation = id_creator.get_generation(unique_id)
+
+    id_creator.release_unique_id(unique_id)
+    recycled_id = id_creator.get_unique_id()
+
+    assert recycled_id == unique_id
+    assert generation == 0
+    assert id_creator.get_generation(recycled_id) == 1
+    assert not id_creator.is_current_generation(unique_id, generation)
+    assert id_creator.is_current_generation(recycled_id, 1)
+    assert id_creator.get_id_string(recycled_id) == f"#{recycled_id}.1"
+
+
+def test_releasing_twice_is_rejected():
+    """Releasing an identifier twice would make it be handed out twice, so it is rejected"""
+
+    id_creator = IDCreator(is_recycling_ids=True)
+    unique_id = id_creator.get_unique_id()
+    id_creator.release_unique_id(unique_id)
+
+    with pytest.raises(ValueError):
+        id_creator.release_unique_id(unique_id)
+
+    assert id_creator.get_unique_id() == unique_id
+    assert id_creator.get_unique_id() != unique_id
+
+
+def test_releasing_identifier_never_handed_out_is_rejected():
+    """Only the identifiers that were handed out can be released"""
+
+    id_creator = IDCreator(is_recycling_ids=True)
+    unique_id = id_creator.get_unique_id()
+
+    for invalid_id in [0, unique_id + 1, -1]:
+        with pytest.raises(ValueError):
+            id_creator.release_unique_id(invalid_id)
+
+    assert id_creator.get_unique_id() == unique_id + 1
@@ -0,0 +1,86 @@
+"""Tests that InputReplayer runs the game with exactly the input InputRecorder recorded"""
+
+import random
+
+from game_qu.base import game_runner_function
+from game_qu.base.important_variables import keyboard
+from game_qu.base.input_recorder import InputRecorder, InputReplayer
+from game_qu.base.library_abstraction import keys, utility_functions
+from game_qu.base.velocity_calculator import VelocityCalculator
+from game_qu.base.world import World
+from game_qu.gui_components.screen import Screen
+
+NUMBER_OF_CYCLES = 30
+
+
+class InputLogScreen(Screen):
+    """A screen that logs the input and the random numbers it gets every cycle"""
+
+    def __init__(self):
+        super().__init__()
+        self.input_log = []
+
+    def run(self):
+        pressed_keys = [key for key in keys.keys if keyboard.get_key_event(key).happened_this_cycle]
+        self.input_log.append([pressed_keys, keyboard.mouse_clicked_event.happened_this_cycle,
+                               utility_functions.get_mouse_position(), VelocityCalculator.delta_time, random.random()])
+
+
+def input_script(cycle_number):
+    """Presses a different key every few cycles and clicks and moves the mouse (like a person playing the game)"""
+
+    utility_functions.release_all()
+    utility_functions.press_key(keys.keys[cycle_number // 3 % len(keys.keys)])
+    utility_functions.set_mouse_is_pressed(cycle_number % 4 == 0)
+    utility_functions.set_mouse_position(cycle_number * 10, cycle_number * 5)
+
+
+def test_replay_gets_the_recorded_input(tmp_path):
+    """Replaying a recording gives the game the same keys, mouse, delta times, and random numbers every cycle"""
+
+    path_to_file = str(tmp_path / "input.gqir")
+    recorded_screen, replayed_screen = InputLogScreen(), InputLogScreen()
+
+    # The Worlds keep the cycles that are run from changing the global state
+    with World(0):
+        utility_functions.set_input_script(input_script)
+        utility_functions.set_fixed_cycle_time(1 / 60)
+        utility_functions.set_max_cycles(NUMBER_OF_CYCLES)
+
+        try:
+            InputRecorder.start_recording(path_to_file, random_seed=5)
+            game_runner_function.run_game(recorded_screen)
+
+        finally:
+            InputRecorder.stop_recording()
+            utility_functions.set_input_script(None)
+            utility_functions.set_fixed_cycle_time(None)
+            utility_functions.set_max_cycles(None)
+
+    with World(1):
+        number_of_cycles = InputReplayer.replay(path_to_file, replayed_screen)
+
+    assert number_of_cycles == NUMBER_OF_CYCLES
+    assert replayed_screen.input_log == recorded_screen.input_log
+    assert any(len(pressed_keys) != 0 for pressed_keys, *other_input in recorded_screen.input_log)
+
+
+def test_recording_file_contents(tmp_path):
+    """The recording stores the cycle it started at, the random seed, and one record per cycle"""
+
+    path_to_file = str(tmp_path / "input.gqir")
+
+    with World(0):
+        VelocityCalculator.current_cycle_number = 7
+        InputRecorder.start_recording(path_to_file, random_seed=3)
+
+        for x in range(4):
+            keyboard.run()
+            InputRecorder.record_cycle()
+
+        InputRecorder.stop_recording()
+
+    start_cycle_number, random_seed, cycle_records = InputReplayer.read_recording(path_to_file)
+
+    assert [start_cycle_number, random_seed, len(cycle_records)] == [7, 3, 4]
+    assert not InputRecorder.is_recording()
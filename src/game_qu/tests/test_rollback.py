@@ -0,0 +1,93 @@
+"""Tests that Rollback puts a World back to an earlier cycle and running it again gives the same result"""
+
+import random
+
+from game_qu.base.rollback import Rollback
+from game_qu.base.velocity_calculator import VelocityCalculator
+from game_qu.base.world import World
+from game_qu.gui_components.component import Component
+from game_qu.gui_components.screen import Screen
+
+NUMBER_OF_FRAMES = 8
+DELTA_TIME = 1 / 60
+
+
+class RandomWalkScreen(Screen):
+    """A screen whose component moves a random amount every cycle"""
+
+    def __init__(self):
+        super().__init__()
+        self.walker = Component()
+        self.walker.number_set_dimensions(0, 0, 10, 10)
+        self.positions = []
+        self.components = [self.walker]
+
+    def run(self):
+        self.walker.left_edge += random.uniform(0, 10)
+        self.walker.top_edge += random.uniform(-5, 5)
+        self.positions.append((self.walker.left_edge, self.walker.top_edge))
+
+
+def get_state(world, screen):
+    """
+         Returns:
+            list[object]: everything about the World that running a cycle changes"""
+
+    with world:
+        return [VelocityCalculator.current_cycle_number, screen.walker.left_edge, screen.walker.top_edge,
+                list(screen.positions), random.getstate()]
+
+
+def run_saved_cycles(world, rollback, number_of_cycles):
+    """Runs 'number_of_cycles' cycles of the World, saving the state at the start of each one"""
+
+    for x in range(number_of_cycles):
+        rollback.save()
+        world.run_cycle(DELTA_TIME)
+
+
+def test_rollback_is_deterministic():
+    """Rolling back all the stored cycles and running them again ends in exactly the same state"""
+
+    world, screen = World(0), RandomWalkScreen()
+    world.add_screen(screen)
+    rollback = Rollback(world=world, number_of_frames=NUMBER_OF_FRAMES)
+
+    run_saved_cycles(world, rollback, 4)
+    first_frame = get_state(world, screen)[0]
+    run_saved_cycles(world, rollback, NUMBER_OF_FRAMES)
+    state = get_state(world, screen)
+
+    number_of_cycles = rollback.rollback(first_frame, lambda: world.run_cycle(DELTA_TIME))
+
+    assert number_of_cycles == NUMBER_OF_FRAMES
+    assert get_state(world, screen) == state
+
+
+def test_restore_puts_back_the_state():
+    """Restoring a cycle puts the World back into the state it was in at the start of that cycle"""
+
+    world, screen = World(0), RandomWalkScreen()
+    world.add_screen(screen)
+    rollback = Rollback(world=world, number_of_frames=NUMBER_OF_FRAMES)
+
+    run_saved_cycles(world, rollback, 3)
+    state = get_state(world, screen)
+    run_saved_cycles(world, rollback, 5)
+
+    rollback.restore(state[0])
+    assert get_state(world, screen) == state
+
+
+def test_only_the_last_frames_are_stored():
+    """Only the last 'number_of_frames' cycles can be rolled back to"""
+
+    world, screen = World(0), RandomWalkScreen()
+    world.add_screen(screen)
+    rollback = Rollback(world=world, number_of_frames=NUMBER_OF_FRAMES)
+
+    run_saved_cycles(world, rollback, NUMBER_OF_FRAMES + 1)
+    current_cycle_number = get_state(world, screen)[0]
+
+    assert not rollback.has_frame(current_cycle_number - NUMBER_OF_FRAMES - 1)
+    assert all(rollback.has_frame(current_cycle_number - frame) for frame in range(1, NUMBER_OF_FRAMES + 1))
@@ -0,0 +1,82 @@
+"""Tests that a Window using dirty rectangles renders again what changed"""
+
+from game_qu.base.library_abstraction import variables
+from game_qu.gui_components.component import Component
+from game_qu.gui_components.screen import Screen
+from game_qu.gui_components.window import Window
+
+
+class DrawingScreen(Screen):
+    """A screen that draws something in render() without saying what it uses"""
+
+    def render(self):
+        pass
+
+
+def create_window(screen):
+    """
+         Returns:
+            Window: a window that is using dirty rectangles, only has 'screen', and has rendered it once"""
+
+    window = Window(500, 400, (0, 0, 0), "Test")
+    window.screens = [screen]
+    window.set_is_using_dirty_rectangles(True)
+    window.render_dirty_rectangles()
+    return window
+
+
+def create_screen(screen_class):
+    """
+         Returns:
+            Screen: a screen of the class 'screen_class' with one component in it"""
+
+    screen = screen_class()
+    component = Component()
+    component.number_set_dimensions(10, 10, 20, 20)
+    screen.components = [component]
+    return screen
+
+
+def test_unchanged_screen_updates_nothing():
+    """Nothing is updated if neither the screen nor its components changed"""
+
+    window = create_window(create_screen(Screen))
+    window.render_dirty_rectangles()
+
+    assert variables.rectangles_to_update == []
+
+
+def test_screen_marked_dirty_renders_everything():
+    """Calling mark_dirty() on a screen renders the whole window once"""
+
+    screen = create_screen(Screen)
+    window = create_window(screen)
+
+    screen.mark_dirty()
+    window.render_dirty_rectangles()
+    assert variables.rectangles_to_update == [[0, 0, 500, 400]]
+
+    window.render_dirty_rectangles()
+    assert variables.rectangles_to_update == []
+
+
+def test_screen_background_change_renders_everything():
+    """Changing the background of a screen renders the whole window"""
+
+    screen = create_screen(Screen)
+    window = create_window(screen)
+
+    screen.background_color = (255, 0, 0)
+    window.render_dirty_rectangles()
+
+    assert variables.rectangles_to_update == [[0, 0, 500, 400]]
+
+
+def test_screen_drawing_in_render_renders_everything():
+    """A screen that draws in render() without a render state is rendered every frame"""
+
+    window = create_window(create_screen(DrawingScreen))
+
+    for frame in range(2):
+        window.render_dirty_rectangles()
+        assert variables.rectangles_to_update == [[0, 0, 500, 400]]
@@ -0,0 +1,59 @@
+"""Tests that Worlds keep their state separate from the global state"""
+
+import os
+import subprocess
+import sys
+
+SOURCE_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def run_in_new_process(code):
+    """
+         Returns:
+            str: what 'code' printed; it is run in a new Python process, so the keyboard and game window have not been
+            created yet"""
+
+    environment = dict(os.environ, PYTHONPATH=SOURCE_PATH)
+    completed_process = subprocess.run([sys.executable, "-c", code], env=environment, capture_output=True, text=True)
+    assert completed_process.returncode == 0, completed_process.stderr
+    return completed_process.stdout.strip()
+
+
+def test_keyboard_first_used_inside_world():
+    """The keyboard being created within a World does not add events to the World or leave the global keyboard empty"""
+
+    output = run_in_new_process("""
+from game_qu.base.library_changer import LibraryChanger
+LibraryChanger.set_game_library("null")
+
+from game_qu.base.important_variables import keyboard
+from game_qu.base.keyboard import Keyboard
+from game_qu.base.library_abstraction import keys
+from game_qu.base.world import World
+
+world = World(0)
+
+with world:
+    keyboard.run()
+    world_number_of_key_events = len(Keyboard.key_events)
+
+keyboard.run()
+print(len(keys.keys), world_number_of_key_events, len(Keyboard.key_events))
+""")
+
+    number_of_keys, world_number_of_key_events, global_number_of_key_events = output.split()
+    assert world_number_of_key_events == number_of_keys
+    assert global_number_of_key_events == number_of_keys
+
+
+def test_creating_keyboard_again_does_not_add_events():
+    """Creating another Keyboard replaces the key events instead of adding onto them"""
+
+    from game_qu.base.keyboard import Keyboard
+    from game_qu.base.library_abstraction import keys
+
+    Keyboard()
+    Keyboard()
+
+    assert len(Keyboard.key_events) == len(keys.keys)
+    assert len(Keyboard.key_timed_events) == len(keys.keys)